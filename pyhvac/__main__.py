@@ -2,23 +2,30 @@
 
 import argparse
 import base64
-import importlib
 import sys
-from pathlib import Path
 
+from . import registry
+from .plugins.hvaclib import apply_state
 
-def main():
 
-    # Let's get the plugins
-    dir_path = Path(__file__).parent / "plugins"
-    plugs = {}
-    for filename in dir_path.iterdir():
-        if filename.name == "hvaclib.py":
-            continue
-        if filename.suffix == ".py" and not filename.stem.startswith("__"):
-            mod = importlib.import_module(".plugins." + filename.stem, package="pyhvac")
-            thisplug = mod.PluginObject()
-            plugs[thisplug.brand] = thisplug
+def print_code(opts, code):
+    """Print code, frames, LIRC timing or Broadlink bytes, as requested in opts."""
+    if opts.lirc:
+        lircf = list(code)
+        while lircf:
+            print("\t".join(["%d" % x for x in lircf[:6]]))
+            lircf = lircf[6:]
+    elif opts.broadlink or opts.base64:
+        if opts.base64:
+            print("{}".format(str(base64.b64encode(code), "ascii")))
+        else:
+            print("{}".format(code.hex()))
+    else:
+        for f in code:
+            print(" ".join([hex(x) for x in f]))
+
+
+def main():
 
     parser = argparse.ArgumentParser(description="Decode LIRC IR code into frames.")
     # version="%prog " + __version__ + "/" + bl.__version__)
@@ -34,7 +41,7 @@ def main():
         "--model",
         type=str,
         default="generic",
-        help="Set the A/C model. (default generic).",
+        help="Set the A/C model, case insensitive. The brand is guessed if not given. (default generic).",
     )
     parser.add_argument(
         "-L",
@@ -105,55 +112,137 @@ def main():
         help="Output Broadlink timing in base64 encoded",
     )
 
+    parser.add_argument(
+        "--batch",
+        nargs="?",
+        const="-",
+        default=None,
+        metavar="FILE",
+        help="Read JSON requests, one per line, from FILE (default stdin) and write the results to stdout.",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        default=False,
+        help="Run as a server, answering code requests on a Unix socket.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="With --serve, record the timing of each stage. Dump it with the 'profile' command.",
+    )
+    parser.add_argument(
+        "-C",
+        "--client",
+        action="store_true",
+        default=False,
+        help="Request the code from a running gaccode server.",
+    )
+    parser.add_argument(
+        "-S",
+        "--socket",
+        type=str,
+        default=None,
+        help="Unix socket of the gaccode server. (default $XDG_RUNTIME_DIR/gaccode-<uid>.sock).",
+    )
+
     try:
         opts = parser.parse_args()
     except Exception as e:
         parser.error("Error: " + str(e))
 
     if opts.list:
-        lofm = {}
-        for m in plugs:
-            lofm[m] = [x for x in plugs[m].MODELS.keys()]
         print("Available Brand/models are:")
-        for b, l in sorted(lofm.items()):
+        for b in registry.brands():
             if opts.manufacturer is None or opts.manufacturer == b:
                 allspaces = len(b) + 2
                 addme = " "
                 print(f"{b}:", end="")
-                for m in l:
+                for m in registry.models(b):
                     print(f"{addme}{m}")
                     addme = " " * allspaces
         sys.exit(0)
 
-    if opts.manufacturer in plugs:
-        device = plugs[opts.manufacturer].get_device(opts.model)
-    else:
-        print(f"Error: Manufacturer {opts.manufacturer} is not supported.")
+    if opts.batch:
+        from . import server
+
+        if opts.batch == "-":
+            server.batch(sys.stdin, sys.stdout)
+        else:
+            with open(opts.batch, encoding="utf-8") as f:
+                server.batch(f, sys.stdout)
+        sys.exit(0)
+
+    if opts.serve:
+        from . import server
+
+        try:
+            server.serve(opts.socket or server.DEFAULT_SOCKET, profile=opts.profile)
+        except (server.ServerError, OSError) as e:
+            print(f"Error: {e}")
+            sys.exit(2)
+        sys.exit(0)
+
+    state = {
+        "temperature": opts.temp,
+        "fan": opts.fan,
+        "swing": opts.swing,
+        "powerfull": (opts.powerfull and "on") or "off",
+        "purifier": (opts.filter and "on") or "off",
+        "cleaning": (opts.clean and "on") or "off",
+        "economy": opts.economy,
+        "mode": opts.mode,
+    }
+
+    if opts.client:
+        from . import server
+
+        output = "frames"
+        if opts.lirc:
+            output = "lirc"
+        elif opts.broadlink or opts.base64:
+            output = "broadlink"
+        try:
+            with server.CodeClient(opts.socket or server.DEFAULT_SOCKET) as client:
+                result = client.code(opts.manufacturer, opts.model, state, output)
+        except server.ServerError as e:
+            print(f"Error: {e}")
+            sys.exit(2)
+        except OSError as e:
+            print(f"Error: Cannot reach the gaccode server: {e}")
+            sys.exit(2)
+        if output == "broadlink":
+            result = bytes.fromhex(result)
+        elif output == "frames":
+            result = [bytes.fromhex(f) for f in result]
+        print_code(opts, result)
+        sys.exit(0)
+
+    # Case insensitive lookup, guessing the brand if needed
+    opts.manufacturer, opts.model = registry.find_model(opts.model, opts.manufacturer)
+    if opts.manufacturer is None and not registry.model_index().lookup(opts.model):
+        print(f"Error: Model {opts.model} is not known.")
+        suggestions = registry.model_index().suggest(opts.model)
+        if suggestions:
+            print("Did you mean:")
+            for b, m in suggestions:
+                print(f"    -c '{b}' -M '{m}'")
         sys.exit(2)
 
-    frames = []
-    device.set_value("temperature", opts.temp)
-    device.set_value("fan", opts.fan)
-    device.set_value("swing", opts.swing)
-    device.set_value("powerfull", (opts.powerfull and "on") or "off")
-    device.set_value("purifier", (opts.filter and "on") or "off")
-    device.set_value("cleaning", (opts.clean and "on") or "off")
-    device.set_value("economy", opts.economy)
-    device.set_mode(opts.mode)
+    try:
+        plugin = registry.get_plugin(opts.manufacturer)
+    except KeyError:
+        print(f"Error: Manufacturer {opts.manufacturer} is not supported.")
+        sys.exit(2)
+    device = plugin.get_device(opts.model)
 
+    apply_state(device, state)
     frames = device.build_ircode()
 
     if opts.lirc:
-        lircf = device.to_lirc(frames)
-        while lircf:
-            print("\t".join(["%d" % x for x in lircf[:6]]))
-            lircf = lircf[6:]
+        print_code(opts, device.to_lirc(frames))
     elif opts.broadlink or opts.base64:
-        bframe = device.to_broadlink(frames)
-        if opts.base64:
-            print("{}".format(str(base64.b64encode(bframe), "ascii")))
-        else:
-            print("{}".format(bframe.hex()))
+        print_code(opts, device.to_broadlink(frames))
     else:
-        for f in frames:
-            print(" ".join([hex(x) for x in f]))
+        print_code(opts, frames)
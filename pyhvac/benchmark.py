@@ -0,0 +1,277 @@
+#! /usr/bin/env python3
+# -*- coding:utf-8 -*-
+#
+# Benchmarks
+#
+# Times the code generation stages of every model class: device construction,
+# state setting, build_ircode, LIRC and Broadlink conversion. Results can be
+# saved as a JSON baseline and compared against it.
+#
+#     python3 -m pyhvac.benchmark --save baseline.json
+#     python3 -m pyhvac.benchmark --compare baseline.json --threshold 0.1
+#
+# Copyright (c) 2023 François Wautier
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies
+# or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR
+# IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE
+##
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+
+from . import __version__, registry
+from .plugins.hvaclib import apply_state
+
+STAGES = ("construct", "state", "build", "lirc", "broadlink")
+
+
+def model_classes(brands=None):
+    """Return a dict, sorted by name, of the HVAC classes of the plugins for brands
+    (all when None). Classes are named "<plugin>.<class>"."""
+    classes = {}
+    for brand in brands or registry.brands():
+        for cls in registry.get_plugin(brand).MODELS.values():
+            classes[cls.__module__.rsplit(".", 1)[-1] + "." + cls.__name__] = cls
+    return dict(sorted(classes.items()))
+
+
+def bench_state(cls):
+    """Return a state exercising cls: "cool", or another mode than "off", a mid
+    range temperature and, for fan and swing, their second value."""
+    state = {}
+    for name, values in cls.capabilities.items():
+        values = list(values)
+        if name == "temperature":
+            state[name] = values[len(values) // 2]
+        elif name == "mode":
+            state[name] = (
+                "cool"
+                if "cool" in values
+                else ([x for x in values if x != "off"] or values)[0]
+            )
+        elif name in ("fan", "swing") and values:
+            state[name] = values[min(1, len(values) - 1)]
+    return state
+
+
+def allocated(func, calls=10):
+    """Return the average peak memory, in bytes, allocated by a call of func."""
+    func()
+    total = 0
+    tracemalloc.start()
+    try:
+        for _ in range(calls):
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            func()
+            total += tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+    return total // calls
+
+
+def bench_class(cls, number=200, repeat=3, allocations=True):
+    """Time each stage for cls. Return a dict of stage to {"ops": ops/sec,
+    "alloc": bytes}, with an "error" entry if a stage failed."""
+    state = bench_state(cls)
+    device = cls()
+    apply_state(device, state)
+    devices = [cls() for _ in range(number)]
+
+    def set_state():
+        for d in devices:
+            apply_state(d, state)
+
+    # Each timed build starts from the same pending changes
+    status, pending = dict(device.status), dict(device.to_set)
+
+    def build():
+        device.status, device.to_set = dict(status), dict(pending)
+        return device.build_ircode()
+
+    stages = {
+        "construct": (cls, number),
+        "state": (set_state, 1),
+        "build": (build, number),
+        "lirc": (None, number),
+        "broadlink": (None, number),
+    }
+    result = {}
+    for stage in STAGES:
+        func, loops = stages[stage]
+        try:
+            if stage == "lirc":
+                func = lambda: device.to_lirc(frames)
+            elif stage == "broadlink":
+                func = lambda: device.to_broadlink(frames)
+            best = min(timeit.Timer(func).repeat(repeat, loops))
+            result[stage] = {"ops": number / best if best else float("inf")}
+            if allocations:
+                if stage == "state":
+                    func = lambda: apply_state(devices[0], state)
+                result[stage]["alloc"] = allocated(func)
+            if stage == "build":
+                frames = build()
+        except Exception as e:
+            result["error"] = f"{stage}: {type(e).__name__}: {e}"
+            break
+    return result
+
+
+def run(classes, number=200, repeat=3, allocations=True, out=None):
+    """Benchmark classes, a dict as returned by model_classes, and return the
+    results. Progress is printed to out if not None."""
+    results = {}
+    for name, cls in classes.items():
+        results[name] = bench_class(cls, number, repeat, allocations)
+        if out is not None:
+            print_result(name, results[name], out)
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "number": number,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def print_result(name, result, out=sys.stdout):
+    for stage in STAGES:
+        if stage in result:
+            alloc = result[stage].get("alloc")
+            alloc = "" if alloc is None else f"{alloc:>10} B"
+            print(
+                f"{name:<32} {stage:<10} {result[stage]['ops']:>12.0f} ops/s{alloc}",
+                file=out,
+            )
+    if "error" in result:
+        print(f"{name:<32} error      {result['error']}", file=out)
+
+
+def compare(baseline, current, threshold=0.1):
+    """Compare current with baseline results. Return a list of (name, stage,
+    what, old, new) for the stages where ops/sec dropped, or allocations grew,
+    by more than threshold."""
+    regressions = []
+    for name, result in current["results"].items():
+        old = baseline["results"].get(name, {})
+        for stage in STAGES:
+            if stage not in result or stage not in old:
+                continue
+            if result[stage]["ops"] < old[stage]["ops"] * (1 - threshold):
+                regressions.append(
+                    (name, stage, "ops", old[stage]["ops"], result[stage]["ops"])
+                )
+            if (
+                "alloc" in result[stage]
+                and "alloc" in old[stage]
+                and result[stage]["alloc"] > old[stage]["alloc"] * (1 + threshold)
+            ):
+                regressions.append(
+                    (name, stage, "alloc", old[stage]["alloc"], result[stage]["alloc"])
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark code generation for every model class."
+    )
+    parser.add_argument(
+        "-c",
+        "--manufacturer",
+        type=str.lower,
+        action="append",
+        default=None,
+        help="Only benchmark this brand. Can be repeated.",
+    )
+    parser.add_argument(
+        "-k",
+        "--match",
+        type=str,
+        default=None,
+        help="Only benchmark the classes whose name contains this string.",
+    )
+    parser.add_argument(
+        "-n",
+        "--number",
+        type=int,
+        default=200,
+        help="Calls per timing. (default 200).",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=3,
+        help="Timings per stage, the best is kept. (default 3).",
+    )
+    parser.add_argument(
+        "--no-alloc",
+        action="store_true",
+        default=False,
+        help="Do not measure allocations.",
+    )
+    parser.add_argument(
+        "-s", "--save", type=str, default=None, help="Save the results to this file."
+    )
+    parser.add_argument(
+        "--compare",
+        type=str,
+        default=None,
+        help="Compare the results with this baseline file.",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative change flagged as a regression. (default 0.1).",
+    )
+    opts = parser.parse_args()
+
+    try:
+        classes = model_classes(opts.manufacturer)
+    except KeyError as e:
+        print(f"Error: Manufacturer {e.args[0]} is not supported.")
+        sys.exit(2)
+    if opts.match:
+        classes = {k: v for k, v in classes.items() if opts.match.lower() in k.lower()}
+    results = run(classes, opts.number, opts.repeat, not opts.no_alloc, out=sys.stdout)
+
+    if opts.save:
+        with open(opts.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+            f.write("\n")
+
+    if opts.compare:
+        with open(opts.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, results, opts.threshold)
+        for name, stage, what, old, new in regressions:
+            print(f"Regression: {name} {stage} {what} {old:.0f} -> {new:.0f}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regression beyond {opts.threshold:.0%}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,526 @@
+#! /usr/bin/env python3
+# -*- coding:utf-8 -*-
+#
+# Code books
+#
+# A code book holds the codes of every state of a model class, as set on a new
+# device. It is generated once and looked up, through mmap, without running the
+# encoder.
+#
+#     python3 -m pyhvac.codebook -c daikin -M smash2 -o smash2.pcb
+#
+# Copyright (c) 2023 François Wautier
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies
+# or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR
+# IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE
+##
+#
+# File layout, little endian:
+#
+#     magic      b"PHCB"
+#     u32        length of the header
+#     header     JSON: class, brand, model, kind ("bytes" frames or "pulses"),
+#                keys [[name, [values...]], ...], defaults, status of a new
+#                device, count and block, the number of states per block
+#     padding    to a multiple of 8
+#     index      one u64 offset per block, and the end of the data, offsets
+#                from the data
+#     data       blocks, zlib compressed: block + 1 u32 offsets of the entries
+#                in the block, and the entries
+#
+# State i is in block i // block and has index i in the mixed radix numbering
+# of the key values, the first key being the most significant. A null value
+# stands for the key not being set. An entry is the u16 number of frames and
+# the frames: "bytes" frames are a u16 length and the bytes, "pulses" a u32
+# count, with the high bit set when they are u32, and the u16 or u32 pulses.
+# An empty entry marks a state whose code could not be generated.
+#
+# Code books of the IRGHVAC classes are generated when building the pure wheel,
+# and shipped in its codebooks directory. They are used when the irhvac
+# extension is missing.
+
+import argparse
+import contextlib
+import importlib
+import io
+import itertools
+import json
+import mmap
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from math import prod
+from pathlib import Path
+
+from . import registry
+from .plugins.hvaclib import (
+    IRGHVAC,
+    NUMPY_MIN_FRAMES,
+    StateGrid,
+    apply_state,
+    irac_pool,
+    numpy_module,
+)
+
+MAGIC = b"PHCB"
+MAX_STATES = 1 << 22
+# States per compressed block, and decompressed blocks kept per code book
+BLOCK = 64
+CACHED_BLOCKS = 8
+# Temperatures are enumerated by half a degree, at least: set_temperature does
+# not round them to temperature_step
+TEMPERATURE_STEP = 0.5
+# Where the code books of the IRGHVAC classes are shipped
+CODEBOOKDIR = Path(__file__).parent / "codebooks"
+
+_codebooks = {}
+
+
+def temperatures(cls, step=None):
+    """Return the temperatures of cls, by step (temperature_step if None), over
+    its range."""
+    step = cls.temperature_step if step is None else step
+    low, high = cls.capabilities["temperature"][0], cls.capabilities["temperature"][-1]
+    steps = int(round((high - low) / step))
+    values = [low + i * step for i in range(steps + 1)]
+    return [int(x) if x == int(x) else x for x in values]
+
+
+def status_values(cls):
+    """Return, for each status key, the list of the values the setters of cls
+    produce on a new device.
+
+    Each capability is set, on a new device, to each of its values, the
+    temperatures by TEMPERATURE_STEP at least, and to an unknown value: the
+    values left in to_set, e.g. the mode set_mode falls back to, and those of
+    the status of a new device are returned."""
+    unknown = object()
+    found = {k: [v] for k, v in cls().status.items()}
+    # IRGHVAC devices print the values they cannot set
+    with contextlib.redirect_stdout(io.StringIO()):
+        for key, choices in cls.capabilities.items():
+            if key == "temperature":
+                choices = temperatures(cls, min(cls.temperature_step, TEMPERATURE_STEP))
+            for choice in [*choices, unknown]:
+                device = cls()
+                device.set_value(key, choice)
+                for k, v in device.to_set.items():
+                    if v is not unknown and v not in found.setdefault(k, []):
+                        found[k].append(v)
+    return found
+
+
+def state_space(cls, keys=None):
+    """Return a list of (name, values) of the states of cls, for keys (all if
+    None) only. mode comes first.
+
+    The codes of IRGHVAC classes are looked up by status: the values of
+    status_values are enumerated. Those of other classes are looked up by the
+    state set on a new device: their capability values are enumerated."""
+    if issubclass(cls, IRGHVAC):
+        found = status_values(cls)
+    else:
+        found = {
+            k: temperatures(cls) if k == "temperature" else list(v)
+            for k, v in cls.capabilities.items()
+        }
+    if keys is None:
+        keys = list(found)
+    space = []
+    for k in sorted(keys, key=lambda x: x != "mode"):
+        if k not in found:
+            raise KeyError(f"{cls.__name__} has no {k} state.")
+        space.append((k, found[k]))
+    return space
+
+
+def unset_values(cls):
+    """Return, for an IRGHVAC class, the capability values setting the IRac
+    fields as when they are not set. A missing key is looked up with them."""
+    if not issubclass(cls, IRGHVAC):
+        return {}
+    plan = cls.setter_plan()
+    with irac_pool.engine() as irac:
+        fields = {x: getattr(irac.next, x) for x in irac_pool.FIELDS}
+    values = {}
+    for key, choices in cls.capabilities.items():
+        if key not in plan:
+            continue
+        field, trans = plan[key]
+        for value in choices:
+            try:
+                if (value if trans is None else trans(value)) == fields[field]:
+                    values[key] = value
+                    break
+            except Exception:
+                pass
+    return values
+
+
+def encode_frames(frames, kind):
+    """Return the code book entry for frames."""
+    data = [struct.pack("<H", len(frames))]
+    for frame in frames:
+        if kind == "pulses":
+            wide = max(frame, default=0) > 0xFFFF
+            data.append(struct.pack("<I", len(frame) | wide << 31))
+            frame = array("I" if wide else "H", frame)
+            if sys.byteorder != "little":
+                frame.byteswap()
+            data.append(frame.tobytes())
+        else:
+            data.append(struct.pack("<H", len(frame)) + bytes(frame))
+    return b"".join(data)
+
+
+def decode_frames(buf, kind):
+    """Return the frames of the code book entry buf."""
+    (count,) = struct.unpack_from("<H", buf)
+    frames = []
+    pos = 2
+    for _ in range(count):
+        if kind == "pulses":
+            (n,) = struct.unpack_from("<I", buf, pos)
+            frame = array("I" if n >> 31 else "H")
+            n &= 0x7FFFFFFF
+            pos += 4
+            frame.frombytes(buf[pos : pos + n * frame.itemsize])
+            if sys.byteorder != "little":
+                frame.byteswap()
+            frames.append(frame.tolist())
+            pos += n * frame.itemsize
+        else:
+            (n,) = struct.unpack_from("<H", buf, pos)
+            pos += 2
+            frames.append(bytes(buf[pos : pos + n]))
+            pos += n
+    return frames
+
+
+def _generate(job):
+    """Return the entries for the states start to stop of a class."""
+    module, name, kind, space, start, stop = job
+    cls = getattr(importlib.import_module(module), name)
+    names = [k for k, _ in space]
+    states = itertools.islice(itertools.product(*[v for _, v in space]), start, stop)
+    if kind == "bytes" and cls.LAYOUT is not None and numpy_module() is not None:
+        states = list(states)
+        if len(states) >= NUMPY_MIN_FRAMES:
+            return _generate_grid(cls, names, states)
+    entries = []
+    # IRGHVAC devices print the values they cannot set
+    with contextlib.redirect_stdout(io.StringIO()):
+        for values in states:
+            try:
+                device = cls()
+                apply_state(
+                    device, {k: v for k, v in zip(names, values) if v is not None}
+                )
+                entries.append(encode_frames(device.build_ircode(), kind))
+            except Exception:
+                entries.append(b"")
+    return entries
+
+
+def _generate_grid(cls, names, states):
+    """Same as _generate, for a native class, with a StateGrid."""
+    grid = StateGrid(cls, dict(zip(names, map(list, zip(*states)))))
+    return [
+        b"" if frames is None else encode_frames(frames, "bytes")
+        for frames in grid.frames()
+    ]
+
+
+def _compress_block(entries):
+    offsets = array("I", [0])
+    for entry in entries:
+        offsets.append(offsets[-1] + len(entry))
+    # The last block is padded with empty entries
+    offsets.extend([offsets[-1]] * (BLOCK + 1 - len(offsets)))
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    return zlib.compress(offsets.tobytes() + b"".join(entries), 9)
+
+
+def build_codebook(cls, path, keys=None, jobs=None, chunksize=1024):
+    """Generate the codes of every state of cls, over keys (all if None), and
+    write them to path. jobs processes are used, as many as CPUs if None.
+    Return the number of states. Raise ValueError if there are more than
+    MAX_STATES. With NumPy, the codes of native classes are generated with a
+    StateGrid. The file only depends on the codes."""
+    space = state_space(cls, keys)
+    status = cls().status
+    unset = unset_values(cls)
+    # Values of the keys missing from a state. The mode is always set,
+    # set_mode may change more than the mode
+    defaults = {}
+    for k, values in space:
+        if k == "mode":
+            continue
+        if k in status:
+            if status[k] in values:
+                defaults[k] = status[k]
+        elif k in unset:
+            defaults[k] = unset[k]
+        else:
+            # None stands for the key not being set
+            values.append(None)
+            defaults[k] = None
+    count = prod(len(v) for _, v in space)
+    if count > MAX_STATES:
+        raise ValueError(f"{cls.__name__} has {count} states, select fewer keys.")
+    kind = "pulses" if issubclass(cls, IRGHVAC) else "bytes"
+    header = {
+        "class": f"{cls.__module__}.{cls.__name__}",
+        "brand": cls.brand,
+        "model": cls.model,
+        "kind": kind,
+        "keys": space,
+        "defaults": defaults,
+        "status": status,
+        "count": count,
+        "block": BLOCK,
+    }
+    header = json.dumps(header, sort_keys=True).encode()
+    header += b" " * (-(len(MAGIC) + 4 + len(header)) % 8)
+
+    # Chunks of whole blocks
+    chunksize = max(chunksize // BLOCK, 1) * BLOCK
+    jobs_list = [
+        (cls.__module__, cls.__name__, kind, space, i, min(i + chunksize, count))
+        for i in range(0, count, chunksize)
+    ]
+    index = array("Q", [0])
+    data = []
+    if jobs == 1:
+        results = map(_generate, jobs_list)
+    else:
+        executor = ProcessPoolExecutor(jobs)
+        results = executor.map(_generate, jobs_list)
+    try:
+        for entries in results:
+            for i in range(0, len(entries), BLOCK):
+                data.append(_compress_block(entries[i : i + BLOCK]))
+                index.append(index[-1] + len(data[-1]))
+    finally:
+        if jobs != 1:
+            executor.shutdown()
+    if sys.byteorder != "little":
+        index.byteswap()
+
+    with open(path, "wb") as f:
+        f.write(MAGIC + struct.pack("<I", len(header)) + header)
+        f.write(index.tobytes())
+        f.writelines(data)
+    return count
+
+
+def codebook_name(cls):
+    return f"{cls.__module__.rsplit('.', 1)[-1]}.{cls.__name__}.pcb"
+
+
+def build_codebooks(directory=CODEBOOKDIR, jobs=None, out=None):
+    """Write, to directory, the code books of every IRGHVAC class. Raise
+    ValueError if a class has too many states. Progress is printed to out if
+    not None."""
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    done = set()
+    for brand in registry.brands():
+        for cls in registry.get_plugin(brand).MODELS.values():
+            if not issubclass(cls, IRGHVAC) or cls in done:
+                continue
+            done.add(cls)
+            path = Path(directory) / codebook_name(cls)
+            count = build_codebook(cls, path, jobs=jobs)
+            if out is not None:
+                print(f"{count} states written to {path}", file=out)
+
+
+def find_codebook(cls):
+    """Return the CodeBook shipped for cls, None if there is none."""
+    if cls not in _codebooks:
+        path = CODEBOOKDIR / codebook_name(cls)
+        _codebooks[cls] = CodeBook(path) if path.exists() else None
+    return _codebooks[cls]
+
+
+class CodeBook(object):
+    """A code book, memory mapped. Codes are looked up by state, a dict of
+    values, with a mode. Other values missing from the state are those of a new
+    device. Values not enumerated in the book must be those of a new device.
+
+    Only the blocks of the states looked up are decompressed, the last
+    CACHED_BLOCKS of them are kept."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.mm[:4] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a code book.")
+        (length,) = struct.unpack_from("<I", self.mm, 4)
+        self.header = json.loads(self.mm[8 : 8 + length])
+        self.kind = self.header["kind"]
+        self.block = self.header["block"]
+        self.index_start = 8 + length
+        blocks = -(-self.header["count"] // self.block)
+        self.data_start = self.index_start + 8 * (blocks + 1)
+        # For each key, value -> weight of the value in the state index
+        self.weights = []
+        stride = self.header["count"]
+        for name, values in self.header["keys"]:
+            stride //= len(values)
+            self.weights.append((name, {v: i * stride for i, v in enumerate(values)}))
+        self.defaults = self.header["defaults"]
+        self.status = self.header["status"]
+        self.keys = {name for name, _ in self.weights}
+        self.name = self.header["class"].rsplit(".", 1)[-1]
+        self._blocks = OrderedDict()
+        self._lock = threading.Lock()
+        self._device = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self.header["count"]
+
+    def close(self):
+        self.mm.close()
+
+    def _read_block(self, number):
+        with self._lock:
+            block = self._blocks.get(number)
+            if block is not None:
+                self._blocks.move_to_end(number)
+                return block
+        start, stop = struct.unpack_from("<QQ", self.mm, self.index_start + 8 * number)
+        block = zlib.decompress(
+            self.mm[self.data_start + start : self.data_start + stop]
+        )
+        with self._lock:
+            self._blocks[number] = block
+            while len(self._blocks) > CACHED_BLOCKS:
+                self._blocks.popitem(last=False)
+        return block
+
+    def entry(self, state):
+        """Return the entry for state. Raise KeyError, naming the class and the
+        value, if the state is not in the book, or its code could not be
+        generated."""
+        for k, v in state.items():
+            if k not in self.keys and self.status.get(k) != v:
+                raise KeyError(f"The {self.name} code book has no {k} {v!r}.")
+        idx = 0
+        for name, weights in self.weights:
+            value = state[name] if name in state else self.defaults[name]
+            try:
+                idx += weights[value]
+            except (KeyError, TypeError):
+                raise KeyError(
+                    f"The {self.name} code book has no {name} {value!r}."
+                ) from None
+        block = self._read_block(idx // self.block)
+        start, stop = struct.unpack_from("<II", block, 4 * (idx % self.block))
+        if start == stop:
+            raise KeyError(f"The {self.name} code book has no code for {state}.")
+        offset = 4 * (self.block + 1)
+        return block[offset + start : offset + stop]
+
+    def frames(self, state):
+        """Return the frames for state, as build_ircode would."""
+        return decode_frames(self.entry(state), self.kind)
+
+    def broadlink(self, state):
+        """Return the Broadlink code for state, as to_broadlink would."""
+        frames = self.frames(state)
+        if self._device is None:
+            module, name = self.header["class"].rsplit(".", 1)
+            self._device = getattr(importlib.import_module(module), name)()
+        return self._device.to_broadlink(frames)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate the code book of a model class."
+    )
+    parser.add_argument(
+        "-c", "--manufacturer", type=str.lower, default=None, help="The A/C brand."
+    )
+    parser.add_argument("-M", "--model", type=str, default=None, help="The model.")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default=None,
+        help="The code book file.",
+    )
+    parser.add_argument(
+        "--all",
+        type=str,
+        nargs="?",
+        const=str(CODEBOOKDIR),
+        default=None,
+        metavar="DIR",
+        help="Write the code books of all the IRremoteESP8266 models to DIR. (default pyhvac/codebooks).",
+    )
+    parser.add_argument(
+        "-k",
+        "--keys",
+        type=str,
+        default=None,
+        help="Comma separated capabilities to enumerate. (default all).",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of processes. (default number of CPUs).",
+    )
+    opts = parser.parse_args()
+
+    if opts.all:
+        build_codebooks(opts.all, opts.jobs, out=sys.stdout)
+        sys.exit(0)
+    if opts.model is None or opts.output is None:
+        parser.error("A model and an output file are needed.")
+
+    brand, model = registry.find_model(opts.model, opts.manufacturer)
+    try:
+        cls = registry.get_plugin(brand).MODELS[model]
+    except KeyError:
+        print(f"Error: Model {opts.model} is not known for {opts.manufacturer}.")
+        sys.exit(2)
+    keys = opts.keys.split(",") if opts.keys else None
+    try:
+        count = build_codebook(cls, opts.output, keys, opts.jobs)
+    except (KeyError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(2)
+    print(f"{count} states written to {opts.output}")
+
+
+if __name__ == "__main__":
+    main()
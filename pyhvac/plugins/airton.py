@@ -28,25 +28,25 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Airton(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [6630, 3350]
     ENDFRAME = None
     MARK = [400]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [430, 1260]  # ditto
 
-    def __init__(self):
-        super().__init__("AIRTON")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 25],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["off", "on"],
-            "purifier": ["off", "on"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-            "economy": ["off", "on"],
-            "light": ["off", "on"],
-        }
+    protocol = "AIRTON"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 25],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["off", "on"],
+        "purifier": ["off", "on"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+        "economy": ["off", "on"],
+        "light": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
@@ -29,17 +29,18 @@ from .coolix import Coolix
 
 
 class Airwell(Manchester):
+    __slots__ = ()
+
     HALFPULSE = 950
     STARTFRAME = [3 * 950, 3 * 950]
     ENDFRAME = [5 * 950]
 
-    def __init__(self):
-        super().__init__("AIRWELL")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low", "lowest"],
-        }
+    protocol = "AIRWELL"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low", "lowest"],
+    }
 
 
 # Now the match between models and objects
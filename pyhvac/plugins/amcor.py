@@ -28,18 +28,19 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Amcor(PulseBased):
+    __slots__ = ()
+
     STARTFRAME = [8200, 4200]
     ENDFRAME = [1900, 10000]
     MARK = [600, 1500]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [1500, 600]  # ditto
 
-    def __init__(self):
-        super().__init__("AMCOR")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [12, 32],
-            "fan": ["auto", "highest", "medium", "lowest"],
-        }
+    protocol = "AMCOR"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [12, 32],
+        "fan": ["auto", "highest", "medium", "lowest"],
+    }
 
 
 # Now the match between models and objects
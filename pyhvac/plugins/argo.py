@@ -25,47 +25,48 @@
 # Description of the various ": Greev1, devices supported. Can be a remote control name
 
 from .hvaclib import PulseBased, GenPluginObject
-from ..irhvac import SAC_WREM2, SAC_WREM3
 
 
 class Argo(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [6400, 3300]
     ENDFRAME = None
     MARK = [400]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [900, 2200]  # ditto
 
-    def __init__(self):
-        super().__init__("ARGO", variant=SAC_WREM2)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 25],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["auto", "ceiling", "90°", "60°", "45°", "30°", "0°"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-        }
+    protocol = "ARGO"
+    variant = "SAC_WREM2"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 25],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["auto", "ceiling", "90°", "60°", "45°", "30°", "0°"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+    }
 
 
 class Argo2(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [6400, 3300]
     ENDFRAME = None
     MARK = [400]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [900, 2200]  # ditto
 
-    def __init__(self):
-        super().__init__("ARGO", variant=SAC_WREM3)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 25],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["auto", "ceiling", "90°", "60°", "45°", "30°", "0°"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-            "economy": ["off", "on"],
-            "purifier": ["off", "on"],
-        }
+    protocol = "ARGO"
+    variant = "SAC_WREM3"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 25],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["auto", "ceiling", "90°", "60°", "45°", "30°", "0°"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+        "economy": ["off", "on"],
+        "purifier": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
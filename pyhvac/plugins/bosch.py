@@ -29,20 +29,20 @@ from .coolix import Coolix
 
 
 class Bosch(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [4366, 4415]
     ENDFRAME = [5235, int(5235 * 1.5)]
     MARK = [502]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [571, 1645]  # ditto
 
-    def __init__(self):
-        super().__init__("BOSCH144")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 30],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "quiet": ["off", "on"],
-        }
+    protocol = "BOSCH144"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 30],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "quiet": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
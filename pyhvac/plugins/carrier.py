@@ -29,19 +29,19 @@ from .toshiba import Toshiba
 
 
 class Carrier(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [8940, 4556]
     ENDFRAME = None
     MARK = [503]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [615, 1736]  # ditto
 
-    def __init__(self):
-        super().__init__("CARRIER_AC64")
-        self.capabilities = {
-            "mode": ["off", "cool", "fan" "heat"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low"],
-        }
+    protocol = "CARRIER_AC64"
+    capabilities = {
+        "mode": ["off", "cool", "fan" "heat"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low"],
+    }
 
 
 # Now the match between models and objects
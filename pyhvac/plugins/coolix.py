@@ -28,24 +28,25 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Coolix(PulseBased):
+    __slots__ = ()
+
     STARTFRAME = [4692, 4416]
     ENDFRAME = None
     MARK = [552]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [552, 1656]  # ditto
 
-    def __init__(self):
-        super().__init__("COOLIX")
-        self.capabilities = {
-            "mode": ["off", "cool", "dry", "auto", "heat", "fan"],
-            "temperature": [17, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "hswing": ["off", "on"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-            "cleaning": ["off", "on"],
-            "light": ["off", "on"],
-        }
+    protocol = "COOLIX"
+    capabilities = {
+        "mode": ["off", "cool", "dry", "auto", "heat", "fan"],
+        "temperature": [17, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "hswing": ["off", "on"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+        "cleaning": ["off", "on"],
+        "light": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
@@ -27,20 +27,21 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Corona(PulseBased):
+    __slots__ = ()
+
     STARTFRAME = [3500, 1680]
     ENDFRAME = None
     MARK = [450]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [420, 1270]  # ditto
 
-    def __init__(self):
-        super().__init__("CORONA_AC")
-        self.capabilities = {
-            "mode": ["off", "heat", "dry", "cool", "fan"],
-            "temperature": [17, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "economy": ["off", "on"],
-        }
+    protocol = "CORONA_AC"
+    capabilities = {
+        "mode": ["off", "heat", "dry", "cool", "fan"],
+        "temperature": [17, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "economy": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
@@ -29,30 +29,83 @@
 
 import struct
 
-from .hvaclib import HVAC, PulseBased, GenPluginObject, bit_reverse
+from .hvaclib import (
+    BIT_REVERSE,
+    HVAC,
+    Checksum,
+    FrameLayout,
+    PulseBased,
+    GenPluginObject,
+    bit_reverse,
+)
 
 
 class Daikinth(HVAC):
     """Generic Daikin HVAC object. It must have, at the very minimum
     "mode" and "temperature" capabilities"""
 
+    __slots__ = ()
+
     FBODY = b"\x88\x5b\xe4\x00\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa3\x00\x10"
+    # Note that the mode must be last for it replaces values
+    LAYOUT = FrameLayout(
+        FBODY,
+        (
+            ("temperature", 6, 0xFF, lambda temp: bit_reverse(temp * 2), "or"),
+            (
+                "fan",
+                8,
+                0x0F,
+                {
+                    "auto": 0x05,
+                    "lowest": 0x0C,
+                    "low": 0x02,
+                    "medium": 0x0A,
+                    "high": 0x06,
+                    "highest": 0x0E,
+                },
+                "or",
+            ),
+            ("swing", 8, 0xF0, {"on": 0xF0}, "or"),
+            ("powerful", 13, 0x80, {True: 0x80}, "replace"),
+            (
+                "mode",
+                5,
+                0xFF,
+                {"dry": 0x84, "fan": 0x86, "heat": 0x82, "auto": 0x80, "cool": 0x8C},
+                "replace",
+            ),
+            ("mode", 6, 0xFF, {"dry": 0x03}, "replace"),
+            ("mode", 16, 0x02, {"off": 0x02}, "replace"),
+            # The mode the unit is in when turned off
+            (
+                "off_mode",
+                5,
+                0xFF,
+                {"off": 0x0C, "dry": 0x04, "fan": 0x06, "heat": 0x02},
+                "replace",
+            ),
+        ),
+    )
+
+    brand = "Daikin"
+    model = "Generic"
+    capabilities = {
+        "mode": ["off", "cool", "fan", "dry"],
+        "temperature": range(18, 32),
+    }
+    # For functions that require their own frames
+    xtra_capabilities = {}
+    # Specify wether the bits order has to be swapped
+    is_msb = False
+    # Sum of the bit reversed bytes, bit reversed
+    CHECKSUM = Checksum(BIT_REVERSE, BIT_REVERSE)
 
     def __init__(self):
         super().__init__()
-        self.brand = "Daikin"
-        self.model = "Generic"
-        self.capabilities = {
-            "mode": ["off", "cool", "fan", "dry"],
-            "temperature": [x for x in range(18, 32)],
-        }
-        # For functions that require their own frames
-        self.xtra_capabilities = {}
         self.status = {"mode": "cool", "temperature": 25}
 
         self.to_set = {}
-        # Specify wether the bits order has to be swapped
-        self.is_msb = False
 
     def set_temperature(self, temp):
         if temp < self.capabilities["temperature"][0]:
@@ -61,16 +114,14 @@ class Daikinth(HVAC):
             temp = self.capabilities["temperature"][-1]
         self.to_set["temperature"] = temp
 
-    def code_temperature(self):
+    def value_temperature(self):
         if "temperature" in self.to_set:
             temp = self.to_set["temperature"]
             if "mode" in self.to_set and self.to_set["mode"] == "fan":
                 temp = 25
         else:
             temp = self.status["temperature"]
-        mask = bytearray(b"\x00" * 18)
-        mask[6] = bit_reverse(temp * 2)
-        return mask, False
+        return temp
 
     def set_fan(self, mode):
         if "fan" not in self.capabilities:
@@ -79,7 +130,7 @@ class Daikinth(HVAC):
             return
         self.to_set["fan"] = mode
 
-    def code_fan(self):
+    def value_fan(self):
         """mode is one of auto, lowest, low, medium, high, highest"""
         if "fan" in self.to_set:
             mode = self.to_set["fan"]
@@ -91,12 +142,7 @@ class Daikinth(HVAC):
         rank = ["lowest", "low", "medium", "high", "highest"]
         if mode not in rank:
             mode = "auto"  # Just in case
-        mask = bytearray(b"\x00" * 18)
-        if mode == "auto":
-            mask[8] = 0x05
-        else:
-            mask[8] = bit_reverse(48 + (16 * rank.index(mode)))
-        return mask, False
+        return mode
 
     def set_swing(self, mode):
         if "swing" not in self.capabilities:
@@ -105,7 +151,7 @@ class Daikinth(HVAC):
             return
         self.to_set["swing"] = mode
 
-    def code_swing(self):
+    def value_swing(self):
         if "swing" in self.to_set:
             mode = self.to_set["swing"]
         else:
@@ -113,13 +159,7 @@ class Daikinth(HVAC):
                 mode = self.status["swing"]
             else:
                 mode = False
-
-        mask = bytearray(b"\x00" * 18)
-        if mode == "on":
-            mask[8] = 0xF0
-        else:
-            mask[8] = 0x00
-        return mask, False
+        return mode
 
     def set_powerful(self, mode="off"):
         # print("\n\nDaikin set powerful {}\n\n".format(mode))
@@ -129,7 +169,7 @@ class Daikinth(HVAC):
             return
         self.to_set["powerful"] = mode
 
-    def code_powerful(self):
+    def value_powerful(self):
 
         if "powerful" in self.to_set:
             mode = self.to_set["powerful"]
@@ -138,11 +178,7 @@ class Daikinth(HVAC):
                 mode = self.status["powerful"]
             else:
                 mode = False
-
-        mask = bytearray(b"\x00" * 18)
-        if mode == True:
-            mask[13] = 0x80
-        return mask, True
+        return mode
 
     def set_comfort(self, mode="off"):
         if "comfort" not in self.xtra_capabilities:
@@ -166,88 +202,64 @@ class Daikinth(HVAC):
         if mode == "off":
             self.to_set = {"mode": "off"}
 
-    def code_mode(self):
+    def value_mode(self):
         if "mode" in self.to_set:
             mode = self.to_set["mode"]
         else:
             mode = self.status["mode"]
+        if mode not in ["off", "dry", "fan", "heat", "auto"]:
+            mode = "cool"
+        return mode
+
+    def frame_values(self):
+        """Return the field values, for LAYOUT, of the frame to send."""
+        mode = self.value_mode()
+        return {
+            "temperature": self.value_temperature(),
+            "fan": self.value_fan(),
+            "swing": self.value_swing(),
+            "powerful": self.value_powerful(),
+            "mode": mode,
+            "off_mode": self.status["mode"] if mode == "off" else None,
+        }
 
-        mask = bytearray(b"\x00" * 18)
-        if mode == "off":
-            mask[16] = 0x02
-            cmode = self.status["mode"]
-            if cmode == "off":
-                mask[5] = 0x0C
-            elif cmode == "dry":
-                mask[5] = 0x04
-            elif cmode == "fan":
-                mask[5] = 0x06
-            elif cmode == "heat":
-                mask[5] = 0x02
-            elif cmode == "auto":
-                mask[5] = 0x00
-        elif mode == "dry":
-            mask[5] = 0x84
-            mask[6] = 0x03
-        elif mode == "fan":
-            mask[5] = 0x86
-        elif mode == "heat":
-            mask[5] = 0x82
-        elif mode == "auto":
-            mask[5] = 0x80
-        else:
-            mask[5] = 0x8C
-        return mask, True
-
-    def build_code(self):
+    def build_code(self, checksum=False):
+        """With checksum, frames are followed by their checksum. See build_frame."""
         frames = []
-        packet = bytearray(self.FBODY)
-        # Note that set mod must be last for it replaces values
-        for f in [
-            self.code_temperature,
-            self.code_fan,
-            self.code_swing,
-            self.code_powerful,
-            self.code_mode,
-        ]:
-            mask, replace = f()
-            if replace:
-                packet = bytearray([y or x for x, y in zip(packet, mask)])
-            else:
-                packet = bytearray([x | y for x, y in zip(packet, mask)])
-        frames += [packet]
+        if checksum:
+            frames += [self.build_frame(self.frame_values())]
+        else:
+            frames += [self.LAYOUT.build(self.frame_values())]
         return frames
 
     def _build_ircode(self):
         frames = []
         frames += self.code_comfort()
-        frames += self.build_code()
         idx = 0
         for x in frames:
             frames[idx] += self.crc(x)
             idx += 1
+        frames += self.build_code(checksum=True)
         return frames
 
     def crc(self, frame):
-        crc = 0
-        for x in frame:
-            # print("Adding 0x%02x as 0x%02x"%(x,bit_reverse(x)))
-            crc += bit_reverse(x)
-            # print("crc now 0x%02x"%crc)
-        return bit_reverse(crc & 0xFF).to_bytes(1, "big")
+        return self.CHECKSUM.value(frame).to_bytes(1, "big")
 
 
 class Smash2(Daikinth):
+    __slots__ = ()
+
+    model = "Smash 2"
+    capabilities = {
+        "mode": ["off", "cool", "fan", "dry"],
+        "temperature": range(18, 32),
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["off", "on"],
+        "powerful": ["off", "on"],
+    }
+
     def __init__(self):
         super().__init__()
-        self.model = "Smash 2"
-        self.capabilities = {
-            "mode": ["off", "cool", "fan", "dry"],
-            "temperature": [x for x in range(18, 32)],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["off", "on"],
-            "powerful": ["off", "on"],
-        }
         self.status = {
             "mode": "off",
             "temperature": 25,
@@ -258,186 +270,195 @@ class Smash2(Daikinth):
 
 
 class Daikin(PulseBased):
+    __slots__ = ()
+
     STARTFRAME = [3650, 1623]
     ENDFRAME = None
     MARK = [428]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [428, 1280]  # ditto
 
-    def __init__(self):
-        super().__init__("DAIKIN")
-        self.capabilities = {
-            "mode": ["off", "auto", "dry", "cool", "heat", "fan"],
-            "temperature": [10, 32],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "hswing": ["off", "on"],
-            "economy": ["off", "on"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-            "cleaning": ["off", "on"],
-        }
-        self.temperature_step = 0.5
+    protocol = "DAIKIN"
+    capabilities = {
+        "mode": ["off", "auto", "dry", "cool", "heat", "fan"],
+        "temperature": [10, 32],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "hswing": ["off", "on"],
+        "economy": ["off", "on"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+        "cleaning": ["off", "on"],
+    }
+    temperature_step = 0.5
 
 
 class Daikin2(PulseBased):
+    __slots__ = ()
+
     LEAD = [10024, 25180]
     STARTFRAME = [3500, 1728]
     ENDFRAME = None
     MARK = [460]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [420, 1270]  # ditto
 
-    def __init__(self):
-        super().__init__("DAIKIN2")
-        self.capabilities = {
-            "mode": ["off", "auto", "dry", "cool", "heat", "fan"],
-            "temperature": [10, 32],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "auto", "ceiling", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": [
-                "off",
-                "far left",
-                "close left",
-                "middle",
-                "close right",
-                "far right",
-                "wide",
-            ],
-            "economy": ["off", "on"],
-            "economy": ["off", "on"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-            "cleaning": ["off", "on"],
-            "purifier": ["off", "on"],
-        }
+    protocol = "DAIKIN2"
+    capabilities = {
+        "mode": ["off", "auto", "dry", "cool", "heat", "fan"],
+        "temperature": [10, 32],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "auto", "ceiling", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": [
+            "off",
+            "far left",
+            "close left",
+            "middle",
+            "close right",
+            "far right",
+            "wide",
+        ],
+        "economy": ["off", "on"],
+        "economy": ["off", "on"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+        "cleaning": ["off", "on"],
+        "purifier": ["off", "on"],
+    }
 
 
 class Daikin216(PulseBased):
+    __slots__ = ()
+
     STARTFRAME = [3440, 1750]
     ENDFRAME = None
     MARK = [420]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [450, 1300]  # ditto
 
-    def __init__(self):
-        super().__init__("DAIKIN216")
-        self.capabilities = {
-            "mode": ["off", "auto", "dry", "cool", "heat", "fan"],
-            "temperature": [10, 32],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "hswing": ["off", "on"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-        }
+    protocol = "DAIKIN216"
+    capabilities = {
+        "mode": ["off", "auto", "dry", "cool", "heat", "fan"],
+        "temperature": [10, 32],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "hswing": ["off", "on"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+    }
 
 
 class Daikin160(PulseBased):
+    __slots__ = ()
+
     STARTFRAME = [5000, 2145]
     ENDFRAME = None
     MARK = [342]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [700, 1786]  # ditto
 
-    def __init__(self):
-        super().__init__("DAIKIN160")
-        self.capabilities = {
-            "mode": ["off", "auto", "dry", "cool", "heat", "fan"],
-            "temperature": [10, 32],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
-        }
+    protocol = "DAIKIN160"
+    capabilities = {
+        "mode": ["off", "auto", "dry", "cool", "heat", "fan"],
+        "temperature": [10, 32],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
+    }
 
 
 class Daikin176(PulseBased):
+    __slots__ = ()
+
     STARTFRAME = [5070, 2140]
     ENDFRAME = None
     MARK = [370]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [710, 1780]  # ditto
 
-    def __init__(self):
-        super().__init__("DAIKIN176")
-        self.capabilities = {
-            "mode": ["off", "auto", "dry", "cool", "heat", "fan"],
-            "temperature": [10, 32],
-            "fan": ["high", "low"],
-            "hswing": ["off", "on"],
-        }
+    protocol = "DAIKIN176"
+    capabilities = {
+        "mode": ["off", "auto", "dry", "cool", "heat", "fan"],
+        "temperature": [10, 32],
+        "fan": ["high", "low"],
+        "hswing": ["off", "on"],
+    }
 
 
 class Daikin128(PulseBased):
+    __slots__ = ()
+
     LEAD = [9800, 9800]
     STARTFRAME = [4600, 2500]
     ENDFRAME = [4600, 20300]
     MARK = [350]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [382, 954]  # ditto
 
-    def __init__(self):
-        super().__init__("DAIKIN128")
-        self.capabilities = {
-            "mode": ["off", "auto", "dry", "cool", "heat", "fan"],
-            "temperature": [16, 30],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["off", "on"],
-            "economy": ["off", "on"],
-        }
+    protocol = "DAIKIN128"
+    capabilities = {
+        "mode": ["off", "auto", "dry", "cool", "heat", "fan"],
+        "temperature": [16, 30],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["off", "on"],
+        "economy": ["off", "on"],
+    }
 
 
 class Daikin152(PulseBased):
+    __slots__ = ()
+
     STARTFRAME = [3492, 1718]
     ENDFRAME = None
     MARK = [433]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [433, 1529]  # ditto
 
-    def __init__(self):
-        super().__init__("DAIKIN152")
-        self.capabilities = {
-            "mode": ["off", "auto", "dry", "cool", "heat", "fan"],
-            "temperature": [10, 32],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "economy": ["off", "on"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-        }
+    protocol = "DAIKIN152"
+    capabilities = {
+        "mode": ["off", "auto", "dry", "cool", "heat", "fan"],
+        "temperature": [10, 32],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "economy": ["off", "on"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+    }
 
 
 class Daikin64(PulseBased):
+    __slots__ = ()
+
     STARTFRAME = [4920, 2230]
     ENDFRAME = None
     MARK = [298]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [780, 1850]  # ditto
 
-    def __init__(self):
-        super().__init__("DAIKIN64")
-        self.capabilities = {
-            "mode": ["off", "dry", "cool", "heat", "fan"],
-            "temperature": [16, 30],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["off", "on"],
-        }
+    protocol = "DAIKIN64"
+    capabilities = {
+        "mode": ["off", "dry", "cool", "heat", "fan"],
+        "temperature": [16, 30],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["off", "on"],
+    }
 
 
 class Daikin312(PulseBased):
+    __slots__ = ()
+
     LEAD = [10024, 25180]
     STARTFRAME = [3518, 1688]
     ENDFRAME = None
     MARK = [453]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [414, 1275]  # ditto
 
-    def __init__(self):
-        super().__init__("DAIKIN312")
-        self.capabilities = {
-            "mode": ["off", "auto", "dry", "cool", "heat", "fan"],
-            "temperature": [10, 32],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "hswing": ["off", "on"],
-            "quiet": ["off", "on"],
-            "powerful": ["off", "on"],
-            "light": ["off", "on"],
-            "economy": ["off", "on"],
-            "purifier": ["off", "on"],
-            "cleaning": ["off", "on"],
-        }
-        self.temperature_step = 0.5
+    protocol = "DAIKIN312"
+    capabilities = {
+        "mode": ["off", "auto", "dry", "cool", "heat", "fan"],
+        "temperature": [10, 32],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "hswing": ["off", "on"],
+        "quiet": ["off", "on"],
+        "powerful": ["off", "on"],
+        "light": ["off", "on"],
+        "economy": ["off", "on"],
+        "purifier": ["off", "on"],
+        "cleaning": ["off", "on"],
+    }
+    temperature_step = 0.5
 
 
 class PluginObject(GenPluginObject):
@@ -28,20 +28,20 @@ from .electra import Electra
 
 
 class Delonghi(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [8984, 4200]
     ENDFRAME = None
     MARK = [572]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [510, 1558]  # ditto
 
-    def __init__(self):
-        super().__init__("DELONGHI_AC")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry"],
-            "temperature": [16, 25],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-        }
+    protocol = "DELONGHI_AC"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry"],
+        "temperature": [16, 25],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
@@ -27,19 +27,19 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Ecoclim(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [6630, 3350]
     ENDFRAME = None
     MARK = [400]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [430, 1260]  # ditto
 
-    def __init__(self):
-        super().__init__("ECOCLIM")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [5, 31],
-            "fan": ["auto", "high", "medium", "low"],
-        }
+    protocol = "ECOCLIM"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [5, 31],
+        "fan": ["auto", "high", "medium", "low"],
+    }
 
 
 # Now the match between models and objects
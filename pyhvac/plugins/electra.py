@@ -27,25 +27,25 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Electra(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [9166, 4470]
     ENDFRAME = None
     MARK = [646]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [547, 1647]  # ditto
 
-    def __init__(self):
-        super().__init__("ELECTRA_AC")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 32],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "hswing": ["off", "on"],
-            "light": ["off", "on"],
-            "cleaning": ["off", "on"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-        }
+    protocol = "ELECTRA_AC"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 32],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "hswing": ["off", "on"],
+        "light": ["off", "on"],
+        "cleaning": ["off", "on"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
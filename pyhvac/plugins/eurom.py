@@ -27,21 +27,21 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Eurom(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3257, 3187]
     ENDFRAME = None
     MARK = [454]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [355, 1162]  # ditto
 
-    def __init__(self):
-        super().__init__("EUROM")
-        self.capabilities = {
-            "mode": ["off", "cool", "heat", "fan", "dry"],
-            "temperature": [16, 32],
-            "fan": ["low", "medium", "high"],
-            "swing": ["off", "on"],
-            "sleep": ["off", "on"],
-        }
+    protocol = "EUROM"
+    capabilities = {
+        "mode": ["off", "cool", "heat", "fan", "dry"],
+        "temperature": [16, 32],
+        "fan": ["low", "medium", "high"],
+        "swing": ["off", "on"],
+        "sleep": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
@@ -24,124 +24,129 @@
 #
 
 from .hvaclib import PulseBased, GenPluginObject
-from ..irhvac import ARRAH2E, ARDB1, ARREB1E, ARJW2, ARRY4, ARREW4E
 
 
 class Fujitsuv1(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3324, 1574]
     ENDFRAME = None
     MARK = [440]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [390, 1182]  # ditto
 
-    def __init__(self):
-        super().__init__("FUJITSU_AC", variant=ARRAH2E)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low", "lowest"],
-            "swing": ["off", "on"],
-            "hswing": ["off", "on"],
-            "quiet": ["off", "on"],
-        }
+    protocol = "FUJITSU_AC"
+    variant = "ARRAH2E"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low", "lowest"],
+        "swing": ["off", "on"],
+        "hswing": ["off", "on"],
+        "quiet": ["off", "on"],
+    }
 
 
 class Fujitsuv2(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3324, 1574]
     ENDFRAME = None
     MARK = [440]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [390, 1182]  # ditto
 
-    def __init__(self):
-        super().__init__("FUJITSU_AC", variant=ARDB1)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low", "lowest"],
-            "swing": ["off", "on"],
-            "quiet": ["off", "on"],
-        }
+    protocol = "FUJITSU_AC"
+    variant = "ARDB1"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low", "lowest"],
+        "swing": ["off", "on"],
+        "quiet": ["off", "on"],
+    }
 
 
 class Fujitsuv3(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3324, 1574]
     ENDFRAME = None
     MARK = [440]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [390, 1182]  # ditto
 
-    def __init__(self):
-        super().__init__("FUJITSU_AC", variant=ARREB1E)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low", "lowest"],
-            "swing": ["off", "on"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-            "economy": ["off", "on"],
-        }
+    protocol = "FUJITSU_AC"
+    variant = "ARREB1E"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low", "lowest"],
+        "swing": ["off", "on"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+        "economy": ["off", "on"],
+    }
 
 
 class Fujitsuv4(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3324, 1574]
     ENDFRAME = None
     MARK = [440]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [390, 1182]  # ditto
 
-    def __init__(self):
-        super().__init__("FUJITSU_AC", variant=ARJW2)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low", "lowest"],
-            "swing": ["off", "on"],
-            "hswing": ["off", "on"],
-            "quiet": ["off", "on"],
-        }
+    protocol = "FUJITSU_AC"
+    variant = "ARJW2"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low", "lowest"],
+        "swing": ["off", "on"],
+        "hswing": ["off", "on"],
+        "quiet": ["off", "on"],
+    }
 
 
 class Fujitsuv5(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3324, 1574]
     ENDFRAME = None
     MARK = [440]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [390, 1182]  # ditto
 
-    def __init__(self):
-        super().__init__("FUJITSU_AC", variant=ARRY4)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low", "lowest"],
-            "swing": ["off", "on"],
-            "purifier": ["off", "on"],
-            "quiet": ["off", "on"],
-            "cleaning": ["off", "on"],
-        }
+    protocol = "FUJITSU_AC"
+    variant = "ARRY4"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low", "lowest"],
+        "swing": ["off", "on"],
+        "purifier": ["off", "on"],
+        "quiet": ["off", "on"],
+        "cleaning": ["off", "on"],
+    }
 
 
 class Fujitsuv6(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3324, 1574]
     ENDFRAME = None
     MARK = [440]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [390, 1182]  # ditto
 
-    def __init__(self):
-        super().__init__("FUJITSU_AC", variant=ARREW4E)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low", "lowest"],
-            "swing": ["off", "on"],
-            "hswing": ["off", "on"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-            "economy": ["off", "on"],
-        }
+    protocol = "FUJITSU_AC"
+    variant = "ARREW4E"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low", "lowest"],
+        "swing": ["off", "on"],
+        "hswing": ["off", "on"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+        "economy": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
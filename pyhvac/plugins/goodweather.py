@@ -27,23 +27,23 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Goodweather(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [6820, 6820]
     ENDFRAME = None
     MARK = [580]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [1860, 580]  # ditto
 
-    def __init__(self):
-        super().__init__("GOODWEATHER")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 31],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "auto low", "auto high"],
-            "powerful": ["off", "on"],
-            "light": ["off", "on"],
-            "quiet": ["off", "on"],
-        }
+    protocol = "GOODWEATHER"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 31],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "auto low", "auto high"],
+        "powerful": ["off", "on"],
+        "light": ["off", "on"],
+        "quiet": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
@@ -25,96 +25,98 @@
 
 from .hvaclib import PulseBased, GenPluginObject
 from .kelvinator import Kelvinator
-from ..irhvac import YAW1F, YBOFB, YX1FSF
 
 
 class Greev1(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [9000, 4500]
     ENDFRAME = None
     MARK = [620]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [540, 1600]  # ditto
 
-    def __init__(self):
-        super().__init__("GREE", variant=YAW1F)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": [
-                "off",
-                "auto",
-                "far left",
-                "close left",
-                "middle",
-                "close right",
-                "far right",
-            ],
-            "powerful": ["off", "on"],
-            "light": ["off", "on"],
-            "cleaning": ["off", "on"],
-        }
+    protocol = "GREE"
+    variant = "YAW1F"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": [
+            "off",
+            "auto",
+            "far left",
+            "close left",
+            "middle",
+            "close right",
+            "far right",
+        ],
+        "powerful": ["off", "on"],
+        "light": ["off", "on"],
+        "cleaning": ["off", "on"],
+    }
 
 
 class Greev2(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [9000, 4500]
     ENDFRAME = None
     MARK = [620]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [540, 1600]  # ditto
 
-    def __init__(self):
-        super().__init__("GREE", variant=YBOFB)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
-            "temperature": [16, 30],
-            "economy": ["off", "on"],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": [
-                "off",
-                "auto",
-                "far left",
-                "close left",
-                "middle",
-                "close right",
-                "far right",
-            ],
-            "powerful": ["off", "on"],
-            "light": ["off", "on"],
-            "cleaning": ["off", "on"],
-        }
+    protocol = "GREE"
+    variant = "YBOFB"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
+        "temperature": [16, 30],
+        "economy": ["off", "on"],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": [
+            "off",
+            "auto",
+            "far left",
+            "close left",
+            "middle",
+            "close right",
+            "far right",
+        ],
+        "powerful": ["off", "on"],
+        "light": ["off", "on"],
+        "cleaning": ["off", "on"],
+    }
 
 
 class Greev3(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [9000, 4500]
     ENDFRAME = None
     MARK = [620]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [540, 1600]  # ditto
 
-    def __init__(self):
-        super().__init__("GREE", variant=YX1FSF)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": [
-                "off",
-                "auto",
-                "far left",
-                "close left",
-                "middle",
-                "close right",
-                "far right",
-            ],
-            "powerful": ["off", "on"],
-            "light": ["off", "on"],
-            "economy": ["off", "on"],
-            "cleaning": ["off", "on"],
-        }
+    protocol = "GREE"
+    variant = "YX1FSF"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": [
+            "off",
+            "auto",
+            "far left",
+            "close left",
+            "middle",
+            "close right",
+            "far right",
+        ],
+        "powerful": ["off", "on"],
+        "light": ["off", "on"],
+        "economy": ["off", "on"],
+        "cleaning": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
@@ -24,137 +24,140 @@
 #
 
 from .hvaclib import PulseBased, GenPluginObject
-from ..irhvac import V9014557_A, V9014557_B
 
 
 class Haier(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3000, 4300]
     ENDFRAME = None
     MARK = [520]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [650, 1650]  # ditto
 
-    def __init__(self):
-        super().__init__("HAIER_AC")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "auto high", "auto low"],
-            "purifier": ["off", "on"],
-            "sleep": ["off", "on"],
-        }
+    protocol = "HAIER_AC"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "auto high", "auto low"],
+        "purifier": ["off", "on"],
+        "sleep": ["off", "on"],
+    }
 
 
 class Haier176A(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3000, 4300]
     ENDFRAME = None
     MARK = [520]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [650, 1650]  # ditto
 
-    def __init__(self):
-        super().__init__("HAIER_AC176", variant=V9014557_A)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "auto", "ceiling", "45°", "30°", "0°"],
-            "hswing": ["auto", "far right", "right", "middle", "left", "far left"],
-            "purifier": ["off", "on"],
-            "sleep": ["off", "on"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-        }
+    protocol = "HAIER_AC176"
+    variant = "V9014557_A"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "auto", "ceiling", "45°", "30°", "0°"],
+        "hswing": ["auto", "far right", "right", "middle", "left", "far left"],
+        "purifier": ["off", "on"],
+        "sleep": ["off", "on"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+    }
 
 
 class Haier176B(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3000, 4300]
     ENDFRAME = None
     MARK = [520]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [650, 1650]  # ditto
 
-    def __init__(self):
-        super().__init__("HAIER_AC176", variant=V9014557_B)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "auto", "ceiling", "45°", "30°", "0°"],
-            "hswing": ["auto", "far right", "right", "middle", "left", "far left"],
-            "purifier": ["off", "on"],
-            "sleep": ["off", "on"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-        }
+    protocol = "HAIER_AC176"
+    variant = "V9014557_B"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "auto", "ceiling", "45°", "30°", "0°"],
+        "hswing": ["auto", "far right", "right", "middle", "left", "far left"],
+        "purifier": ["off", "on"],
+        "sleep": ["off", "on"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+    }
 
 
 class HaierYRW02A(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3000, 4300]
     ENDFRAME = None
     MARK = [520]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [650, 1650]  # ditto
 
-    def __init__(self):
-        super().__init__("HAIER_AC_YRW02", variant=V9014557_A)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "auto", "ceiling", "45°", "30°", "0°"],
-            "hswing": ["auto", "far right", "right", "middle", "left", "far left"],
-            "purifier": ["off", "on"],
-            "sleep": ["off", "on"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-        }
+    protocol = "HAIER_AC_YRW02"
+    variant = "V9014557_A"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "auto", "ceiling", "45°", "30°", "0°"],
+        "hswing": ["auto", "far right", "right", "middle", "left", "far left"],
+        "purifier": ["off", "on"],
+        "sleep": ["off", "on"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+    }
 
 
 class HaierYRW02B(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3000, 4300]
     ENDFRAME = None
     MARK = [520]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [650, 1650]  # ditto
 
-    def __init__(self):
-        super().__init__("HAIER_AC_YRW02", variant=V9014557_B)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "auto", "ceiling", "45°", "30°", "0°"],
-            "hswing": ["auto", "far right", "right", "middle", "left", "far left"],
-            "purifier": ["off", "on"],
-            "sleep": ["off", "on"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-        }
+    protocol = "HAIER_AC_YRW02"
+    variant = "V9014557_B"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "auto", "ceiling", "45°", "30°", "0°"],
+        "hswing": ["auto", "far right", "right", "middle", "left", "far left"],
+        "purifier": ["off", "on"],
+        "sleep": ["off", "on"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+    }
 
 
 class Haier160(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3000, 4300]
     ENDFRAME = None
     MARK = [520]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [650, 1650]  # ditto
 
-    def __init__(self):
-        super().__init__("HAIER_AC160")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "auto", "ceiling", "90°", "45°", "30°", "0°"],
-            "purifier": ["off", "on"],
-            "sleep": ["off", "on"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-            "cleaning": ["off", "on"],
-            "light": ["off", "on"],
-        }
+    protocol = "HAIER_AC160"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "auto", "ceiling", "90°", "45°", "30°", "0°"],
+        "purifier": ["off", "on"],
+        "sleep": ["off", "on"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+        "cleaning": ["off", "on"],
+        "light": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
@@ -24,66 +24,68 @@
 #
 
 from .hvaclib import PulseBased, GenPluginObject
-from ..irhvac import R_LT0541_HTA_A, R_LT0541_HTA_B
 
 
 class Hitachi(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3300, 1700]
     ENDFRAME = None
     MARK = [400]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [500, 1250]  # ditto
 
-    def __init__(self):
-        super().__init__("HITACHI_AC")
-        self.capabilities = {
-            "mode": ["off", "auto", "heat", "cool", "dry", "fan"],
-            "temperature": [16, 32],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "hswing": ["off", "on"],
-        }
+    protocol = "HITACHI_AC"
+    capabilities = {
+        "mode": ["off", "auto", "heat", "cool", "dry", "fan"],
+        "temperature": [16, 32],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "hswing": ["off", "on"],
+    }
 
 
 class Hitachi1A(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3400, 3400]
     ENDFRAME = None
     MARK = [400]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [372, 1208]  # ditto
 
-    def __init__(self):
-        super().__init__("HITACHI_AC1", variant=R_LT0541_HTA_A)
-        self.capabilities = {
-            "mode": ["off", "auto", "heat", "cool", "dry", "fan"],
-            "temperature": [16, 32],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "hswing": ["off", "on"],
-            "sleep": ["off", "on"],
-        }
+    protocol = "HITACHI_AC1"
+    variant = "R_LT0541_HTA_A"
+    capabilities = {
+        "mode": ["off", "auto", "heat", "cool", "dry", "fan"],
+        "temperature": [16, 32],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "hswing": ["off", "on"],
+        "sleep": ["off", "on"],
+    }
 
 
 class Hitachi1B(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3400, 3400]
     ENDFRAME = None
     MARK = [400]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [372, 1208]  # ditto
 
-    def __init__(self):
-        super().__init__("HITACHI_AC1", variant=R_LT0541_HTA_B)
-        self.capabilities = {
-            "mode": ["off", "auto", "heat", "cool", "dry", "fan"],
-            "temperature": [16, 32],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "hswing": ["off", "on"],
-            "sleep": ["off", "on"],
-        }
+    protocol = "HITACHI_AC1"
+    variant = "R_LT0541_HTA_B"
+    capabilities = {
+        "mode": ["off", "auto", "heat", "cool", "dry", "fan"],
+        "temperature": [16, 32],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "hswing": ["off", "on"],
+        "sleep": ["off", "on"],
+    }
 
 
 class Hitachi424(PulseBased):
+    __slots__ = ()
 
     LEAD = [29784, 49290]
     STARTFRAME = [3416, 1604]
@@ -91,87 +93,86 @@ class Hitachi424(PulseBased):
     MARK = [463]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [500, 1250]  # ditto
 
-    def __init__(self):
-        super().__init__("HITACHI_AC424")
-        self.capabilities = {
-            "mode": ["off", "fan", "heat", "cool", "dry"],
-            "temperature": [16, 32],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["off", "on"],
-        }
+    protocol = "HITACHI_AC424"
+    capabilities = {
+        "mode": ["off", "fan", "heat", "cool", "dry"],
+        "temperature": [16, 32],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["off", "on"],
+    }
 
 
 class Hitachi3(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3400, 1660]
     ENDFRAME = None
     MARK = [460]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [410, 1250]  # ditto
 
-    def __init__(self):
-        super().__init__("HITACHI_AC3")
-        self.capabilities = {
-            "mode": ["off", "fan", "heat", "cool", "dry"],
-            "temperature": [16, 32],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["off", "on"],
-        }
+    protocol = "HITACHI_AC3"
+    capabilities = {
+        "mode": ["off", "fan", "heat", "cool", "dry"],
+        "temperature": [16, 32],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["off", "on"],
+    }
 
 
 class Hitachi344(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3300, 1700]
     ENDFRAME = None
     MARK = [400]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [500, 1250]  # ditto
 
-    def __init__(self):
-        super().__init__("HITACHI_AC344")
-        self.capabilities = {
-            "mode": ["off", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 32],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["off", "on"],
-            "hswing": ["auto", "far right", "right", "middle", "left", "far left"],
-        }
+    protocol = "HITACHI_AC344"
+    capabilities = {
+        "mode": ["off", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 32],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["off", "on"],
+        "hswing": ["auto", "far right", "right", "middle", "left", "far left"],
+    }
 
 
 class Hitachi264(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3300, 1700]
     ENDFRAME = None
     MARK = [400]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [500, 1250]  # ditto
 
-    def __init__(self):
-        super().__init__("HITACHI_AC264")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 32],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "purifier": ["off", "on"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-            "economy": ["off", "on"],
-            "light": ["off", "on"],
-        }
+    protocol = "HITACHI_AC264"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 32],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "purifier": ["off", "on"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+        "economy": ["off", "on"],
+        "light": ["off", "on"],
+    }
 
 
 class Hitachi296(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3300, 1700]
     ENDFRAME = None
     MARK = [400]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [500, 1250]  # ditto
 
-    def __init__(self):
-        super().__init__("HITACHI_AC296")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat"],
-            "temperature": [16, 25],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-        }
+    protocol = "HITACHI_AC296"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat"],
+        "temperature": [16, 25],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+    }
 
 
 # Now the match between models and objects
@@ -29,36 +29,571 @@
 # IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE
 ##
 
+import importlib
 import struct
-from .. import irhvac
+import threading
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import chain, islice
+from math import prod
+from time import perf_counter
+from types import MappingProxyType
+
+from .. import registry
+
+# The SWIG irhvac extension is only loaded when an IRGHVAC device generates a code
+_irhvac = None
+_irhvac_constants = {}
+
+
+def irhvac_module():
+    global _irhvac
+    if _irhvac is None:
+        try:
+            _irhvac = importlib.import_module("..irhvac", __package__)
+        except ImportError as e:
+            # Remembered, as failing imports are slow
+            _irhvac = e
+    if isinstance(_irhvac, ImportError):
+        raise ImportError(*_irhvac.args)
+    return _irhvac
+
+
+def has_irhvac():
+    """Return True if the irhvac extension is available."""
+    try:
+        irhvac_module()
+    except ImportError:
+        return False
+    return True
+
+
+def irhvac_constant(name):
+    """Return the value of the irhvac constant called name."""
+    try:
+        return _irhvac_constants[name]
+    except KeyError:
+        pass
+    value = getattr(irhvac_module(), name)
+    _irhvac_constants[name] = value
+    return value
+
+
+# NumPy is optional. It is only imported to decode long pulse trains and to
+# checksum many frames
+_numpy = None
+# Shorter pulse trains, and fewer frames, are processed faster without NumPy
+NUMPY_MIN_PULSES = 512
+NUMPY_MIN_FRAMES = 64
+
+
+def numpy_module():
+    """Return the numpy module, None if it is not installed."""
+    global _numpy
+    if _numpy is None:
+        try:
+            _numpy = importlib.import_module("numpy")
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+# For each byte value, the same byte with its bit order swapped. Usable with
+# bytes.translate
+BIT_REVERSE = bytes(int(format(x, "08b")[::-1], 2) for x in range(256))
 
 
 def bit_reverse(i, n=8):
+    if n == 8 and 0 <= i <= 0xFF:
+        return BIT_REVERSE[i]
     return int(format(i, "0%db" % n)[::-1], 2)
 
 
-class HVAC(object):
+def reverse_frame(frame):
+    """Swap the bit order of every byte in a frame. Returns a bytearray."""
+    return bytearray(frame).translate(BIT_REVERSE)
+
+
+# Byte to pulses tables, keyed by (MARK, SPACE) timings
+_PULSE_TABLES = {}
+
+
+def pulse_table(mark, space):
+    """Return a 256 entries table giving, for each byte value, the LIRC pulses
+    (mark/space pairs, msb first) encoding that byte."""
+    key = (tuple(mark), tuple(space))
+    try:
+        return _PULSE_TABLES[key]
+    except KeyError:
+        pass
+    table = []
+    for x in range(256):
+        pulses = []
+        idx = 0x80
+        while idx:
+            if x & idx:
+                pulses.append(mark[-1])
+                pulses.append(space[-1])
+            else:
+                pulses.append(mark[0])
+                pulses.append(space[0])
+            idx >>= 1
+        table.append(tuple(pulses))
+    table = tuple(table)
+    _PULSE_TABLES[key] = table
+    return table
+
+
+def pack_bits(bits, endian="msb"):
+    """Pack bits, a sequence of 0 and 1, into a bytearray. With "msb" the first
+    bit is the most significant of its byte, with "lsb" the least. The last
+    byte is padded with 0."""
+    frame = bytearray()
+    for idx in range(0, len(bits), 8):
+        byte = bits[idx : idx + 8]
+        byte += [0] * (8 - len(byte))
+        if endian == "lsb":
+            byte.reverse()
+        value = 0
+        for bit in byte:
+            value = value << 1 | bit
+        frame.append(value)
+    return frame
+
+
+def _near(value, ref, tolerance, excess):
+    return abs(value - ref) <= ref * tolerance + excess
+
+
+# Broadlink encoding of pulse values (in µs). Bounded in case of free running timings
+_BROADLINK_UNITS = {}
+_BROADLINK_UNITS_MAX = 4096
+# Byte to Broadlink payload tables, keyed by (MARK, SPACE) timings
+_BROADLINK_TABLES = {}
+
+
+def broadlink_unit(pulse):
+    """Return the Broadlink encoding of a pulse (in µs)."""
+    try:
+        return _BROADLINK_UNITS[pulse]
+    except KeyError:
+        pass
+    x = round(int(pulse) * 269 / 8192)  # 32.84ms units
+    if x < 256:
+        code = struct.pack(">B", x)  # big endian (1-byte)
+    else:
+        code = struct.pack(">xH", x)  # 0x00 then big endian (2-bytes)
+    if len(_BROADLINK_UNITS) < _BROADLINK_UNITS_MAX:
+        _BROADLINK_UNITS[pulse] = code
+    return code
+
+
+def broadlink_table(mark, space):
+    """Return a 256 entries table giving, for each byte value, the Broadlink
+    payload fragment encoding that byte. See pulse_table."""
+    key = (tuple(mark), tuple(space))
+    try:
+        return _BROADLINK_TABLES[key]
+    except KeyError:
+        pass
+    table = tuple(
+        b"".join(map(broadlink_unit, pulses)) for pulses in pulse_table(mark, space)
+    )
+    _BROADLINK_TABLES[key] = table
+    return table
+
+
+def broadlink_wrap(payload):
+    """Wrap an encoded Broadlink payload into a Broadlink IR packet.
+
+    The packet is sized first and the payload is then copied in place."""
+    size = len(payload)
+    length = 4 + size + 2
+    # Add 0s to make ultimate packet size a multiple of 16 for 128-bit AES encryption.
+    remainder = (length + 4) % 16  # rm.send_data() adds 4-byte header (02 00 00 00)
+    if remainder:
+        length += 16 - remainder
+
+    packet = bytearray(length)
+    # 0x26 = IR, 0x00 = no repeats, then little endian byte count
+    struct.pack_into("<BBH", packet, 0, 0x26, 0x00, size)
+    packet[4 : 4 + size] = payload
+    packet[4 + size : 6 + size] = b"\x0d\x05"  # IR terminator
+    return bytes(packet)
+
+
+def broadlink_packet(pulses):
+    """Build a Broadlink IR packet from LIRC pulses (in µs)."""
+    return broadlink_wrap(b"".join(map(broadlink_unit, pulses)))
+
+
+class PulseTrain(array):
+    """A compact LIRC pulse train. Pulses are stored as unsigned 16 bits
+    integers ("H"), or 32 bits ("I") if any pulse does not fit. Being an array,
+    it supports the buffer protocol, slicing and tobytes()."""
+
+    def __new__(cls, pulses=()):
+        if not isinstance(pulses, (list, tuple, array)):
+            pulses = list(pulses)
+        if pulses and max(pulses) > 0xFFFF:
+            typecode = "I"
+        else:
+            typecode = "H"
+        return super().__new__(cls, typecode, pulses)
+
+    def __reduce_ex__(self, protocol):
+        return self.__class__, (self.tolist(),)
+
+
+# Profiling. Hooks are called as hook(stage, device, seconds) after each
+# instrumented stage. Without hooks, a stage only costs a test of _hooks.
+_hooks = []
+
+
+def add_profile_hook(hook):
+    _hooks.append(hook)
+
+
+def remove_profile_hook(hook):
+    _hooks.remove(hook)
+
+
+def _profile(stage, device, start):
+    elapsed = perf_counter() - start
+    for hook in _hooks:
+        hook(stage, device, elapsed)
+
+
+class StageProfiler(object):
+    """A profile hook recording, per stage, brand, model class and protocol, the
+    count, total and maximum durations, and an histogram of the durations.
+
+    The stages are "set" (set_value), "build" (build_ircode), "irac" (the
+    IRremoteESP8266 call in IRGHVAC.build_ircode), "lirc" (to_lirc) and
+    "broadlink" (to_broadlink). Histogram bucket n counts the durations
+    under 2**n µs."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.records = {}
+
+    def __call__(self, stage, device, elapsed):
+        key = (
+            stage,
+            device.brand,
+            type(device).__name__,
+            getattr(device, "protocol", None),
+        )
+        bucket = int(elapsed * 1000000).bit_length()
+        with self.lock:
+            record = self.records.get(key)
+            if record is None:
+                record = self.records[key] = [0, 0.0, 0.0, {}]
+            record[0] += 1
+            record[1] += elapsed
+            record[2] = max(record[2], elapsed)
+            record[3][bucket] = record[3].get(bucket, 0) + 1
+
+    def reset(self):
+        with self.lock:
+            self.records = {}
+
+    def stats(self):
+        """Return a list of dicts, one per stage, brand, class and protocol."""
+        with self.lock:
+            return [
+                {
+                    "stage": stage,
+                    "brand": brand,
+                    "class": cls,
+                    "protocol": protocol,
+                    "count": count,
+                    "total": total,
+                    "max": maxi,
+                    "histogram": {2**k: v for k, v in sorted(histo.items())},
+                }
+                for (stage, brand, cls, protocol), (
+                    count,
+                    total,
+                    maxi,
+                    histo,
+                ) in sorted(self.records.items(), key=lambda x: tuple(map(str, x[0])))
+            ]
+
+    def dump(self, out=None):
+        """Print the stats and histograms to out (default stdout)."""
+        for stat in self.stats():
+            print(
+                f"{stat['stage']:<10} {stat['brand']} {stat['class']} "
+                f"{stat['protocol']}: {stat['count']} calls, "
+                f"mean {stat['total'] / stat['count'] * 1000000:.1f} µs, "
+                f"max {stat['max'] * 1000000:.1f} µs",
+                file=out,
+            )
+            for limit, count in stat["histogram"].items():
+                print(f"    < {limit:>8} µs {count:>8}", file=out)
+
+
+@contextmanager
+def profiling(profiler=None):
+    """Record the stages run in the context with profiler, a new StageProfiler
+    if None, which is returned."""
+    if profiler is None:
+        profiler = StageProfiler()
+    add_profile_hook(profiler)
+    try:
+        yield profiler
+    finally:
+        remove_profile_hook(profiler)
+
+
+# Frame layouts. A layout entry is (field, offset, bits, values, merge): values
+# maps the value of the field to the bits written in the byte at offset. It is
+# a dict, values it does not know write nothing, or a callable, whose results
+# outside bits raise ValueError. With the "or" merge the bits are or-ed into
+# the byte, with "replace" a non-zero result replaces the whole byte. Entries
+# are written in order, and those of a field whose value is None, or missing,
+# are skipped.
+LAYOUT_MERGES = ("or", "replace")
+
+
+def _layout_groups(fields):
+    """Group consecutive dict entries of the same field and merge."""
+    groups = []
+    for entry in fields:
+        field, offset, bits, mapping, merge = entry
+        if (
+            groups
+            and not callable(mapping)
+            and not callable(groups[-1][-1][3])
+            and groups[-1][-1][0] == field
+            and groups[-1][-1][4] == merge
+        ):
+            groups[-1].append(entry)
+        else:
+            groups.append([entry])
+    return groups
+
+
+def _layout_overflow(field, value, bits):
+    raise ValueError(f"Value {value!r} of field {field} overflows {bits:#04x}.")
+
+
+def compile_layout(template, fields):
+    """Compile layout entries into a function pack(values) returning the frame,
+    as a big endian int, with the field values of the dict values written over
+    template. Each group of entries is a single word operation: a dict gives,
+    for each value, the or-ed word or the (kept bits, replacing word) pair."""
+    size = len(template)
+    env = {"_overflow": _layout_overflow}
+    names = {}
+    lines = ["def pack(values):", f"    word = {int.from_bytes(template, 'big')}"]
+    for idx, group in enumerate(_layout_groups(fields)):
+        field, offset, bits, mapping, merge = group[0]
+        if merge not in LAYOUT_MERGES:
+            raise ValueError(f"Unknown merge {merge} for field {field}.")
+        if field not in names:
+            names[field] = f"v{len(names)}"
+            lines.append(f"    {names[field]} = values.get({field!r})")
+        var = names[field]
+        lines.append(f"    if {var} is not None:")
+        shift = 8 * (size - 1 - offset)
+        if callable(mapping):
+            env[f"f{idx}"] = mapping
+            lines.append(f"        byte = f{idx}({var})")
+            lines.append(f"        if byte & {~bits}:")
+            lines.append(f"            _overflow({field!r}, byte, {bits})")
+            if merge == "or":
+                lines.append(f"        word |= byte << {shift}")
+            else:
+                lines.append("        if byte:")
+                keep = ~(0xFF << shift) & ((1 << 8 * size) - 1)
+                lines.append(f"            word = word & {keep} | byte << {shift}")
+            continue
+        table = {}
+        for field, offset, bits, mapping, merge in group:
+            shift = 8 * (size - 1 - offset)
+            for value, byte in mapping.items():
+                if byte & ~bits:
+                    raise ValueError(
+                        f"Value {value!r} of field {field} overflows {bits:#04x}."
+                    )
+                if merge == "or":
+                    table[value] = table.get(value, 0) | byte << shift
+                elif byte:
+                    keep, word = table.get(value, ((1 << 8 * size) - 1, 0))
+                    table[value] = (
+                        keep & ~(0xFF << shift),
+                        word & ~(0xFF << shift) | byte << shift,
+                    )
+        env[f"t{idx}"] = table
+        if merge == "or":
+            lines.append(f"        word |= t{idx}.get({var}, 0)")
+        else:
+            lines.append(f"        replace = t{idx}.get({var})")
+            lines.append("        if replace:")
+            lines.append("            word = word & replace[0] | replace[1]")
+    lines.append("    return word")
+    exec("\n".join(lines), env)
+    return env["pack"]
+
+
+class FrameLayout(object):
+    """A frame template and the layout entries written over it. See
+    compile_layout."""
+
+    __slots__ = ("template", "fields", "pack")
+
+    def __init__(self, template, fields):
+        self.template = bytes(template)
+        self.fields = tuple(fields)
+        for field, offset, bits, mapping, merge in self.fields:
+            if not 0 <= offset < len(self.template):
+                raise ValueError(f"Offset {offset} of field {field} is out of frame.")
+        self.pack = compile_layout(self.template, self.fields)
+
+    def build(self, values):
+        """Return a new frame, a bytearray, with values written over the template."""
+        return bytearray(self.pack(values).to_bytes(len(self.template), "big"))
+
+
+class Checksum(object):
+    """A table driven frame checksum. Each byte contributes table[byte], the
+    contributions are summed, or xor-ed, and the checksum is finish[result &
+    0xFF]. table is 256 bytes, finish 256 values.
+
+    Batches of frames of the same length are checksummed with NumPy, when it
+    is installed."""
+
+    __slots__ = ("table", "finish", "combine", "_arrays")
+
+    def __init__(self, table, finish, combine="sum"):
+        if combine not in ("sum", "xor"):
+            raise ValueError(f"Unknown combine {combine}.")
+        if len(table) != 256 or len(finish) != 256:
+            raise ValueError("Checksum tables must have 256 entries.")
+        self.table = bytes(table)
+        self.finish = tuple(finish)
+        self.combine = combine
+        self._arrays = None
+
+    def total(self, frame):
+        """Return the sum, or xor, of the contributions of the bytes of frame."""
+        data = bytearray(frame).translate(self.table)
+        if self.combine == "sum":
+            return sum(data)
+        crc = 0
+        for x in data:
+            crc ^= x
+        return crc
+
+    def value(self, frame):
+        """Return the checksum of frame."""
+        return self.finish[self.total(frame) & 0xFF]
+
+    def _apply(self, frames, single, batch, minsize):
+        """Return single(frame) for each of frames. Frames of the same length,
+        at least minsize, are processed together, as rows of a 2-D array, by
+        batch when NumPy is installed and they are many."""
+        frames = list(frames)
+        np = numpy_module()
+        if np is None or len(frames) < NUMPY_MIN_FRAMES:
+            return [single(f) for f in frames]
+        groups = {}
+        for idx, frame in enumerate(frames):
+            groups.setdefault(len(frame), []).append(idx)
+        result = [None] * len(frames)
+        for size, indices in groups.items():
+            if size < minsize or len(indices) < NUMPY_MIN_FRAMES:
+                for idx in indices:
+                    result[idx] = single(frames[idx])
+                continue
+            rows = np.frombuffer(b"".join(frames[idx] for idx in indices), np.uint8)
+            rows = rows.reshape(len(indices), size)
+            for idx, value in zip(indices, batch(rows).tolist()):
+                result[idx] = value
+        return result
+
+    def _batch(self, rows):
+        np = numpy_module()
+        if self._arrays is None:
+            self._arrays = (
+                np.frombuffer(self.table, np.uint8),
+                np.array(self.finish, np.int64),
+            )
+        table, finish = self._arrays
+        data = table[rows]
+        if self.combine == "sum":
+            result = data.sum(axis=1, dtype=np.int64) & 0xFF
+        else:
+            result = np.bitwise_xor.reduce(data, axis=1)
+        return finish[result]
+
+    def values(self, frames):
+        """Return the list of the checksums of frames."""
+        return self._apply(frames, self.value, self._batch, 1)
+
+    def verify(self, frame):
+        """Return True if the last byte of frame is the checksum of the others."""
+        return len(frame) > 1 and frame[-1] == self.value(frame[:-1])
+
+    def verify_all(self, frames):
+        """Return, as a list, verify for each of frames."""
+        return self._apply(
+            frames,
+            self.verify,
+            lambda rows: self._batch(rows[:, :-1]) == rows[:, -1],
+            2,
+        )
+
+
+def freeze_capabilities(capabilities):
+    """Return a read-only copy of a capabilities dict, with tuples as values."""
+    return MappingProxyType({x: tuple(y) for x, y in capabilities.items()})
+
+
+class DeviceType(type):
+    """Metaclass of the HVAC objects.
+
+    Capabilities are class attributes, frozen once and shared by all instances.
+    The device classes of pyhvac declare empty __slots__, so instances only hold
+    their status and pending changes. Those that do not get a __dict__."""
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        for x in ("capabilities", "xtra_capabilities"):
+            if x in namespace:
+                namespace[x] = freeze_capabilities(namespace[x])
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+class HVAC(object, metaclass=DeviceType):
     # 90% of hvac remotes use this timing
     STARTFRAME = [3500, 1750]
     ENDFRAME = [435, 10000]
     MARK = [435]
     SPACE = [435, 1300]
 
+    __slots__ = ("status", "to_set")
+
+    brand = "Generic"
+    model = "Generic"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry"],
+        "temperature": range(18, 30),
+    }
+    # For functions that require their own frames
+    xtra_capabilities = {}
+    temperature_step = 1.0
+    # Specify whether the bits order has to be swapped
+    is_msb = False
+    # The FrameLayout and the Checksum of the frames, if any
+    LAYOUT = None
+    CHECKSUM = None
+
     def __init__(self):
-        self.brand = "Generic"
-        self.model = "Generic"
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry"],
-            "temperature": [x for x in range(18, 30)],
-        }
-        # For functions that require their own frames
-        self.xtra_capabilities = {}
         self.status = {"mode": "auto", "temperature": 25}
-        self.temperature_step = 1.0
-
         self.to_set = {}
-        # Specify whether the bits order has to be swapped
-        self.is_msb = False
 
     @property
     def all_capabilities(self):
@@ -73,11 +608,14 @@ class HVAC(object):
         }
 
     def set_value(self, name, value):
+        start = _hooks and perf_counter()
         try:
             xx = getattr(self, "set_" + name)(value)
         except:
             # Does no exisat. Ignore
             pass
+        if start:
+            _profile("set", self, start)
 
     def update_status(self):
         for x, y in self.to_set.items():
@@ -85,172 +623,314 @@ class HVAC(object):
         self.to_set = {}
 
     def build_ircode(self):
+        start = _hooks and perf_counter()
         frames = self._build_ircode()
         if self.is_msb:
-            newframes = []
-            for f in frames:
-                newframes.append(bytearray([bit_reverse(x) for x in f]))
-            frames = newframes
+            frames = [reverse_frame(f) for f in frames]
         # print("Frame with msb {} are:".format(self.is_msb))
         # for f in frames:
         # print(["0x%02x"%x for x in f])
+        if start:
+            _profile("build", self, start)
         return frames
 
+    def build_frame(self, values):
+        """Return the LAYOUT frame for values, a bytearray, followed by its
+        checksum."""
+        frame = self.LAYOUT.build(values)
+        frame.append(self.CHECKSUM.value(frame))
+        return frame
+
+    def verify_frames(self, frames):
+        """Return, for each frame, as returned by build_ircode or decoded from a
+        capture, whether its checksum is valid. Raise TypeError for devices
+        without a CHECKSUM, whose frames cannot be verified."""
+        if self.CHECKSUM is None:
+            raise TypeError(f"{type(self).__name__} frames have no checksum.")
+        if self.is_msb:
+            frames = [reverse_frame(f) for f in frames]
+        return self.CHECKSUM.verify_all(frames)
+
     def to_lirc(self, frames):
         """Transform a list of frames into a LIRC compatible list of pulse timing pairs."""
+        start = _hooks and perf_counter()
+        table = pulse_table(self.MARK, self.SPACE)
         lircframe = []
         for frame in frames:
             lircframe += self.STARTFRAME
-            for x in frame:
-                idx = 0x80
-                while idx:
-                    if x & idx:
-                        lircframe.append(self.MARK[-1])
-                        lircframe.append(self.SPACE[-1])
-                    else:
-                        lircframe.append(self.MARK[0])
-                        lircframe.append(self.SPACE[0])
-                    idx >>= 1
+            lircframe.extend(chain.from_iterable(map(table.__getitem__, frame)))
             lircframe += self.ENDFRAME
+        if start:
+            _profile("lirc", self, start)
         return lircframe
 
+    def to_pulse_train(self, frames):
+        """Same as to_lirc, but returns a compact PulseTrain."""
+        return PulseTrain(self.to_lirc(frames))
+
+    def _broadlink_payload(self, frames):
+        """Return the Broadlink payload, before broadlink_wrap, of frames."""
+        table = broadlink_table(self.MARK, self.SPACE)
+        startframe = b"".join(map(broadlink_unit, self.STARTFRAME))
+        endframe = b"".join(map(broadlink_unit, self.ENDFRAME))
+        payload = []
+        for frame in frames:
+            payload.append(startframe)
+            payload.extend(map(table.__getitem__, frame))
+            payload.append(endframe)
+        return b"".join(payload)
+
     def to_broadlink(self, frames):
         """Transform a list of frames to a Broadlink compatible byte string."""
-        pulses = [int(x) for x in self.to_lirc(frames)]
-        array = bytearray()
-        for pulse in pulses:
-            pulse = round(pulse * 269 / 8192)  # 32.84ms units
+        start = _hooks and perf_counter()
+        code = broadlink_wrap(self._broadlink_payload(frames))
+        if start:
+            _profile("broadlink", self, start)
+        return code
+
+
+class IRacPool(object):
+    """A pool of IRremoteESP8266 IRac engines.
+
+    IRGHVAC devices borrow an engine only for the duration of build_ircode, so
+    many devices, and threads, can share a few engines. At most "size" engines
+    are created, borrowers wait when all of them are in use."""
+
+    # IRac.next fields set by IRGHVAC. They are reset when an engine is returned
+    FIELDS = (
+        "protocol",
+        "model",
+        "power",
+        "mode",
+        "degrees",
+        "fanspeed",
+        "swingv",
+        "swingh",
+        "quiet",
+        "turbo",
+        "econo",
+        "light",
+        "filter",
+        "clean",
+    )
+
+    def __init__(self, size=4):
+        self._size = size
+        self._idle = []
+        self._count = 0
+        self._cond = threading.Condition()
 
-            if pulse < 256:
-                array += bytearray(struct.pack(">B", pulse))  # big endian (1-byte)
+    @property
+    def size(self):
+        return self._size
+
+    @size.setter
+    def size(self, value):
+        with self._cond:
+            self._size = value
+            self._cond.notify_all()
+
+    def _new_engine(self):
+        # Why 4? Don't ask... in the lib is for some Arduino pin.
+        irac = irhvac_module().IRac(4)
+        defaults = {x: getattr(irac.next, x) for x in self.FIELDS}
+        return irac, defaults
+
+    @contextmanager
+    def engine(self):
+        """Borrow an IRac engine."""
+        with self._cond:
+            while not self._idle and self._count >= self._size:
+                self._cond.wait()
+            if self._idle:
+                irac, defaults = self._idle.pop()
             else:
-                array += bytearray([0x00])  # indicate next number is 2-bytes
-                array += bytearray(struct.pack(">H", pulse))  # big endian (2-bytes)
+                self._count += 1
+                irac = None
+        if irac is None:
+            try:
+                irac, defaults = self._new_engine()
+            except:
+                with self._cond:
+                    self._count -= 1
+                    self._cond.notify()
+                raise
+        try:
+            yield irac
+        finally:
+            _ = irac.resetTiming()
+            for x, y in defaults.items():
+                setattr(irac.next, x, y)
+            with self._cond:
+                if self._count > self._size:
+                    # Pool was shrunk
+                    self._count -= 1
+                else:
+                    self._idle.append((irac, defaults))
+                self._cond.notify()
+
 
-        packet = bytearray([0x26, 0x00])  # 0x26 = IR, 0x00 = no repeats
-        packet += bytearray(struct.pack("<H", len(array)))  # little endian byte count
-        packet += array
-        packet += bytearray([0x0D, 0x05])  # IR terminator
+# The process wide pool used by IRGHVAC devices
+irac_pool = IRacPool()
 
-        # Add 0s to make ultimate packet size a multiple of 16 for 128-bit AES encryption.
-        remainder = (
-            len(packet) + 4
-        ) % 16  # rm.send_data() adds 4-byte header (02 00 00 00)
-        if remainder:
-            packet += bytearray(16 - remainder)
 
-        return packet
+def _is_on(val):
+    return val == "on"
 
 
 class IRGHVAC(HVAC):
     """
     This is the main object handling IR code generated by IRremoteESP8266 library
+
+    Subclasses set protocol, and possibly variant, to the names of irhvac constants.
+    They are resolved, and the irhvac extension loaded, only when a code is generated.
     """
 
-    def __init__(self, protocol, variant=None):
-        self.brand = "Irgen"
-        self.model = "Irgen"
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry"],
-            "temperature": [x for x in range(18, 30)],
-        }
-        # For functions that require their own frames
-        self.xtra_capabilities = {}
+    __slots__ = ()
+
+    # For each status key, the IRac.next field it sets and how its value is
+    # translated: None (as is), bool ("on" or not) or a table of irhvac constants.
+    FIELDS = {
+        "mode": (
+            "mode",
+            {
+                "auto": "opmode_t_kAuto",
+                "cool": "opmode_t_kCool",
+                "dry": "opmode_t_kDry",
+                "fan": "opmode_t_kFan",
+                "heat": "opmode_t_kHeat",
+                "off": "opmode_t_kOff",
+            },
+        ),
+        "temperature": ("degrees", None),
+        "fan": (
+            "fanspeed",
+            {
+                "auto": "fanspeed_t_kAuto",
+                "highest": "fanspeed_t_kMax",
+                "high": "fanspeed_t_kHigh",
+                "midhigh": "fanspeed_t_kMediumHigh",
+                "medium": "fanspeed_t_kMedium",
+                "low": "fanspeed_t_kLow",
+                "lowest": "fanspeed_t_kMin",
+            },
+        ),
+        "swing": (
+            "swingv",
+            {
+                "auto": "swingv_t_kAuto",
+                "auto high": "swingv_t_kHigh",
+                "auto low": "swingv_t_kLow",
+                "ceiling": "swingv_t_kHighest",
+                "90°": "swingv_t_kHigh",
+                "60°": "swingv_t_kUpperMiddle",
+                "45°": "swingv_t_kMiddle",
+                "30°": "swingv_t_kLow",
+                "0°": "swingv_t_kLowest",
+                "off": "swingv_t_kOff",
+            },
+        ),
+        "hswing": (
+            "swingh",
+            {
+                "off": "swingh_t_kOff",
+                "left": "swingh_t_kLeft",
+                "close left": "swingh_t_kLeft",
+                "close middle": "swingh_t_kMiddle",
+                "right": "swingh_t_kRight",
+                "close right": "swingh_t_kRight",
+                "far left": "swingh_t_kLeftMax",
+                "far middle": "swingh_t_kMiddle",
+                "far right": "swingh_t_kRightMax",
+                "middle": "swingh_t_kMiddle",
+                "wide": "swingh_t_kWide",
+                "auto": "swingh_t_kAuto",
+            },
+        ),
+        "quiet": ("quiet", bool),
+        "powerful": ("turbo", bool),
+        "economy": ("econo", bool),
+        "light": ("light", bool),
+        "purifier": ("filter", bool),
+        "cleaning": ("clean", bool),
+    }
+
+    brand = "Irgen"
+    model = "Irgen"
+    protocol = None
+    variant = None
+
+    def __init__(self, protocol=None, variant=None):
         self.status = {"mode": "auto", "temperature": 25}
-        self.temperature_step = 1.0
-        self.irac = irhvac.IRac(
-            4
-        )  # Why 4? Don't ask... in the lib is for some Arduino pin.
-        self.protocol = protocol
-        self.variant = variant
-
         self.to_set = {}
-        # Specify whether the bits order has to be swapped
-        self.is_msb = False
+        # As set by subclasses without __slots__ before they were class attributes
+        if protocol is not None:
+            self.protocol = protocol
+        if variant is not None:
+            self.variant = variant
 
     def update_status(self):
         for x, y in self.to_set.items():
             self.status[x] = y
         self.to_set = {}
 
+    @classmethod
+    def setter_plan(cls):
+        """Return, for each status key, the IRac.next field to set and the function
+        translating the status value (None when the value is used as is).
+        It is compiled from FIELDS once per class."""
+        plan = cls.__dict__.get("_setter_plan")
+        if plan is None:
+            plan = {}
+            for key, (field, trans) in cls.FIELDS.items():
+                if trans is None:
+                    plan[key] = (field, None)
+                elif trans is bool:
+                    plan[key] = (field, _is_on)
+                else:
+                    table = {x: irhvac_constant(y) for x, y in trans.items()}
+                    plan[key] = (field, table.__getitem__)
+            cls._setter_plan = plan
+        return plan
+
+    def _translate(self, key, value):
+        field, trans = self.setter_plan()[key]
+        if trans is None:
+            return value
+        return trans(value)
+
     def trans_mode(self, mode):
-        trad = {
-            "auto": irhvac.opmode_t_kAuto,
-            "cool": irhvac.opmode_t_kCool,
-            "dry": irhvac.opmode_t_kDry,
-            "fan": irhvac.opmode_t_kFan,
-            "heat": irhvac.opmode_t_kHeat,
-            "off": irhvac.opmode_t_kOff,
-        }
-        return trad[mode]
+        return self._translate("mode", mode)
 
     def trans_temperature(self, temp):
-        return temp
+        return self._translate("temperature", temp)
 
     def trans_fan(self, fan):
-        trad = {
-            "auto": irhvac.fanspeed_t_kAuto,
-            "highest": irhvac.fanspeed_t_kMax,
-            "high": irhvac.fanspeed_t_kHigh,
-            "midhigh": irhvac.fanspeed_t_kMediumHigh,
-            "medium": irhvac.fanspeed_t_kMedium,
-            "low": irhvac.fanspeed_t_kLow,
-            "lowest": irhvac.fanspeed_t_kMin,
-        }
-
-        return trad[fan]
+        return self._translate("fan", fan)
 
     def trans_swing(self, swing):
-        trad = {
-            "auto": irhvac.swingv_t_kAuto,
-            "auto high": irhvac.swingv_t_kHigh,
-            "auto low": irhvac.swingv_t_kLow,
-            "ceiling": irhvac.swingv_t_kHighest,
-            "90°": irhvac.swingv_t_kHigh,
-            "60°": irhvac.swingv_t_kUpperMiddle,
-            "45°": irhvac.swingv_t_kMiddle,
-            "30°": irhvac.swingv_t_kLow,
-            "0°": irhvac.swingv_t_kLowest,
-            "off": irhvac.swingv_t_kOff,
-        }
-
-        return trad[swing]
+        return self._translate("swing", swing)
 
     def trans_hswing(self, swing):
-        trad = {
-            "off": irhvac.swingh_t_kOff,
-            "left": irhvac.swingh_t_kLeft,
-            "close left": irhvac.swingh_t_kLeft,
-            "close middle": irhvac.swingh_t_kMiddle,
-            "right": irhvac.swingh_t_kRight,
-            "close right": irhvac.swingh_t_kRight,
-            "far left": irhvac.swingh_t_kLeftMax,
-            "far middle": irhvac.swingh_t_kMiddle,
-            "far right": irhvac.swingh_t_kRightMax,
-            "middle": irhvac.swingh_t_kMiddle,
-            "wide": irhvac.swingh_t_kWide,
-            "auto": irhvac.swingh_t_kAuto,
-        }
-
-        return trad[swing]
+        return self._translate("hswing", swing)
 
     def trans_purifier(self, val):
-        return val == "on"
+        return self._translate("purifier", val)
 
     def trans_economy(self, val):
-        return val == "on"
+        return self._translate("economy", val)
 
     def trans_powerful(self, val):
-        return val == "on"
+        return self._translate("powerful", val)
 
     def trans_cleaning(self, val):
-        return val == "on"
+        return self._translate("cleaning", val)
 
     def trans_quiet(self, val):
-        return val == "on"
+        return self._translate("quiet", val)
 
     def trans_light(self, val):
-        return val == "on"
+        return self._translate("light", val)
 
     def trans_sleep(self, val):
         return val == "on"
@@ -339,60 +1019,184 @@ class IRGHVAC(HVAC):
             self.to_set["sleep"] = mode
 
     def to_lirc(self, frames):
+        start = _hooks and perf_counter()
         res = []
         for x in frames:
             res += x
+        if start:
+            _profile("lirc", self, start)
         return res
 
-    def build_ircode(self):
-        map = {
-            "mode": "mode",
-            "temperature": "degrees",
-            "fan": "fanspeed",
-            "swing": "swingv",
-            "hswing": "swingh",
-            "quiet": "quiet",
-            "powerful": "turbo",
-            "economy": "econo",
-            "light": "light",
-            "purifier": "filter",
-            "cleaning": "clean",
-        }
+    def to_broadlink(self, frames):
+        """Transform a list of frames to a Broadlink compatible byte string."""
+        start = _hooks and perf_counter()
+        code = broadlink_packet(list(chain.from_iterable(frames)))
+        if start:
+            _profile("broadlink", self, start)
+        return code
 
+    def build_ircode(self):
+        start = _hooks and perf_counter()
         self.update_status()
-
-        self.irac.next.protocol = getattr(irhvac, self.protocol)
-        if self.variant:
-            self.irac.next.model = self.variant
-        if self.status["mode"] == "off":
-            self.irac.next.power = False
+        if has_irhvac():
+            frames = self.irac_ircode()
         else:
-            self.irac.next.power = True
-        for k, v in self.status.items():
-            try:
-                setattr(self.irac.next, map[k], getattr(self, "trans_" + k)(v))
-            except Exception as e:
-                print(f"Error: Failed to set {k} to {v}: {e}")
-        self.irac.sendAc()
-        code = self.irac.getTiming()
-        _ = self.irac.resetTiming()
+            frames = self.codebook_ircode()
+        if start:
+            _profile("build", self, start)
+        return frames
+
+    def codebook_ircode(self):
+        """Return the frames for the status from the code book of the class.
+        Raise ValueError if the status is not in the book."""
+        from ..codebook import find_codebook
+
+        book = find_codebook(type(self))
+        if book is None:
+            raise ImportError(
+                f"irhvac is not available and there is no code book for {type(self).__name__}"
+            )
+        try:
+            return book.frames(self.status)
+        except KeyError as e:
+            raise ValueError(e.args[0]) from None
+
+    def irac_ircode(self):
+        """Return the frames for the status, generated by IRremoteESP8266."""
+        plan = self.setter_plan()
+        variant = self.variant
+        if isinstance(variant, str):
+            variant = irhvac_constant(variant)
+
+        with irac_pool.engine() as irac:
+            irac.next.protocol = irhvac_constant(self.protocol)
+            if variant:
+                irac.next.model = variant
+            if self.status["mode"] == "off":
+                irac.next.power = False
+            else:
+                irac.next.power = True
+            for k, v in self.status.items():
+                try:
+                    field, trans = plan[k]
+                    setattr(irac.next, field, v if trans is None else trans(v))
+                except Exception as e:
+                    print(f"Error: Failed to set {k} to {v}: {e}")
+            sent = _hooks and perf_counter()
+            irac.sendAc()
+            code = irac.getTiming()
+            _ = irac.resetTiming()
+            if sent:
+                _profile("irac", self, sent)
         return [code]
 
 
 class Manchester(IRGHVAC):
+    __slots__ = ()
+
     # Encoding is manchester"""
     LEAD = None
     HALFPULSE = 950
     STARTFRAME = [3 * 950, 3 * 950]
     ENDFRAME = [5 * 950]
+    # A 1 is sent as a mark then a space (G.E. Thomas convention)
+    GETHOMAS = True
+    # Durations are matched within TOLERANCE (relative) plus EXCESS µs
+    TOLERANCE = 0.25
+    EXCESS = 100
+
+    def _half_counts(self, pulse):
+        """Return, for each duration of pulse, the number of half periods, 1 or
+        2, it lasts. 0 when it is something else."""
+        half = self.HALFPULSE
+        np = numpy_module() if len(pulse) >= NUMPY_MIN_PULSES else None
+        if np is None:
+            counts = []
+            for duration in pulse:
+                n = round(duration / half)
+                if n in (1, 2) and _near(
+                    duration, n * half, self.TOLERANCE, self.EXCESS
+                ):
+                    counts.append(n)
+                else:
+                    counts.append(0)
+            return counts
+        durations = np.asarray(pulse, dtype=np.float64)
+        counts = np.rint(durations / half)
+        ok = np.abs(durations - counts * half) <= (
+            counts * half * self.TOLERANCE + self.EXCESS
+        )
+        counts[~ok | (counts < 1) | (counts > 2)] = 0
+        return counts.astype(np.int64)
+
+    def _extra_half(self, duration):
+        """Return True if duration is a header/footer timing extended by a half
+        period merged with the data."""
+        half = self.HALFPULSE
+        refs = (self.LEAD or []) + (self.STARTFRAME or []) + (self.ENDFRAME or [])
+        return any(
+            _near(duration - half, ref, 0, half * self.TOLERANCE + self.EXCESS)
+            and not _near(duration, ref, 0, half * self.TOLERANCE + self.EXCESS)
+            for ref in refs
+            if ref
+        )
 
     def decode_pulse(self, pulse, endian="msb"):
-        """Decode a pulse encoded with Manchester encoding."""
-        # TODO
-        return []
+        """Decode LIRC pulses, alternating marks and spaces, encoded with
+        Manchester encoding. Durations that are not 1 or 2 half periods (header,
+        footer, gaps) separate frames. A half period merged with a header or a
+        footer is given back to the frame.
+
+        With "msb" endian the first bit received is the most significant of its
+        byte, with "lsb" the least. Frames stop at the first invalid bit, their
+        last byte is padded with 0 and frames shorter than a byte are ignored.
+        Return a list of bytearray."""
+        counts = self._half_counts(pulse)
+        np = numpy_module() if len(pulse) >= NUMPY_MIN_PULSES else None
+        # Data runs between separators
+        if np is None:
+            seps = [i for i, n in enumerate(counts) if not n]
+        else:
+            seps = np.flatnonzero(counts == 0).tolist()
+        frames = []
+        start = 0
+        lead = []
+        for stop in seps + [len(pulse)]:
+            if np is None:
+                halves = lead[:]
+                for idx in range(start, stop):
+                    halves += [1 - idx % 2] * counts[idx]
+            else:
+                levels = 1 - np.arange(start, stop) % 2
+                halves = lead + np.repeat(levels, counts[start:stop]).tolist()
+            lead = []
+            if stop < len(pulse):
+                level = 1 - stop % 2
+                duration = pulse[stop]
+                if len(halves) % 2:
+                    # The separator starts with the last half of the frame
+                    halves.append(level)
+                    duration -= self.HALFPULSE
+                if self._extra_half(duration):
+                    lead = [level]
+            frames.append(halves)
+            start = stop + 1
+
+        result = []
+        for halves in frames:
+            bits = []
+            for first, second in zip(halves[0::2], halves[1::2]):
+                if first == second:
+                    break
+                bits.append(first if self.GETHOMAS else second)
+            if len(bits) >= 8:
+                result.append(pack_bits(bits, endian))
+        return result
 
 
 class PulseBased(IRGHVAC):
+    __slots__ = ()
+
     # Encoding is pulse length"""
     LEAD = None
     TAIL = None
@@ -400,30 +1204,90 @@ class PulseBased(IRGHVAC):
     ENDFRAME = None
     MARK = [0]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [0]  # ditto
+    # Durations are matched within TOLERANCE (relative) plus EXCESS µs
+    TOLERANCE = 0.25
+    EXCESS = 100
+
+    def _bits(self, pulse):
+        """Return, for each mark/space pair of pulse, the bit it encodes, -1 if
+        it does not encode a bit."""
+        m0, m1 = self.MARK[0], self.MARK[-1]
+        s0, s1 = self.SPACE[0], self.SPACE[-1]
+        tol, excess = self.TOLERANCE, self.EXCESS
+        np = numpy_module() if len(pulse) >= NUMPY_MIN_PULSES else None
+        if np is None:
+            bits = []
+            for idx in range(0, len(pulse) - 1, 2):
+                mark, space = pulse[idx], pulse[idx + 1]
+                one = _near(mark, m1, tol, excess) and _near(space, s1, tol, excess)
+                zero = _near(mark, m0, tol, excess) and _near(space, s0, tol, excess)
+                if one and zero:
+                    # Overlapping tolerances, the nearest wins
+                    one = abs(mark - m1) + abs(space - s1) < abs(mark - m0) + abs(
+                        space - s0
+                    )
+                    zero = not one
+                bits.append(1 if one else 0 if zero else -1)
+            return bits
+        pairs = np.asarray(pulse[: len(pulse) // 2 * 2], dtype=np.float64)
+        marks, spaces = pairs[0::2], pairs[1::2]
+        one = (np.abs(marks - m1) <= m1 * tol + excess) & (
+            np.abs(spaces - s1) <= s1 * tol + excess
+        )
+        zero = (np.abs(marks - m0) <= m0 * tol + excess) & (
+            np.abs(spaces - s0) <= s0 * tol + excess
+        )
+        both = one & zero
+        closer = np.abs(marks - m1) + np.abs(spaces - s1) < np.abs(marks - m0) + np.abs(
+            spaces - s0
+        )
+        one &= ~both | closer
+        zero &= ~one
+        return np.where(one, 1, np.where(zero, 0, -1))
 
     def decode_pulse(self, pulse, endian="msb"):
-        """Decode a pulse encoded with Manchester encoding."""
-        # TODO
-        return []
+        """Decode LIRC pulses, alternating marks and spaces, encoded with pulse
+        length. Mark/space pairs are matched against MARK and SPACE, any other
+        pair (start frame, end frame, gaps...) separates frames.
+
+        With "msb" endian the first bit received is the most significant of its
+        byte, as sent by generate_to_lirc, with "lsb" the least. The last byte of
+        a frame is padded with 0 and frames shorter than a byte are ignored.
+        Return a list of bytearray."""
+        bits = self._bits(pulse)
+        np = numpy_module() if len(pulse) >= NUMPY_MIN_PULSES else None
+        frames = []
+        if np is None:
+            run = []
+            for bit in bits + [-1]:
+                if bit >= 0:
+                    run.append(bit)
+                    continue
+                if len(run) >= 8:
+                    frames.append(pack_bits(run, endian))
+                run = []
+            return frames
+        valid = np.concatenate(([False], bits >= 0, [False]))
+        edges = np.flatnonzero(valid[1:] != valid[:-1])
+        bitorder = "little" if endian == "lsb" else "big"
+        for start, stop in zip(edges[0::2], edges[1::2]):
+            if stop - start >= 8:
+                packed = np.packbits(
+                    bits[start:stop].astype(np.uint8), bitorder=bitorder
+                )
+                frames.append(bytearray(packed.tobytes()))
+        return frames
 
     def generate_to_lirc(self, frames):
         """Transform a list of frames into a LIRC compatible list of pulse timing pairs."""
+        table = pulse_table(self.MARK, self.SPACE)
         lircframe = []
         if self.LEAD:
             lircframe += self.LEAD
         for frame in frames:
             if not self.STARTFRAME is None:
                 lircframe += self.STARTFRAME
-            for x in frame:
-                idx = 0x80
-                while idx:
-                    if x & idx:
-                        lircframe.append(self.MARK[-1])
-                        lircframe.append(self.SPACE[-1])
-                    else:
-                        lircframe.append(self.MARK[0])
-                        lircframe.append(self.SPACE[0])
-                    idx >>= 1
+            lircframe.extend(chain.from_iterable(map(table.__getitem__, frame)))
             if not self.ENDFRAME is None:
                 lircframe += self.ENDFRAME
         if self.TAIL:
@@ -431,6 +1295,431 @@ class PulseBased(IRGHVAC):
         return lircframe
 
 
+def state_snapshot(values):
+    """Return a hashable, order independent snapshot of a status/to_set dict."""
+    return tuple(sorted((k, type(v).__name__, v) for k, v in values.items()))
+
+
+class CodeCache(object):
+    """Bounded LRU cache of generated IR codes.
+
+    Entries are keyed on the device class, protocol, variant and a snapshot of
+    its "status" and "to_set". On a hit, the device state is moved along as if
+    build_ircode had been run, and the stored frames, LIRC timing or Broadlink
+    bytes are returned."""
+
+    OUTPUTS = ("frames", "lirc", "broadlink")
+
+    def __init__(self, maxsize=1024):
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        with self._lock:
+            self._maxsize = value
+            self._evict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, device):
+        return (
+            type(device),
+            getattr(device, "protocol", None),
+            getattr(device, "variant", None),
+            state_snapshot(device.status),
+            state_snapshot(device.to_set),
+        )
+
+    def _evict(self):
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, device, output="frames"):
+        """Return the code of the device current state, in the requested output
+        format: "frames", "lirc" or "broadlink"."""
+        if output not in self.OUTPUTS:
+            raise ValueError(f"Unknown output format {output}")
+        key = self.key(device)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+
+        if entry is None:
+            frames = device.build_ircode()
+            entry = {
+                "frames": [f[:] for f in frames],
+                "status": dict(device.status),
+                "to_set": dict(device.to_set),
+            }
+            with self._lock:
+                self._entries[key] = entry
+                self._evict()
+        else:
+            device.status = dict(entry["status"])
+            device.to_set = dict(entry["to_set"])
+
+        if output not in entry:
+            if output == "lirc":
+                entry[output] = tuple(device.to_lirc(entry["frames"]))
+            else:
+                entry[output] = device.to_broadlink(entry["frames"])
+        if output == "frames":
+            return [f[:] for f in entry["frames"]]
+        elif output == "lirc":
+            return list(entry["lirc"])
+        return entry[output]
+
+    def build_ircode(self, device):
+        return self.get(device, "frames")
+
+    def to_lirc(self, device):
+        return self.get(device, "lirc")
+
+    def to_broadlink(self, device):
+        return self.get(device, "broadlink")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self._maxsize,
+        }
+
+
+def apply_state(device, state):
+    """Set the values in the state dict on device. The mode is set last."""
+    for name, value in state.items():
+        if name != "mode":
+            device.set_value(name, value)
+    if "mode" in state:
+        device.set_mode(state["mode"])
+
+
+def generate_codes(requests, output="frames", cache=None, chunksize=256):
+    """Generate the codes for an iterable of (brand, model, state) requests.
+
+    Each state, a dict of values ("mode", "temperature", "fan"...), is applied
+    to a new device of the model. output is one of "frames", "lirc" or
+    "broadlink". Requests are read chunksize at a time and grouped by device
+    class, sharing cache (a CodeCache, created if None).
+
+    Yields (request, result) in the requests order. When a code cannot be
+    generated, result is the exception raised."""
+    if cache is None:
+        cache = CodeCache()
+    classes = {}
+    requests = iter(requests)
+    while True:
+        chunk = list(islice(requests, chunksize))
+        if not chunk:
+            break
+        results = [None] * len(chunk)
+        groups = {}
+        for idx, (brand, model, state) in enumerate(chunk):
+            try:
+                if (brand, model) not in classes:
+                    device = registry.get_plugin(brand).get_device(model)
+                    classes[(brand, model)] = type(device)
+                groups.setdefault(classes[(brand, model)], []).append(idx)
+            except Exception as e:
+                results[idx] = e
+        for cls, idxs in groups.items():
+            for idx in idxs:
+                try:
+                    device = cls()
+                    apply_state(device, chunk[idx][2])
+                    results[idx] = cache.get(device, output)
+                except Exception as e:
+                    results[idx] = e
+        yield from zip(chunk, results)
+
+
+# State grids. The frame of each state is resolved and packed by a device, the
+# frames of all the states are then checksummed and converted at once, with
+# NumPy.
+_GRID_RECORDERS = {}
+
+
+def _numpy_required():
+    np = numpy_module()
+    if np is None:
+        raise ImportError("State grids need NumPy (pip3 install pyhvac[numpy]).")
+    return np
+
+
+def _column(values):
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def grid_states(space):
+    """Return, for space a list of (name, values), the columns, as a dict of
+    NumPy arrays, of every combination of the values. The first name varies
+    the slowest, as with itertools.product."""
+    np = _numpy_required()
+    count = prod(len(values) for _, values in space)
+    states = {}
+    inner = count
+    for name, values in space:
+        column = np.empty(len(values), dtype=object)
+        column[:] = list(values)
+        if count:
+            inner //= len(values)
+            column = np.tile(np.repeat(column, inner), count // (inner * len(values)))
+        states[name] = column
+    return states
+
+
+def _grid_recorder(cls):
+    """Return a subclass of cls whose build_frame only packs the frames, and
+    appends them to its packed list, as words. It returns GRID_MARKER, the
+    template followed by a wrong checksum: no other frame can be equal to it."""
+    try:
+        return _GRID_RECORDERS[cls]
+    except KeyError:
+        pass
+    template = cls.LAYOUT.template
+    marker = template + bytes([(cls.CHECKSUM.value(template) + 1) & 0xFF])
+
+    def __init__(self):
+        cls.__init__(self)
+        self.packed = []
+
+    def build_frame(self, values):
+        self.packed.append(self.LAYOUT.pack(values))
+        return bytearray(marker)
+
+    recorder = type(
+        cls.__name__,
+        (cls,),
+        {
+            "__slots__": ("packed",),
+            "__init__": __init__,
+            "build_frame": build_frame,
+            "GRID_MARKER": marker,
+        },
+    )
+    _GRID_RECORDERS[cls] = recorder
+    return recorder
+
+
+class StateGrid(object):
+    """The codes of many states of a native device class, one with a LAYOUT and
+    a CHECKSUM, generated at once. NumPy is needed.
+
+    states is a dict of columns, sequences of the same length, with the value
+    of each key for each state (None for a key not set), see grid_states. Each
+    state is applied to a new device, which resolves and packs the frame
+    values. The checksums and the bit order of the LAYOUT frames are then
+    computed as array operations: rows is the 2-D uint8 array of those frames,
+    as sent, one row per state (zeros when the code has none). The other
+    frames of the codes are those of the device, codes with several LAYOUT
+    frames are built by the device. valid tells whether the code of each state
+    could be generated."""
+
+    def __init__(self, cls, states):
+        if cls.LAYOUT is None or cls.CHECKSUM is None:
+            raise ValueError(f"{cls.__name__} has no frame layout.")
+        np = _numpy_required()
+        self.cls = cls
+        names = list(states)
+        columns = [_column(states[x]) for x in names]
+        self.count = len(columns[0]) if columns else 0
+        if any(len(x) != self.count for x in columns):
+            raise ValueError("The state columns must have the same length.")
+        recorder = _grid_recorder(cls)
+        marker = recorder.GRID_MARKER
+        # The frames before and after the LAYOUT frame, and whether the code
+        # has one, of each code shape
+        self.shapes = []
+        shapes = {}
+        shape = [-1] * self.count
+        indices = []
+        words = []
+        last = None
+        for idx, row in enumerate(zip(*columns)):
+            state = {x: y for x, y in zip(names, row) if y is not None}
+            try:
+                device = recorder()
+                apply_state(device, state)
+                frames = device._build_ircode()
+                packed = device.packed
+                if packed and (len(packed) != 1 or frames.count(marker) != 1):
+                    device = cls()
+                    apply_state(device, state)
+                    frames = device._build_ircode()
+                    packed = None
+            except Exception:
+                continue
+            # Consecutive states mostly have codes of the same shape
+            if frames != last:
+                last = frames
+                if not packed:
+                    key = (tuple(map(bytes, frames)), (), False)
+                else:
+                    at = frames.index(marker)
+                    key = (
+                        tuple(map(bytes, frames[:at])),
+                        tuple(map(bytes, frames[at + 1 :])),
+                        True,
+                    )
+                if key not in shapes:
+                    shapes[key] = len(self.shapes)
+                    before, after, has_layout = key
+                    if cls.is_msb:
+                        before = tuple(bytes(reverse_frame(f)) for f in before)
+                        after = tuple(bytes(reverse_frame(f)) for f in after)
+                    self.shapes.append((before, after, has_layout))
+                current = shapes[key]
+            shape[idx] = current
+            if packed:
+                indices.append(idx)
+                words.append(packed[0])
+        size = len(cls.LAYOUT.template)
+        self.rows = np.zeros((self.count, size + 1), np.uint8)
+        if words:
+            frames = np.frombuffer(
+                b"".join([x.to_bytes(size, "big") for x in words]), np.uint8
+            ).reshape(len(words), size)
+            checksum = cls.CHECKSUM._batch(frames).astype(np.uint8)
+            rows = np.concatenate((frames, checksum[:, None]), axis=1)
+            if cls.is_msb:
+                rows = np.frombuffer(BIT_REVERSE, np.uint8)[rows]
+            self.rows[indices] = rows
+        self.shape = np.array(shape, dtype=np.intp)
+        self.valid = self.shape >= 0
+
+    def _groups(self):
+        """Yield the code shapes and the indices of their states."""
+        np = numpy_module()
+        for idx in range(len(self.shapes)):
+            yield idx, np.flatnonzero(self.shape == idx)
+
+    def frames(self):
+        """Return, for each state, its frames as build_ircode does, None when
+        its code could not be generated."""
+        result = [None] * self.count
+        data = self.rows.tobytes()
+        size = self.rows.shape[1]
+        for shape, indices in self._groups():
+            before, after, has_layout = self.shapes[shape]
+            for idx in indices.tolist():
+                frames = [bytearray(f) for f in before]
+                if has_layout:
+                    frames.append(bytearray(data[idx * size : (idx + 1) * size]))
+                    frames += [bytearray(f) for f in after]
+                result[idx] = frames
+        return result
+
+    def _native(self, method):
+        """Whether the conversion method of the class is that of HVAC, which
+        StateGrid vectorizes."""
+        return getattr(self.cls, method) is getattr(HVAC, method)
+
+    def _codes(self, shape, indices, table, convert, start, end):
+        """Return the codes of the states indices, of the same shape, as the
+        rows of a 2-D array. The bytes of the LAYOUT frames are looked up in
+        table, an array of 256 rows, the other frames are converted with
+        convert(frames). start and end are the converted STARTFRAME and
+        ENDFRAME."""
+        np = numpy_module()
+
+        def constant(code):
+            code = np.asarray(code, table.dtype)
+            return np.broadcast_to(code, (len(indices), len(code)))
+
+        before, after, has_layout = self.shapes[shape]
+        if not has_layout:
+            return constant(convert(before))
+        body = table[self.rows[indices]].reshape(len(indices), -1)
+        return np.concatenate(
+            (constant(convert(before) + start), body, constant(end + convert(after))),
+            axis=1,
+        )
+
+    def to_lirc(self):
+        """Return, for each state, the LIRC pulses of its code as to_lirc does,
+        as a NumPy array, None when its code could not be generated."""
+        device = self.cls()
+        if not self._native("to_lirc"):
+            return [None if x is None else device.to_lirc(x) for x in self.frames()]
+        np = numpy_module()
+        table = np.array(pulse_table(self.cls.MARK, self.cls.SPACE), np.int64)
+        result = [None] * self.count
+        for shape, indices in self._groups():
+            codes = self._codes(
+                shape,
+                indices,
+                table,
+                device.to_lirc,
+                self.cls.STARTFRAME,
+                self.cls.ENDFRAME,
+            )
+            for idx, pulses in zip(indices.tolist(), codes):
+                result[idx] = pulses
+        return result
+
+    def to_broadlink(self):
+        """Return, for each state, the Broadlink code as to_broadlink does, None
+        when its code could not be generated."""
+        device = self.cls()
+        fragments = broadlink_table(self.cls.MARK, self.cls.SPACE)
+        width = len(fragments[0])
+        if (
+            not self._native("to_broadlink")
+            or not self._native("_broadlink_payload")
+            or any(len(x) != width for x in fragments)
+        ):
+            # Otherwise codes of the same shape have the same size
+            return [
+                None if x is None else device.to_broadlink(x) for x in self.frames()
+            ]
+        np = numpy_module()
+        table = np.frombuffer(b"".join(fragments), np.uint8).reshape(256, width)
+        result = [None] * self.count
+        for shape, indices in self._groups():
+            payloads = self._codes(
+                shape,
+                indices,
+                table,
+                lambda frames: list(device._broadlink_payload(frames)),
+                [x for y in map(broadlink_unit, self.cls.STARTFRAME) for x in y],
+                [x for y in map(broadlink_unit, self.cls.ENDFRAME) for x in y],
+            )
+            size = payloads.shape[1]
+            packet = np.frombuffer(broadlink_wrap(bytes(size)), np.uint8)
+            packets = np.empty((len(indices), len(packet)), np.uint8)
+            packets[:] = packet
+            packets[:, 4 : 4 + size] = payloads
+            data = packets.tobytes()
+            for n, idx in enumerate(indices.tolist()):
+                result[idx] = data[n * len(packet) : (n + 1) * len(packet)]
+        return result
+
+
 class GenPluginObject(object):
     MODELS = {"generic": HVAC}
 
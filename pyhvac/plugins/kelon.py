@@ -27,37 +27,38 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Kelon(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [9000, 4600]
     ENDFRAME = None
     MARK = [560]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [600, 1680]  # ditto
 
-    def __init__(self):
-        super().__init__("KELON")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [18, 32],
-            "fan": ["auto", "high", "medium", "low"],
-            "sleep": ["off", "on"],
-        }
+    protocol = "KELON"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [18, 32],
+        "fan": ["auto", "high", "medium", "low"],
+        "sleep": ["off", "on"],
+    }
 
 
 class Kelon168(PulseBased):
+    __slots__ = ()
+
     # Not yet exposed
     STARTFRAME = [9000, 4600]
     ENDFRAME = [560, 8000]
     MARK = [560]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [600, 1680]  # ditto
 
-    def __init__(self):
-        super().__init__("KELON168")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [18, 32],
-            "fan": ["auto", "high", "medium", "low"],
-            "sleep": ["off", "on"],
-        }
+    protocol = "KELON168"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [18, 32],
+        "fan": ["auto", "high", "medium", "low"],
+        "sleep": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
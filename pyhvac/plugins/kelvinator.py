@@ -27,26 +27,26 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Kelvinator(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [9010, 4505]
     ENDFRAME = [600, 19975]
     MARK = [680]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [510, 1530]  # ditto
 
-    def __init__(self):
-        super().__init__("KELVINATOR")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": ["off", "on"],
-            "purifier": ["off", "on"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-            "cleaning": ["off", "on"],
-            "light": ["off", "on"],
-        }
+    protocol = "KELVINATOR"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": ["off", "on"],
+        "purifier": ["off", "on"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+        "cleaning": ["off", "on"],
+        "light": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
@@ -28,35 +28,63 @@
 
 import struct
 
-from .hvaclib import HVAC, PulseBased, GenPluginObject
-from ..irhvac import GE6711AR2853M, LG6711A20083V, AKB75215403, AKB74955603, AKB73757604
+from .hvaclib import HVAC, Checksum, FrameLayout, PulseBased, GenPluginObject
 
 
 class LG(HVAC):
     """Generic LG HVAC object. It must have, at the very minimum
     "mode" and "temperature" capabilities"""
 
+    __slots__ = ()
+
     STARTFRAME = [3100, 9850]
     ENDFRAME = [520, 12000]
     MARK = [520]
     SPACE = [520, 1530]
 
+    brand = "LG"
+    model = "Generic"
+    capabilities = {
+        "mode": ["off", "cool", "fan", "dry"],
+        "temperature": range(18, 30),
+    }
+    # For functions that require their own frames
+    xtra_capabilities = {}
+    # Specify wether the bits order has to be swapped
+    is_msb = False
+    # Sum of the nibbles, in the high nibble
+    CHECKSUM = Checksum(
+        [(x >> 4) + (x & 0x0F) for x in range(256)],
+        [(x & 0x0F) << 4 for x in range(256)],
+    )
+    FBODY = b"\x88\x00\x00"
+    FAN_CODES = {
+        "lowest": 0x0,
+        "low": 0x09,
+        "medium": 0x02,
+        "high": 0x0A,
+        "highest": 0x04,
+        "auto": 0x05,
+    }
+    MODE_CODES = {"auto": 0x03, "cool": 0x00, "dry": 0x01, "fan": 0x02}
+    LAYOUT = FrameLayout(
+        FBODY,
+        (
+            ("temperature", 2, 0xF0, lambda temp: (temp - 15) << 4, "or"),
+            ("fan", 2, 0x0F, FAN_CODES, "or"),
+            ("mode", 1, 0x07, MODE_CODES, "or"),
+            ("running", 1, 0x08, {True: 0x08}, "or"),
+            # Off replaces values
+            ("mode", 1, 0xFF, {"off": 0xC0}, "replace"),
+            ("mode", 2, 0xFF, {"off": 0x05}, "replace"),
+        ),
+    )
+
     def __init__(self):
         super().__init__()
-        self.brand = "LG"
-        self.model = "Generic"
-        self.capabilities = {
-            "mode": ["off", "cool", "fan", "dry"],
-            "temperature": [x for x in range(18, 30)],
-        }
-        # For functions that require their own frames
-        self.xtra_capabilities = {}
         self.status = {"mode": "off", "temperature": 25}
 
         self.to_set = {}
-        # Specify wether the bits order has to be swapped
-        self.is_msb = False
-        self.FBODY = b"\x88\x00\x00"
 
     def set_temperature(self, temp):
         if temp < self.capabilities["temperature"][0]:
@@ -66,7 +94,7 @@ class LG(HVAC):
         if temp != self.status["temperature"]:
             self.to_set["temperature"] = temp
 
-    def code_temperature(self):
+    def value_temperature(self):
         if "temperature" in self.to_set:
             temp = self.to_set["temperature"]
         else:
@@ -96,9 +124,7 @@ class LG(HVAC):
                 temp = 17
         elif mode == "dry":
             temp = 24
-        mask = bytearray(b"\x00" * 3)
-        mask[2] = (temp - 15) << 4
-        return mask, False
+        return temp
 
     def set_auto_bias(self, mode):
         if "auto_bias" not in self.capabilities:
@@ -116,7 +142,7 @@ class LG(HVAC):
         if self.status["fan"] != mode:
             self.to_set["fan"] = mode
 
-    def code_fan(self):
+    def value_fan(self):
         """mode is one of auto, lowest, low, medium, high, highest"""
         if "fan" in self.to_set:
             fmode = self.to_set["fan"]
@@ -125,14 +151,6 @@ class LG(HVAC):
                 fmode = self.status["fan"]
             else:
                 fmode = "auto"
-        rank = {
-            "lowest": 0x0,
-            "low": 0x09,
-            "medium": 0x02,
-            "high": 0x0A,
-            "highest": 0x04,
-            "auto": 0x05,
-        }
 
         if "mode" in self.to_set:
             mode = self.to_set["mode"]
@@ -141,11 +159,9 @@ class LG(HVAC):
 
         if mode == "auto":
             fmode = "auto"
-        if fmode not in rank:
+        if fmode not in self.FAN_CODES:
             fmode = "auto"  # Just in case
-        mask = bytearray(b"\x00" * 3)
-        mask[2] = rank[fmode]
-        return mask, False
+        return fmode
 
     def set_swing(self, mode):
         if "swing" not in self.xtra_capabilities:
@@ -318,43 +334,34 @@ class LG(HVAC):
         if mode != self.status["mode"]:
             self.to_set["mode"] = mode
 
-    def code_mode(self):
+    def value_mode(self):
         if "mode" in self.to_set:
             mode = self.to_set["mode"]
         else:
             mode = self.status["mode"]
+        return mode
 
-        mask = bytearray(b"\x88\x00\x00")
-        if mode == "off":
-            return bytearray(b"\x00\xc0\x05"), True
-        if self.status["mode"] != "off":
-            addit = 8
-        else:
-            addit = 0
-        mask = bytearray(b"\x00\x00\x00")
-        if mode == "auto":
-            mask[1] = 3 + addit
-        elif mode == "cool":
-            mask[1] = addit
-        elif mode == "dry":
-            mask[1] = 1 + addit
-        elif mode == "fan":
-            mask[1] = 2 + addit
-
-        return mask, False
+    def frame_values(self):
+        """Return the field values, for LAYOUT, of the frame to send."""
+        mode = self.value_mode()
+        return {
+            "temperature": self.value_temperature(),
+            "fan": self.value_fan(),
+            "mode": mode,
+            # Changing the mode of a running unit
+            "running": mode in self.MODE_CODES and self.status["mode"] != "off",
+        }
 
-    def build_code(self):
+    def build_code(self, checksum=False):
+        """With checksum, frames are followed by their checksum. See build_frame."""
         frames = []
-        packet = bytearray(self.FBODY)
         # Note that set mod must be last for it replaces values
         if {"mode", "temperature", "fan"}.intersection(set(self.to_set.keys())):
-            for f in [self.code_temperature, self.code_fan, self.code_mode]:
-                mask, replace = f()
-                if replace:
-                    packet = bytearray([y or x for x, y in zip(packet, mask)])
-                else:
-                    packet = bytearray([x | y for x, y in zip(packet, mask)])
-            frames += [packet]
+            if checksum:
+                frames += [self.build_frame(self.frame_values())]
+            else:
+                frames += [self.LAYOUT.build(self.frame_values())]
+        first = len(frames)
         if "mode" in self.to_set:
             mode = self.to_set["mode"]
         else:
@@ -367,23 +374,18 @@ class LG(HVAC):
                     f = getattr(self, "code_" + prop, None)
                     if f:
                         frames.append(f())
+        if checksum:
+            for idx in range(first, len(frames)):
+                frames[idx] += self.crc(frames[idx])
         return frames
 
     def _build_ircode(self):
         frames = []
-        frames += self.build_code()
-        idx = 0
-        for x in frames:
-            frames[idx] += self.crc(x)
-            idx += 1
+        frames += self.build_code(checksum=True)
         return frames
 
     def crc(self, frame):
-        crc = 0
-        for x in frame:
-            crc += (x & 0xF0) >> 4
-            crc += x & 0x0F
-        return ((crc & 0x0F) << 4).to_bytes(1, "big")
+        return self.CHECKSUM.value(frame).to_bytes(1, "big")
 
     def get_timing(self):
         # Well LG is different
@@ -398,21 +400,24 @@ class LG(HVAC):
 
 
 class InverterV(LG):
+    __slots__ = ()
+
+    model = "Inverter V"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry"],
+        "temperature": range(16, 30),
+        "auto_bias": ["-2", "-1", "default", "+1", "+2"],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+    }
+    xtra_capabilities = {
+        "swing": ["off", "swing", "90°", "0°"],
+        "powerful": ["off", "on"],
+        "cleaning": ["off", "on"],
+        "economy": ["off", "80", "60", "40"],
+    }
+
     def __init__(self):
         super().__init__()
-        self.model = "Inverter V"
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry"],
-            "temperature": [x for x in range(16, 30)],
-            "auto_bias": ["-2", "-1", "default", "+1", "+2"],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-        }
-        self.xtra_capabilities = {
-            "swing": ["off", "swing", "90°", "0°"],
-            "powerful": ["off", "on"],
-            "cleaning": ["off", "on"],
-            "economy": ["off", "80", "60", "40"],
-        }
         self.status = {
             "mode": "off",
             "temperature": 25,
@@ -426,34 +431,37 @@ class InverterV(LG):
 
 
 class DualInverter(LG):
+    __slots__ = ()
+
+    model = "Dual Imverter"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry"],
+        "temperature": range(16, 30),
+        "auto_bias": ["-2", "-1", "default", "+1", "+2"],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+    }
+    xtra_capabilities = {
+        "swing": ["off", "swing", "ceiling", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": [
+            "off",
+            "swing",
+            "left",
+            "centre left",
+            "centre",
+            "centre right",
+            "right",
+            "swing left",
+            "swing right",
+        ],
+        "powerful": ["off", "on"],
+        "purifier": ["off", "on"],
+        "cleaning": ["off", "on"],
+        "economy": ["off", "80", "60", "40"],
+        "diagnostic": ["off", "on"],
+    }
+
     def __init__(self):
         super().__init__()
-        self.model = "Dual Imverter"
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry"],
-            "temperature": [x for x in range(16, 30)],
-            "auto_bias": ["-2", "-1", "default", "+1", "+2"],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-        }
-        self.xtra_capabilities = {
-            "swing": ["off", "swing", "ceiling", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": [
-                "off",
-                "swing",
-                "left",
-                "centre left",
-                "centre",
-                "centre right",
-                "right",
-                "swing left",
-                "swing right",
-            ],
-            "powerful": ["off", "on"],
-            "purifier": ["off", "on"],
-            "cleaning": ["off", "on"],
-            "economy": ["off", "80", "60", "40"],
-            "diagnostic": ["off", "on"],
-        }
         self.status = {
             "mode": "off",
             "temperature": 25,
@@ -469,98 +477,103 @@ class DualInverter(LG):
 
 
 class LGv1(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [8500, 4250]
     ENDFRAME = [400, 39750]
     MARK = [400]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [430, 1260]  # ditto
 
-    def __init__(self):
-        super().__init__("LG", variant=GE6711AR2853M)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 25],
-            "fan": ["auto", "high", "medium", "low", "lowest"],
-            "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": ["off", "on"],
-            "light": ["off", "on"],
-        }
+    protocol = "LG"
+    variant = "GE6711AR2853M"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 25],
+        "fan": ["auto", "high", "medium", "low", "lowest"],
+        "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": ["off", "on"],
+        "light": ["off", "on"],
+    }
 
 
 class LGv2(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [8500, 4250]
     ENDFRAME = [400, 39750]
     MARK = [400]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [430, 1260]  # ditto
 
-    def __init__(self):
-        super().__init__("LG", variant=LG6711A20083V)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 25],
-            "fan": ["auto", "high", "medium", "low", "lowest"],
-            "swing": ["off", "on"],
-            "hswing": ["off", "on"],
-            "light": ["off", "on"],
-        }
+    protocol = "LG"
+    variant = "LG6711A20083V"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 25],
+        "fan": ["auto", "high", "medium", "low", "lowest"],
+        "swing": ["off", "on"],
+        "hswing": ["off", "on"],
+        "light": ["off", "on"],
+    }
 
 
 class LG2v1(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3200, 9900]
     ENDFRAME = [400, 39750]
     MARK = [480]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [430, 1260]  # ditto
 
-    def __init__(self):
-        super().__init__("LG2", variant=AKB75215403)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 25],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": ["off", "on"],
-            "light": ["off", "on"],
-        }
+    protocol = "LG2"
+    variant = "AKB75215403"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 25],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": ["off", "on"],
+        "light": ["off", "on"],
+    }
 
 
 class LG2v2(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3200, 9900]
     ENDFRAME = [400, 39750]
     MARK = [480]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [430, 1260]  # ditto
 
-    def __init__(self):
-        super().__init__("LG2", variant=AKB74955603)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 25],
-            "fan": ["auto", "high", "medium", "low", "lowest"],
-            "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": ["off", "on"],
-            "light": ["off", "on"],
-        }
+    protocol = "LG2"
+    variant = "AKB74955603"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 25],
+        "fan": ["auto", "high", "medium", "low", "lowest"],
+        "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": ["off", "on"],
+        "light": ["off", "on"],
+    }
 
 
 class LG2v3(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3200, 9900]
     ENDFRAME = [400, 39750]
     MARK = [480]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [430, 1260]  # ditto
 
-    def __init__(self):
-        super().__init__("LG2", variant=AKB73757604)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 25],
-            "fan": ["auto", "high", "medium", "low", "lowest"],
-            "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": ["off", "on"],
-            "light": ["off", "on"],
-        }
+    protocol = "LG2"
+    variant = "AKB73757604"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 25],
+        "fan": ["auto", "high", "medium", "low", "lowest"],
+        "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": ["off", "on"],
+        "light": ["off", "on"],
+    }
 
 
 class PluginObject(GenPluginObject):
@@ -28,26 +28,26 @@ from .coolix import Coolix
 
 
 class Midea(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [4480, 4480]
     ENDFRAME = [560, 5600]
     MARK = [560]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [560, 1680]  # ditto
 
-    def __init__(self):
-        super().__init__("MIDEA")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [17, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "powerful": ["off", "on"],
-            "quiet": ["off", "on"],
-            "economy": ["off", "on"],
-            "light": ["off", "on"],
-            "cleaning": ["off", "on"],
-            "sleep": ["off", "on"],
-        }
+    protocol = "MIDEA"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [17, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "powerful": ["off", "on"],
+        "quiet": ["off", "on"],
+        "economy": ["off", "on"],
+        "light": ["off", "on"],
+        "cleaning": ["off", "on"],
+        "sleep": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
@@ -24,51 +24,52 @@
 #
 
 from .hvaclib import PulseBased, GenPluginObject
-from ..irhvac import KKG9AC1, KKG29AC1
 
 
 class Miragev1(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [8360, 4248]
     ENDFRAME = [554, 20000]
     MARK = [554]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [545, 1592]  # ditto
 
-    def __init__(self):
-        super().__init__("MIRAGE", variant=KKG9AC1)
-        self.capabilities = {
-            "mode": ["off", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 32],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
-            "powerful": ["off", "on"],
-            "sleep": ["off", "on"],
-            "light": ["off", "on"],
-        }
+    protocol = "MIRAGE"
+    variant = "KKG9AC1"
+    capabilities = {
+        "mode": ["off", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 32],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
+        "powerful": ["off", "on"],
+        "sleep": ["off", "on"],
+        "light": ["off", "on"],
+    }
 
 
 class Miragev2(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [8360, 4248]
     ENDFRAME = [554, 20000]
     MARK = [554]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [545, 1592]  # ditto
 
-    def __init__(self):
-        super().__init__("MIRAGE", variant=KKG29AC1)
-        self.capabilities = {
-            "mode": ["off", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 32],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": ["off", "on"],
-            "powerful": ["off", "on"],
-            "sleep": ["off", "on"],
-            "light": ["off", "on"],
-            "quiet": ["off", "on"],
-            "cleaning": ["off", "on"],
-            "purifier": ["off", "on"],
-        }
+    protocol = "MIRAGE"
+    variant = "KKG29AC1"
+    capabilities = {
+        "mode": ["off", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 32],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": ["off", "on"],
+        "powerful": ["off", "on"],
+        "sleep": ["off", "on"],
+        "light": ["off", "on"],
+        "quiet": ["off", "on"],
+        "cleaning": ["off", "on"],
+        "purifier": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
@@ -27,75 +27,75 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Mitsubishi(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3400, 1750]
     ENDFRAME = [440, 15500]
     MARK = [450]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [420, 1300]  # ditto
 
-    def __init__(self):
-        super().__init__("MITSUBISHI_AC")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 31],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": [
-                "auto",
-                "wide",
-                "far right",
-                "right",
-                "middle",
-                "left",
-                "far left",
-            ],
-        }
-        self.temperature_step = 0.5
+    protocol = "MITSUBISHI_AC"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 31],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": [
+            "auto",
+            "wide",
+            "far right",
+            "right",
+            "middle",
+            "left",
+            "far left",
+        ],
+    }
+    temperature_step = 0.5
 
 
 class Mitsubishi136(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3324, 1474]
     ENDFRAME = None
     MARK = [467]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [351, 1137]  # ditto
 
-    def __init__(self):
-        super().__init__("MITSUBISHI136")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
-            "temperature": [16, 25],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["off", "auto", "90°", "60°", "30°", "0°"],
-            "quiet": ["off", "on"],
-        }
+    protocol = "MITSUBISHI136"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry", "heat"],
+        "temperature": [16, 25],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["off", "auto", "90°", "60°", "30°", "0°"],
+        "quiet": ["off", "on"],
+    }
 
 
 class Mitsubishi112(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3450, 1696]
     ENDFRAME = None
     MARK = [450]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [385, 1250]  # ditto
 
-    def __init__(self):
-        super().__init__("MITSUBISHI112")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat"],
-            "temperature": [16, 25],
-            "fan": ["highest", "medium", "low", "lowest"],
-            "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": [
-                "auto",
-                "wide",
-                "far right",
-                "right",
-                "middle",
-                "left",
-                "far left",
-            ],
-            "quiet": ["off", "on"],
-        }
+    protocol = "MITSUBISHI112"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat"],
+        "temperature": [16, 25],
+        "fan": ["highest", "medium", "low", "lowest"],
+        "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": [
+            "auto",
+            "wide",
+            "far right",
+            "right",
+            "middle",
+            "left",
+            "far left",
+        ],
+        "quiet": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
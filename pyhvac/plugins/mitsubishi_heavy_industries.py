@@ -27,64 +27,64 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Mitsubishi152(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3140, 1630]
     ENDFRAME = None
     MARK = [370]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [1220, 420]  # ditto
 
-    def __init__(self):
-        super().__init__("MITSUBISHI_HEAVY_152")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
-            "temperature": [17, 31],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": [
-                "auto",
-                "wide",
-                "far right",
-                "right",
-                "middle",
-                "left",
-                "far left",
-            ],
-            "quiet": ["off", "on"],
-            "sleep": ["off", "on"],
-            "purifier": ["off", "on"],
-            "cleaning": ["off", "on"],
-            "powerful": ["off", "on"],
-            "economy": ["off", "on"],
-        }
+    protocol = "MITSUBISHI_HEAVY_152"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "fan", "heat"],
+        "temperature": [17, 31],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": [
+            "auto",
+            "wide",
+            "far right",
+            "right",
+            "middle",
+            "left",
+            "far left",
+        ],
+        "quiet": ["off", "on"],
+        "sleep": ["off", "on"],
+        "purifier": ["off", "on"],
+        "cleaning": ["off", "on"],
+        "powerful": ["off", "on"],
+        "economy": ["off", "on"],
+    }
 
 
 class Mitsubishi88(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3140, 1630]
     ENDFRAME = None
     MARK = [370]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [1220, 420]  # ditto
 
-    def __init__(self):
-        super().__init__("MITSUBISHI_HEAVY_88")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat"],
-            "temperature": [17, 31],
-            "fan": ["highest", "medium", "low", "lowest"],
-            "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": [
-                "off",
-                "auto",
-                "far right",
-                "right",
-                "middle",
-                "left",
-                "far left",
-            ],
-            "cleaning": ["off", "on"],
-            "powerful": ["off", "on"],
-            "economy": ["off", "on"],
-        }
+    protocol = "MITSUBISHI_HEAVY_88"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat"],
+        "temperature": [17, 31],
+        "fan": ["highest", "medium", "low", "lowest"],
+        "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": [
+            "off",
+            "auto",
+            "far right",
+            "right",
+            "middle",
+            "left",
+            "far left",
+        ],
+        "cleaning": ["off", "on"],
+        "powerful": ["off", "on"],
+        "economy": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
@@ -27,26 +27,26 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Neoclima(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [6112, 7391]
     ENDFRAME = None
     MARK = [537]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [571, 1651]  # ditto
 
-    def __init__(self):
-        super().__init__("NEOCLIMA")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat"],
-            "temperature": [16, 32],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "hswing": ["off", "on"],
-            "sleep": ["off", "on"],
-            "powerful": ["off", "on"],
-            "purifier": ["off", "on"],
-            "economy": ["off", "on"],
-            "light": ["off", "on"],
-        }
+    protocol = "NEOCLIMA"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat"],
+        "temperature": [16, 32],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "hswing": ["off", "on"],
+        "sleep": ["off", "on"],
+        "powerful": ["off", "on"],
+        "purifier": ["off", "on"],
+        "economy": ["off", "on"],
+        "light": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
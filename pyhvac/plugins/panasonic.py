@@ -31,14 +31,14 @@
 
 import struct
 
-from .hvaclib import HVAC, PulseBased, GenPluginObject, bit_reverse
-from ..irhvac import (
-    kPanasonicLke,
-    kPanasonicCkp,
-    kPanasonicDke,
-    kPanasonicJke,
-    kPanasonicNke,
-    kPanasonicRkr,
+from .hvaclib import (
+    BIT_REVERSE,
+    HVAC,
+    Checksum,
+    FrameLayout,
+    PulseBased,
+    GenPluginObject,
+    bit_reverse,
 )
 
 
@@ -46,6 +46,8 @@ class Panasonic(HVAC):
     """Generic Panasonic HVAC object. It must have, at the very minimum
     "mode" and "temperature" capabilities"""
 
+    __slots__ = ()
+
     FHEADER = b"\x40\x04\x07\x20\x00"
     F1BODY = b"\x00\x00"
     F2COMMON1 = b"\x00\x00\x70\x07"
@@ -53,23 +55,87 @@ class Panasonic(HVAC):
     FODOUR = b"\x40\x04\x07\x20\x01\xd9\x4c"
     FECON = b"\x40\x04\x07\x20\x01\xa1\xac"
     FILLER = b"\x01"
+    F2BODY = FHEADER + b"\x00\x00" + FILLER + b"\x00" + F2COMMON1 + b"\x00"
+    F2BODY += F2COMMON2 + b"\x00"
+    LAYOUT = FrameLayout(
+        F2BODY,
+        (
+            (
+                "mode",
+                5,
+                0xFF,
+                {
+                    "off": 0x10,
+                    "dry": 0x94,
+                    "fan": 0x96,
+                    "cool": 0x9C,
+                    "heat": 0x92,
+                    "auto": 0x90,
+                },
+                "or",
+            ),
+            # In steps above base_temp
+            (
+                "temperature",
+                6,
+                0xFF,
+                lambda step: bit_reverse(0x20 + (step << 1)),
+                "or",
+            ),
+            (
+                "fan",
+                8,
+                0x0F,
+                {
+                    "auto": 0x05,
+                    "highest": 0x0E,
+                    "high": 0x06,
+                    "medium": 0x0A,
+                    "low": 0x02,
+                    "lowest": 0x0C,
+                },
+                "or",
+            ),
+            (
+                "swing",
+                8,
+                0xF0,
+                {
+                    "auto": 0xF0,
+                    "auto high": 0x70,
+                    "auto low": 0xB0,
+                    "ceiling": 0x80,
+                    "90°": 0x40,
+                    "60°": 0xC0,
+                    "45°": 0x20,
+                    "30°": 0xA0,
+                },
+                "or",
+            ),
+            ("profile", 13, 0xFF, {"normal": 0x08, "boost": 0x88, "quiet": 0x0C}, "or"),
+            ("purifier", 17, 0x20, {"on": 0x20}, "or"),
+        ),
+    )
+
+    brand = "Panasonic"
+    model = "Generic"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry"],
+        "temperature": range(16, 32),
+    }
+    # For functions that require their own frames
+    xtra_capabilities = {}
+    # Specify wether the bits order has to be swapped
+    is_msb = False
+    # Sum of the bit reversed bytes, bit reversed
+    CHECKSUM = Checksum(BIT_REVERSE, BIT_REVERSE)
+    base_temp = 16
 
     def __init__(self):
         super().__init__()
-        self.brand = "Panasonic"
-        self.model = "Generic"
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry"],
-            "temperature": [x for x in range(16, 32)],
-        }
-        # For functions that require their own frames
-        self.xtra_capabilities = {}
         self.status = {"mode": "off", "temperature": 25}
 
         self.to_set = {}
-        # Specify wether the bits order has to be swapped
-        self.is_msb = False
-        self.base_temp = 16
 
     def set_temperature(self, temp):
         if temp < self.capabilities["temperature"][0]:
@@ -78,15 +144,14 @@ class Panasonic(HVAC):
             temp = self.capabilities["temperature"][-1]
         self.to_set["temperature"] = temp
 
-    def code_temperature(self):
+    def value_temperature(self):
         if "temperature" in self.to_set:
             temp = self.to_set["temperature"]
             if "mode" in self.to_set and self.to_set["mode"] == "fan":
                 temp = 27
         else:
             temp = self.status["temperature"]
-        t = 0x20 + ((temp - self.base_temp) << 1)
-        return bit_reverse(t).to_bytes(1, "big")
+        return temp - self.base_temp
 
     def set_mode(self, mode):
         if mode not in self.capabilities["mode"]:
@@ -97,25 +162,15 @@ class Panasonic(HVAC):
         if mode == "off":
             self.to_set = {"mode": "off"}
 
-    def code_mode(self):
+    def value_mode(self):
         if "mode" in self.to_set:
             mode = self.to_set["mode"]
         else:
             mode = self.status["mode"]
-
-        if mode == "off":
-            return b"\x10"
-        elif mode == "dry":
-            return b"\x94"
-        elif mode == "fan":
-            return b"\x96"
-        elif mode == "cool":
-            return b"\x9c"
-        elif mode == "heat":
-            return b"\x92"
-        else:
+        if mode not in ["off", "dry", "fan", "cool", "heat"]:
             # If we do not know, also auto mode
-            return b"\x90"
+            mode = "auto"
+        return mode
 
     def set_fan(self, mode):
         if "fan" not in self.capabilities:
@@ -124,7 +179,7 @@ class Panasonic(HVAC):
             return
         self.to_set["fan"] = mode
 
-    def code_fan(self):
+    def value_fan(self):
         if "fan" in self.to_set:
             mode = self.to_set["fan"]
         else:
@@ -132,22 +187,7 @@ class Panasonic(HVAC):
                 mode = self.status["fan"]
             else:
                 mode = None
-
-        if mode == "auto":
-            return b"\x05"
-        elif mode == "highest":
-            return b"\x0e"
-        elif mode == "high":
-            return b"\x06"
-        elif mode == "medium":
-            return b"\x0a"
-        elif mode == "low":
-            return b"\x02"
-        elif mode == "lowest":
-            return b"\x0c"
-        else:
-            # If we do not know.... 0
-            return b"\x00"
+        return mode
 
     def set_swing(self, mode):
         if "swing" not in self.capabilities:
@@ -158,7 +198,7 @@ class Panasonic(HVAC):
             return
         self.to_set["swing"] = mode
 
-    def code_swing(self):
+    def value_swing(self):
         if "swing" in self.to_set:
             mode = self.to_set["swing"]
         else:
@@ -166,26 +206,7 @@ class Panasonic(HVAC):
                 mode = self.status["swing"]
             else:
                 mode = None
-
-        if mode == "auto":
-            return b"\xf0"
-        elif mode == "auto high":
-            return b"\x70"
-        elif mode == "auto low":
-            return b"\xb0"
-        elif mode == "ceiling":
-            return b"\x80"
-        elif mode == "90°":
-            return b"\x40"
-        elif mode == "60°":
-            return b"\xc0"
-        elif mode == "45°":
-            return b"\x20"
-        elif mode == "30°":
-            return b"\xa0"
-        else:
-            # If we do not know....0
-            return b"\x00"
+        return mode
 
     def set_profile(self, mode):
         if "profile" not in self.capabilities:
@@ -194,7 +215,7 @@ class Panasonic(HVAC):
             return
         self.to_set["profile"] = mode
 
-    def code_profile(self):
+    def value_profile(self):
         if "profile" in self.to_set:
             mode = self.to_set["profile"]
         else:
@@ -202,14 +223,7 @@ class Panasonic(HVAC):
                 mode = self.status["profile"]
             else:
                 mode = None
-        if mode == "normal":
-            return b"\x08"
-        elif mode == "boost":
-            return b"\x88"
-        elif mode == "quiet":
-            return b"\x0c"
-
-        return b"\x00"
+        return mode
 
     def set_purifier(self, mode="off"):
         if "purifier" not in self.capabilities:
@@ -218,7 +232,7 @@ class Panasonic(HVAC):
             return
         self.to_set["purifier"] = mode
 
-    def code_purifier(self):
+    def value_purifier(self):
 
         if "purifier" in self.to_set:
             mode = self.to_set["purifier"]
@@ -227,11 +241,7 @@ class Panasonic(HVAC):
                 mode = self.status["purifier"]
             else:
                 mode = None
-
-        if mode == "on":
-            return b"\x20"
-        else:
-            return b"\x00"
+        return mode
 
     def set_cleaning(self, mode="off"):
         if "cleaning" not in self.xtra_capabilities:
@@ -266,53 +276,61 @@ class Panasonic(HVAC):
         return frames
 
     def crc(self, frame):
-        crc = 0
-        for x in frame:
-            # print("Adding 0x%02x as 0x%02x"%(x,bit_reverse(x)))
-            crc += bit_reverse(x)
-            # print("crc now 0x%02x"%crc)
-        return bit_reverse(crc & 0xFF).to_bytes(1, "big")
-
-    def build_code(self):
+        return self.CHECKSUM.value(frame).to_bytes(1, "big")
+
+    def frame_values(self):
+        """Return the field values, for LAYOUT, of the frame to send."""
+        return {
+            "mode": self.value_mode(),
+            "temperature": self.value_temperature(),
+            "fan": self.value_fan(),
+            "swing": self.value_swing(),
+            "profile": self.value_profile(),
+            "purifier": self.value_purifier(),
+        }
+
+    def build_code(self, checksum=False):
+        """With checksum, frames are followed by their checksum. See build_frame."""
         if "mode" not in self.to_set and self.status["mode"] == "fan":
             self.to_set["temperature"] = 27
         frames = [self.FHEADER + self.F1BODY]
-        f2 = self.FHEADER + self.code_mode() + self.code_temperature() + self.FILLER
-        f2 += (self.code_fan()[0] + self.code_swing()[0]).to_bytes(1, "big")
-        f2 += self.F2COMMON1
-        f2 += self.code_profile()
-        f2 += self.F2COMMON2
-        f2 += self.code_purifier()
-        frames += [f2]
+        if checksum:
+            frames[0] += self.crc(frames[0])
+            frames += [bytes(self.build_frame(self.frame_values()))]
+        else:
+            frames += [bytes(self.LAYOUT.build(self.frame_values()))]
         return frames
 
     def _build_ircode(self):
         frames = []
         frames += self.code_cleaning()
         frames += self.code_economy()
-        frames += self.build_code()
         idx = 0
         for x in frames:
             frames[idx] += self.crc(x)
             idx += 1
+        frames += self.build_code(checksum=True)
         return frames
 
 
 class PanaCassette(Panasonic):
     """PX2T5 amd similar Panasonic HVAC object."""
 
+    __slots__ = ()
+
+    model = "4 Way Cassette"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "fan", "dry"],
+        "temperature": range(16, 32),
+        "fan": ["auto", "highest", "medium", "lowest"],
+        "swing": ["auto", "auto high", "auto low", "90°", "60°", "45°", "30°"],
+        "purifier": ["off", "on"],
+    }
+    # For functions that require their own frames
+    xtra_capabilities = {"economy": ["off", "on"], "cleaning": ["off", "on"]}
+
     def __init__(self):
         super().__init__()
-        self.model = "4 Way Cassette"
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "fan", "dry"],
-            "temperature": [x for x in range(16, 32)],
-            "fan": ["auto", "highest", "medium", "lowest"],
-            "swing": ["auto", "auto high", "auto low", "90°", "60°", "45°", "30°"],
-            "purifier": ["off", "on"],
-        }
-        # For functions that require their own frames
-        self.xtra_capabilities = {"economy": ["off", "on"], "cleaning": ["off", "on"]}
         self.status = {
             "mode": "off",
             "temperature": 25,
@@ -325,140 +343,146 @@ class PanaCassette(Panasonic):
 
 
 class PanasonicLke(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3456, 1728]
     ENDFRAME = None
     MARK = [432]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [432, 1296]  # ditto
 
-    def __init__(self):
-        super().__init__("PANASONIC_AC", variant=kPanasonicLke)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
-            "temperature": [16, 30],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": ["off", "on"],
-            "quiet": ["off", "on"],
-            "powerful": ["off", "on"],
-        }
+    protocol = "PANASONIC_AC"
+    variant = "kPanasonicLke"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
+        "temperature": [16, 30],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": ["off", "on"],
+        "quiet": ["off", "on"],
+        "powerful": ["off", "on"],
+    }
 
 
 class PanasonicNke(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3456, 1728]
     ENDFRAME = None
     MARK = [432]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [432, 1296]  # ditto
 
-    def __init__(self):
-        super().__init__("PANASONIC_AC", variant=kPanasonicNke)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
-            "temperature": [16, 30],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": ["off", "on"],
-            "quiet": ["off", "on"],
-            "powerful": ["off", "on"],
-        }
+    protocol = "PANASONIC_AC"
+    variant = "kPanasonicNke"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
+        "temperature": [16, 30],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": ["off", "on"],
+        "quiet": ["off", "on"],
+        "powerful": ["off", "on"],
+    }
 
 
 class PanasonicDke(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3456, 1728]
     ENDFRAME = None
     MARK = [432]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [432, 1296]  # ditto
 
-    def __init__(self):
-        super().__init__("PANASONIC_AC", variant=kPanasonicDke)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
-            "temperature": [16, 30],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": ["auto", "far right", "right", "middle", "left", "far left"],
-            "quiet": ["off", "on"],
-            "powerful": ["off", "on"],
-            "purifier": ["off", "on"],
-        }
+    protocol = "PANASONIC_AC"
+    variant = "kPanasonicDke"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
+        "temperature": [16, 30],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": ["auto", "far right", "right", "middle", "left", "far left"],
+        "quiet": ["off", "on"],
+        "powerful": ["off", "on"],
+        "purifier": ["off", "on"],
+    }
 
 
 class PanasonicJke(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3456, 1728]
     ENDFRAME = None
     MARK = [432]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [432, 1296]  # ditto
 
-    def __init__(self):
-        super().__init__("PANASONIC_AC", variant=kPanasonicJke)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
-            "temperature": [16, 30],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
-            "quiet": ["off", "on"],
-            "powerful": ["off", "on"],
-        }
+    protocol = "PANASONIC_AC"
+    variant = "kPanasonicJke"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
+        "temperature": [16, 30],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
+        "quiet": ["off", "on"],
+        "powerful": ["off", "on"],
+    }
 
 
 class PanasonicCkp(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3456, 1728]
     ENDFRAME = None
     MARK = [432]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [432, 1296]  # ditto
 
-    def __init__(self):
-        super().__init__("PANASONIC_AC", variant=kPanasonicCkp)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
-            "temperature": [16, 30],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
-            "quiet": ["off", "on"],
-            "powerful": ["off", "on"],
-        }
+    protocol = "PANASONIC_AC"
+    variant = "kPanasonicCkp"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
+        "temperature": [16, 30],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
+        "quiet": ["off", "on"],
+        "powerful": ["off", "on"],
+    }
 
 
 class PanasonicRkr(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3456, 1728]
     ENDFRAME = None
     MARK = [432]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [432, 1296]  # ditto
 
-    def __init__(self):
-        super().__init__("PANASONIC_AC", variant=kPanasonicRkr)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
-            "temperature": [16, 30],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": ["auto", "far right", "right", "middle", "left", "far left"],
-            "quiet": ["off", "on"],
-            "powerful": ["off", "on"],
-        }
+    protocol = "PANASONIC_AC"
+    variant = "kPanasonicRkr"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
+        "temperature": [16, 30],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": ["auto", "far right", "right", "middle", "left", "far left"],
+        "quiet": ["off", "on"],
+        "powerful": ["off", "on"],
+    }
 
 
 class Panasonic32(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3543, 3450]
     ENDFRAME = [920, 13946]
     MARK = [920]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [828, 2575]  # ditto
 
-    def __init__(self):
-        super().__init__("PANASONIC_AC32")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
-            "temperature": [16, 30],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": ["off", "on"],
-        }
+    protocol = "PANASONIC_AC32"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
+        "temperature": [16, 30],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": ["off", "on"],
+    }
 
 
 class PluginObject(GenPluginObject):
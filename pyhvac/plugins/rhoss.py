@@ -27,20 +27,20 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Rhoss(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3042, 4248]
     ENDFRAME = None
     MARK = [648]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [457, 1545]  # ditto
 
-    def __init__(self):
-        super().__init__("RHOSS")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
-            "temperature": [16, 30],
-            "fan": ["auto", "highest", "medium", "lowest"],
-            "swing": ["off", "on"],
-        }
+    protocol = "RHOSS"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
+        "temperature": [16, 30],
+        "fan": ["auto", "highest", "medium", "lowest"],
+        "swing": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
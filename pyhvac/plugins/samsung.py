@@ -27,6 +27,7 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Samsung(PulseBased):
+    __slots__ = ()
 
     LEAD = [690, 17844]
     STARTFRAME = [3086, 8864]
@@ -34,21 +35,20 @@ class Samsung(PulseBased):
     MARK = [586]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [436, 1432]  # ditto
 
-    def __init__(self):
-        super().__init__("SAMSUNG_AC")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "hswing": ["off", "on"],
-            "cleaning": ["off", "on"],
-            "quiet": ["off", "on"],
-            "powerful": ["off", "on"],
-            "economy": ["off", "on"],
-            "light": ["off", "on"],
-            "purifier": ["off", "on"],
-        }
+    protocol = "SAMSUNG_AC"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat", "fan"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "hswing": ["off", "on"],
+        "cleaning": ["off", "on"],
+        "quiet": ["off", "on"],
+        "powerful": ["off", "on"],
+        "economy": ["off", "on"],
+        "light": ["off", "on"],
+        "purifier": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
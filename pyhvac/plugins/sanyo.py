@@ -27,40 +27,40 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Sanyo(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [8500, 4200]
     MARK = [500]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [550, 1600]  # ditto
 
-    def __init__(self):
-        super().__init__("SANYO_AC")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
-            "sleep": ["off", "on"],
-        }
+    protocol = "SANYO_AC"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["auto", "90°", "60°", "45°", "30°", "0°"],
+        "sleep": ["off", "on"],
+    }
 
 
 class Sanyo88(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [5400, 2000]
     MARK = [500]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [750, 1500]  # ditto
     TAIL = [500, 3675]
 
-    def __init__(self):
-        super().__init__("SANYO_AC88")
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "heat", "fan"],
-            "temperature": [10, 30],
-            "fan": ["auto", "highest", "high", "medium", "lowest"],
-            "swing": ["off", "on"],
-            "powerful": ["off", "on"],
-            "purifier": ["off", "on"],
-            "sleep": ["off", "on"],
-        }
+    protocol = "SANYO_AC88"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "heat", "fan"],
+        "temperature": [10, 30],
+        "fan": ["auto", "highest", "high", "medium", "lowest"],
+        "swing": ["off", "on"],
+        "powerful": ["off", "on"],
+        "purifier": ["off", "on"],
+        "sleep": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
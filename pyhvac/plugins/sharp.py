@@ -28,37 +28,119 @@
 
 import struct
 
-from .hvaclib import HVAC, PulseBased, GenPluginObject
+from .hvaclib import HVAC, Checksum, FrameLayout, PulseBased, GenPluginObject
 from .kelvinator import Kelvinator
-from ..irhvac import A907, A903, A705
+
+# Frame codes shared by the Sharp layouts
+FAN_CODES = {
+    "auto": 0x20,
+    "low": 0x30,
+    "lowest": 0x40,
+    "medium": 0x50,
+    "high": 0x60,
+    "highest": 0x70,
+}
+# Byte 5 says what the frame does: turn on, turn off, set, or toggle an option
+POWER_CODES = {
+    "off": 0x21,
+    "on": 0x11,
+    "set": 0x31,
+    "option on": 0x61,
+    "option off": 0x71,
+}
+MODE_CODES = {"auto": 0x00, "heat": 0x01, "cool": 0x02, "dry": 0x03}
+
+
+def jtech_temperature(temp):
+    """Encode a J-Tech temperature, in 0.5°C steps."""
+    if (temp * 10) % 10:
+        deci = True
+        temp = int(temp)
+    else:
+        deci = False
+    if temp < 16:
+        temp += 0x3E
+        if deci:
+            temp += 0x20
+    else:
+        if not deci:
+            temp = 0xC0 + (temp - 15)
+        else:
+            temp = 0x70 + (temp - 15)
+    return temp
+
+
+def sharp_checksum(special):
+    """Return the Sharp Checksum: the xor of the bytes and special, folded in the
+    high nibble, plus special."""
+    finish = []
+    for crc in range(256):
+        crc ^= special
+        crc ^= crc >> 4
+        crc = (crc & 0x0F) << 4
+        crc += special
+        finish.append(crc)
+    return Checksum(range(256), finish, "xor")
 
 
 class Sharp(HVAC):
     """Generic Sharp HVAC object. It must have, at the very minimum
     "mode" and "temperature" capabilities"""
 
+    __slots__ = ()
+
     STARTFRAME = [3800, 1900]
     ENDFRAME = [435, 10000]
     MARK = [435]
     SPACE = [435, 1400]
 
+    brand = "Sharp"
+    model = "Generic"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry"],
+        "temperature": range(18, 38),
+    }
+    # For functions that require their own frames
+    xtra_capabilities = {}
+    # Specify wether the bits order has to be swapped
+    is_msb = True
+    FBODY = b"\xaa\x5a\xcf\x10\x00\x00\x00\x00\x00\x80\x00\xe0"
+    # The xtra_ fields are only set in the frames of xtra_capabilities
+    LAYOUT = FrameLayout(
+        FBODY,
+        (
+            ("temperature", 6, 0x0F, lambda temp: temp - 17, "or"),
+            ("fan", 6, 0xF0, FAN_CODES, "or"),
+            (
+                "swing",
+                8,
+                0x0F,
+                {
+                    "auto": 8,
+                    "ceiling": 9,
+                    "90°": 10,
+                    "60°": 11,
+                    "45°": 12,
+                    "30°swing": 13,
+                },
+                "or",
+            ),
+            ("economy", 11, 0x10, {"on": 0x10}, "or"),
+            ("power", 5, 0xFF, POWER_CODES, "or"),
+            ("mode", 6, 0x03, MODE_CODES, "or"),
+            ("xtra_powerful", 10, 0x01, {True: 0x01}, "or"),
+            ("xtra_economy", 11, 0x10, {"on": 0x10}, "or"),
+        ),
+    )
+    crc_special = 0x01
+    # Must be replaced with crc_special
+    CHECKSUM = sharp_checksum(crc_special)
+
     def __init__(self):
         super().__init__()
-        self.brand = "Sharp"
-        self.model = "Generic"
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry"],
-            "temperature": [x for x in range(18, 38)],
-        }
-        # For functions that require their own frames
-        self.xtra_capabilities = {}
         self.status = {"mode": "cool", "temperature": 25}
 
         self.to_set = {}
-        # Specify wether the bits order has to be swapped
-        self.is_msb = True
-        self.FBODY = b"\xaa\x5a\xcf\x10\x00\x00\x00\x00\x00\x80\x00\xe0"
-        self.crc_special = 0x01
 
     def set_temperature(self, temp):
         if temp < self.capabilities["temperature"][0]:
@@ -68,7 +150,7 @@ class Sharp(HVAC):
         if self.status["temperature"] != temp:
             self.to_set["temperature"] = temp
 
-    def code_temperature(self):
+    def value_temperature(self):
         if "temperature" in self.to_set:
             temp = self.to_set["temperature"]
             if "mode" in self.to_set and self.to_set["mode"] != "cool":
@@ -82,9 +164,7 @@ class Sharp(HVAC):
                     temp = self.status["temperature"]
         else:
             temp = self.status["temperature"]
-        mask = bytearray(b"\x00" * len(self.FBODY))
-        mask[6] = temp - 17
-        return mask, False
+        return temp
 
     def set_fan(self, mode):
         if "fan" not in self.capabilities:
@@ -94,7 +174,7 @@ class Sharp(HVAC):
         if self.status["fan"] != mode:
             self.to_set["fan"] = mode
 
-    def code_fan(self):
+    def value_fan(self):
         """mode is one of auto, lowest, low, medium, high, highest"""
         if "mode" in self.to_set and self.to_set["mode"] == "dry":
             mode = "auto"
@@ -110,12 +190,7 @@ class Sharp(HVAC):
                     mode = self.status["fan"]
                 else:
                     mode = None
-        rank = ["auto", "low", "lowest", "medium", "high", "highest"]
-        mask = bytearray(b"\x00" * len(self.FBODY))
-        if mode:
-            fval = (rank.index(mode) + 2) << 4
-            mask[6] = fval
-        return mask, False
+        return mode
 
     def set_swing(self, mode):
         if "swing" not in self.capabilities:
@@ -125,7 +200,7 @@ class Sharp(HVAC):
         if self.status["swing"] != mode:
             self.to_set["swing"] = mode
 
-    def code_swing(self):
+    def value_swing(self):
         if "swing" in self.to_set:
             mode = self.to_set["swing"]
         else:
@@ -137,10 +212,7 @@ class Sharp(HVAC):
         rank = ["auto", "ceiling", "90°", "60°", "45°", "30°" "swing"]
         if mode not in rank:
             mode = "auto"  # Just in case
-        mask = bytearray(b"\x00" * len(self.FBODY))
-        fval = rank.index(mode) + 8
-        mask[8] = fval
-        return mask, False
+        return mode
 
     def set_powerful(self, mode="off"):
         # print("\n\nSharp set powerful {}\n\n".format(mode))
@@ -157,16 +229,9 @@ class Sharp(HVAC):
         if self.status["powerful"] != mode:
             self.to_set["powerful"] = mode
 
-    def code_powerful(self, toggle=False):
-        b10code = 0x00
-        if toggle:
-            if "powerful" in self.to_set:
-                b10code = 0x01
-
-        mask = bytearray(b"\x00" * len(self.FBODY))
-        mask[10] = b10code
+    def value_powerful(self, toggle=False):
         # Nothing to set... I know... it's the mode that will do this
-        return mask, False
+        return toggle and "powerful" in self.to_set
 
     def set_economy(self, mode="off"):
         if "economy" not in self.status:
@@ -182,7 +247,7 @@ class Sharp(HVAC):
         if self.status["economy"] != mode:
             self.to_set["economy"] = mode
 
-    def code_economy(self, toggle=False):
+    def value_economy(self, toggle=False):
         if not toggle:
             mode = self.status["economy"]
         elif "economy" in self.to_set:
@@ -192,11 +257,7 @@ class Sharp(HVAC):
                 mode = "off"
             else:
                 mode = self.status["economy"]
-
-        mask = bytearray(b"\x00" * len(self.FBODY))
-        if mode == "on":
-            mask[11] |= 0x10
-        return mask, False
+        return mode
 
     def set_purifier(self, mode="off"):
         if "purifier" not in self.capabilities:
@@ -206,11 +267,8 @@ class Sharp(HVAC):
         if self.status["purifier"] != mode:
             self.to_set["purifier"] = mode
 
-    def code_purifier(self):
-
-        mask = bytearray(b"\x00" * len(self.FBODY))
-
-        return mask, False
+    def value_purifier(self):
+        return None
 
     def set_mode(self, mode):
         if mode not in self.capabilities["mode"]:
@@ -218,65 +276,54 @@ class Sharp(HVAC):
         if mode != self.status["mode"]:
             self.to_set["mode"] = mode
 
-    def code_mode(self, option=None):
+    def value_mode(self, option=None):
+        """Return the power and the mode of the frame."""
         if "mode" in self.to_set:
             mode = self.to_set["mode"]
         else:
             mode = self.status["mode"]
 
-        mask = bytearray(b"\x00" * len(self.FBODY))
         if option is None or mode == "off":
             if mode != self.status["mode"]:
                 if mode == "off":
-                    b5val = 0x21
+                    power = "off"
                     b6mode = self.status["mode"]
                 elif self.status["mode"] == "off":
-                    b5val = 0x11
+                    power = "on"
                     b6mode = mode
                 else:
-                    b5val = 0x31
+                    power = "set"
                     b6mode = mode
             else:
-                b5val = 0x31
+                power = "set"
                 b6mode = mode if mode != "off" else "cool"
         else:
             # Caller should not send option if off
             if option == "on":
-                b5val = 0x61
+                power = "option on"
             else:
-                b5val = 0x71
+                power = "option off"
             b6mode = mode
-        mask[5] = b5val
-        mask[6] = ["auto", "heat", "cool", "dry"].index(b6mode)
-        return mask, False
-
-    def build_code(self, withmode=True):
-        packet = bytearray(self.FBODY)
-        # Note that set mod must be last for it replaces values
+        return power, b6mode
+
+    def frame_values(self, withmode=True, option=None):
+        """Return the field values, for LAYOUT, of the frame to send."""
+        values = {
+            "temperature": self.value_temperature(),
+            "fan": self.value_fan(),
+            "swing": self.value_swing(),
+            "purifier": self.value_purifier(),
+            "economy": self.value_economy(),
+        }
         if withmode:
-            lof = [
-                self.code_temperature,
-                self.code_fan,
-                self.code_swing,
-                self.code_purifier,
-                self.code_economy,
-                self.code_mode,
-            ]
-        else:
-            lof = [
-                self.code_temperature,
-                self.code_fan,
-                self.code_swing,
-                self.code_purifier,
-                self.code_economy,
-            ]
-        for f in lof:
-            mask, replace = f()
-            if replace:
-                packet = bytearray([y or x for x, y in zip(packet, mask)])
-            else:
-                packet = bytearray([x | y for x, y in zip(packet, mask)])
-        return packet
+            values["power"], values["mode"] = self.value_mode(option)
+        return values
+
+    def build_code(self, withmode=True, checksum=False):
+        """With checksum, the frame is followed by its checksum. See build_frame."""
+        if checksum:
+            return self.build_frame(self.frame_values(withmode))
+        return self.LAYOUT.build(self.frame_values(withmode))
 
     def _build_ircode(self):
         frames = []
@@ -285,8 +332,10 @@ class Sharp(HVAC):
             if x in self.to_set:
                 normalframe = True
                 break
+        values = None
         if normalframe:
-            frames += [self.build_code()]
+            values = self.frame_values()
+            frames += [self.build_frame(values)]
 
         if ("mode" in self.to_set and (self.to_set["mode"] != "off")) or self.status[
             "mode"
@@ -294,41 +343,25 @@ class Sharp(HVAC):
             for prop in self.xtra_capabilities:
                 # print("Looking at {} with {} and {}".format(prop,self.to_set,self.status))
                 if prop in self.to_set and self.to_set[prop] != self.status[prop]:
-                    f = getattr(self, "code_" + prop, None)
+                    f = getattr(self, "value_" + prop, None)
                     if f:
-                        packet = self.build_code(withmode=False)
-                        for mask, replace in [
-                            self.code_mode(option=self.to_set[prop]),
-                            f(toggle=True),
-                        ]:
-                            if replace:
-                                packet = bytearray(
-                                    [y or x for x, y in zip(packet, mask)]
-                                )
-                            else:
-                                packet = bytearray(
-                                    [x | y for x, y in zip(packet, mask)]
-                                )
-                        frames.append(packet)
+                        if values is None:
+                            values = self.frame_values()
+                        xvalues = dict(values)
+                        xvalues["power"], xvalues["mode"] = self.value_mode(
+                            self.to_set[prop]
+                        )
+                        xvalues["xtra_" + prop] = f(toggle=True)
+                        frame = self.LAYOUT.build(xvalues)
+                        frames.append(frame + self.crc(frame))
         else:
             # We are off, so xtra_capabilities should also be off
             for x in self.xtra_capabilities:
                 self.to_set[x] = "off"
-        idx = 0
-        for x in frames:
-            frames[idx] += self.crc(x)
-            idx += 1
         return frames
 
     def crc(self, frame):
-        crc = 0
-        for x in frame:
-            crc ^= x
-        crc ^= self.crc_special
-        crc ^= crc >> 4
-        crc = (crc & 0x0F) << 4
-        crc += self.crc_special
-        return crc.to_bytes(1, "big")
+        return self.CHECKSUM.value(frame).to_bytes(1, "big")
 
     def get_timing(self):
         # Well Sharp is different
@@ -341,27 +374,95 @@ class Sharp(HVAC):
 
 
 class JTech(Sharp):
+    __slots__ = ()
+
+    model = "FTM-PV2S"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry"],
+        "temperature": range(14, 30),
+        "fan": ["auto", "highest", "medium", "low", "lowest"],
+        "swing": ["auto", "ceiling", "90°", "60°", "45°", "30°", "swing"],
+        "hswing": ["left", "middle", "right", "swing"],
+        "target": [
+            "off",
+            "close left",
+            "close middle",
+            "close right",
+            "far left",
+            "far middle",
+            "far right",
+        ],
+        "purifier": ["off", "on"],
+    }
+    xtra_capabilities = {"powerful": ["off", "on"], "economy": ["off", "on"]}
+    temperature_step = 0.5
+    # Swing and horizontal swing, or target (AKA spot)
+    LAYOUT = FrameLayout(
+        Sharp.FBODY,
+        (
+            ("temperature", 4, 0xFF, jtech_temperature, "replace"),
+            ("fan", 6, 0xF0, FAN_CODES, "or"),
+            (
+                "swing",
+                8,
+                0x0F,
+                {
+                    "auto": 8,
+                    "ceiling": 9,
+                    "90°": 10,
+                    "60°": 11,
+                    "45°": 12,
+                    "30°": 13,
+                    "swing": 14,
+                },
+                "or",
+            ),
+            (
+                "hswing",
+                8,
+                0xF0,
+                {"middle": 0x10, "left": 0x20, "right": 0x30, "swing": 0xF0},
+                "or",
+            ),
+            (
+                "target",
+                8,
+                0xFF,
+                {
+                    "close left": 0x2C,
+                    "close middle": 0x1C,
+                    "close right": 0x3C,
+                    "far left": 0x29,
+                    "far middle": 0x19,
+                    "far right": 0x39,
+                },
+                "or",
+            ),
+            (
+                "target",
+                9,
+                0x01,
+                {
+                    "close left": 0x01,
+                    "close middle": 0x01,
+                    "close right": 0x01,
+                    "far left": 0x01,
+                    "far middle": 0x01,
+                    "far right": 0x01,
+                },
+                "or",
+            ),
+            ("purifier", 11, 0x04, {"on": 0x04}, "or"),
+            ("economy", 11, 0x10, {"on": 0x10}, "or"),
+            ("power", 5, 0xFF, POWER_CODES, "or"),
+            ("mode", 6, 0x03, MODE_CODES, "or"),
+            ("xtra_powerful", 10, 0x01, {True: 0x01}, "or"),
+            ("xtra_economy", 11, 0x10, {"on": 0x10}, "or"),
+        ),
+    )
+
     def __init__(self):
         super().__init__()
-        self.model = "FTM-PV2S"
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry"],
-            "temperature": [x for x in range(14, 30)],
-            "fan": ["auto", "highest", "medium", "low", "lowest"],
-            "swing": ["auto", "ceiling", "90°", "60°", "45°", "30°", "swing"],
-            "hswing": ["left", "middle", "right", "swing"],
-            "target": [
-                "off",
-                "close left",
-                "close middle",
-                "close right",
-                "far left",
-                "far middle",
-                "far right",
-            ],
-            "purifier": ["off", "on"],
-        }
-        self.xtra_capabilities = {"powerful": ["off", "on"], "economy": ["off", "on"]}
         self.status = {
             "mode": "off",
             "temperature": 25,
@@ -373,60 +474,28 @@ class JTech(Sharp):
             "economy": "off",
             "powerful": "off",
         }
-        self.temperature_step = 0.5
-
-    def code_purifier(self):
-
-        mask = bytearray(b"\x00" * len(self.FBODY))
 
+    def value_purifier(self):
         if "purifier" in self.to_set:
             mode = self.to_set["purifier"]
         else:
             mode = self.status["purifier"]
-        if mode == "on":
-            mask[11] |= 0x04
+        return mode
 
-        # Nothing to set... I know... it's the mode that will do this
-        return mask, False
+    def target_off(self):
+        """Whether swing and horizontal swing are used, rather than target"""
+        return (
+            "target" in self.to_set and self.to_set["target"] == "off"
+        ) or self.status["target"] == "off"
 
-    def code_swing(self):
-        """This one takes care of "swing", "horizontal swing" and "spot" (AKA target"""
-        if ("target" in self.to_set and self.to_set["target"] == "off") or self.status[
-            "target"
-        ] == "off":
-            # OK, swing and horizontal swing are on
-            if "swing" in self.to_set:
-                smode = self.to_set["swing"]
-            else:
-                smode = self.status["swing"]
-            if "hswing" in self.to_set:
-                hsmode = self.to_set["hswing"]
-            else:
-                hsmode = self.status["hswing"]
-            b8val = (["", "middle", "left", "right"] + 11 * [""] + ["swing"]).index(
-                hsmode
-            ) << 4
-            b8val += 8 + ["auto", "ceiling", "90°", "60°", "45°", "30°", "swing"].index(
-                smode
-            )
-            b9val = 0x0
+    def value_swing(self):
+        if not self.target_off():
+            return None
+        if "swing" in self.to_set:
+            smode = self.to_set["swing"]
         else:
-            # Target is on
-            b9val = 0x01
-            front, side = (
-                ("target" in self.to_set and self.to_set["target"])
-                or self.status["target"]
-            ).split(" ")
-            b8val = (["", "middle", "left", "right"]).index(side) << 4
-            if front == "close":
-                b8val += 0xC
-            else:
-                b8val += 0x9
-
-        mask = bytearray(b"\x00" * len(self.FBODY))
-        mask[9] |= b9val
-        mask[8] = b8val
-        return mask, False
+            smode = self.status["swing"]
+        return smode
 
     def set_hswing(self, mode):
         if "hswing" not in self.capabilities:
@@ -436,9 +505,14 @@ class JTech(Sharp):
         if self.status["hswing"] != mode:
             self.to_set["hswing"] = mode
 
-    def code_hswing(self):
-        """Nothing to do. hNalded by code_swing"""
-        return bytearray(b"\x00" * len(self.FBODY)), False
+    def value_hswing(self):
+        if not self.target_off():
+            return None
+        if "hswing" in self.to_set:
+            hsmode = self.to_set["hswing"]
+        else:
+            hsmode = self.status["hswing"]
+        return hsmode
 
     def set_target(self, mode):
         if "target" not in self.capabilities:
@@ -448,11 +522,14 @@ class JTech(Sharp):
         if self.status["target"] != mode:
             self.to_set["target"] = mode
 
-    def code_target(self):
-        """Nothing to do. hNalded by code_swing"""
-        return bytearray(b"\x00" * len(self.FBODY)), False
+    def value_target(self):
+        if self.target_off():
+            return None
+        return ("target" in self.to_set and self.to_set["target"]) or self.status[
+            "target"
+        ]
 
-    def code_temperature(self):
+    def value_temperature(self):
         if "temperature" in self.to_set:
             temp = self.to_set["temperature"]
         else:
@@ -462,84 +539,76 @@ class JTech(Sharp):
                 temp = None
         elif self.status["mode"] != "cool":
             temp = None
-        mask = bytearray(b"\x00" * len(self.FBODY))
-        if temp:
-            if (temp * 10) % 10:
-                deci = True
-                temp = int(temp)
-            else:
-                deci = False
-            if temp < 16:
-                temp += 0x3E
-                if deci:
-                    temp += 0x20
-            else:
-                if not deci:
-                    temp = 0xC0 + (temp - 15)
-                else:
-                    temp = 0x70 + (temp - 15)
-            mask[4] = temp
-        return mask, True
+        return temp
+
+    def frame_values(self, withmode=True, option=None):
+        values = super().frame_values(withmode, option)
+        values["hswing"] = self.value_hswing()
+        values["target"] = self.value_target()
+        return values
 
 
 class SharpA907(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3800, 1900]
     MARK = [470]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [500, 1500]  # ditto
 
-    def __init__(self):
-        super().__init__("SHARP_AC", variant=A907)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "heat"],
-            "temperature": [15, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "90°", "45°", "30°"],
-            "cleaning": ["off", "on"],
-            "powerful": ["off", "on"],
-            "economy": ["off", "on"],
-            "purifier": ["off", "on"],
-        }
+    protocol = "SHARP_AC"
+    variant = "A907"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "heat"],
+        "temperature": [15, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "90°", "45°", "30°"],
+        "cleaning": ["off", "on"],
+        "powerful": ["off", "on"],
+        "economy": ["off", "on"],
+        "purifier": ["off", "on"],
+    }
 
 
 class SharpA903(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3800, 1900]
     MARK = [470]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [500, 1500]  # ditto
 
-    def __init__(self):
-        super().__init__("SHARP_AC", variant=A903)
-        self.capabilities = {
-            "mode": ["off", "auto", "cool", "dry", "fan"],
-            "temperature": [15, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "90°", "45°", "30°"],
-            "cleaning": ["off", "on"],
-            "powerful": ["off", "on"],
-            "light": ["off", "on"],
-            "purifier": ["off", "on"],
-        }
+    protocol = "SHARP_AC"
+    variant = "A903"
+    capabilities = {
+        "mode": ["off", "auto", "cool", "dry", "fan"],
+        "temperature": [15, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "90°", "45°", "30°"],
+        "cleaning": ["off", "on"],
+        "powerful": ["off", "on"],
+        "light": ["off", "on"],
+        "purifier": ["off", "on"],
+    }
 
 
 class SharpA705(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3800, 1900]
     MARK = [470]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [500, 1500]  # ditto
 
-    def __init__(self):
-        super().__init__("SHARP_AC", variant=A705)
-        self.capabilities = {
-            "mode": ["off", "cool", "dry", "fan"],
-            "temperature": [15, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "90°", "45°", "30°"],
-            "cleaning": ["off", "on"],
-            "powerful": ["off", "on"],
-            "light": ["off", "on"],
-            "purifier": ["off", "on"],
-        }
+    protocol = "SHARP_AC"
+    variant = "A705"
+    capabilities = {
+        "mode": ["off", "cool", "dry", "fan"],
+        "temperature": [15, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "90°", "45°", "30°"],
+        "cleaning": ["off", "on"],
+        "powerful": ["off", "on"],
+        "light": ["off", "on"],
+        "purifier": ["off", "on"],
+    }
 
 
 class PluginObject(GenPluginObject):
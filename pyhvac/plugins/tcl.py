@@ -24,51 +24,52 @@
 #
 
 from .hvaclib import PulseBased, GenPluginObject
-from ..irhvac import TAC09CHSD, GZ055BE1
 
 
 class Tclv1(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3800, 1650]
     MARK = [500]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [325, 1050]  # ditto
 
-    def __init__(self):
-        super().__init__("TCL112AC", variant=TAC09CHSD)
-        self.capabilities = {
-            "mode": ["off", "cool", "dry", "fan", "heat"],
-            "temperature": [16, 31],
-            "fan": ["auto", "high", "medium", "low", "lowest"],
-            "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": ["off", "on"],
-            "quiet": ["off", "on"],
-            "purifier": ["off", "on"],
-            "light": ["off", "on"],
-            "powerful": ["off", "on"],
-            "economy": ["off", "on"],
-        }
+    protocol = "TCL112AC"
+    variant = "TAC09CHSD"
+    capabilities = {
+        "mode": ["off", "cool", "dry", "fan", "heat"],
+        "temperature": [16, 31],
+        "fan": ["auto", "high", "medium", "low", "lowest"],
+        "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": ["off", "on"],
+        "quiet": ["off", "on"],
+        "purifier": ["off", "on"],
+        "light": ["off", "on"],
+        "powerful": ["off", "on"],
+        "economy": ["off", "on"],
+    }
 
 
 class Tclv2(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [3800, 1650]
     MARK = [500]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [325, 1050]  # ditto
 
-    def __init__(self):
-        super().__init__("TCL112AC", variant=GZ055BE1)
-        self.capabilities = {
-            "mode": ["off", "cool", "dry", "fan", "heat"],
-            "temperature": [16, 31],
-            "fan": ["auto", "high", "medium", "low", "lowest"],
-            "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
-            "hswing": ["off", "on"],
-            "quiet": ["off", "on"],
-            "purifier": ["off", "on"],
-            "light": ["off", "on"],
-            "powerful": ["off", "on"],
-            "economy": ["off", "on"],
-        }
+    protocol = "TCL112AC"
+    variant = "GZ055BE1"
+    capabilities = {
+        "mode": ["off", "cool", "dry", "fan", "heat"],
+        "temperature": [16, 31],
+        "fan": ["auto", "high", "medium", "low", "lowest"],
+        "swing": ["off", "auto", "90°", "60°", "45°", "30°", "0°"],
+        "hswing": ["off", "on"],
+        "quiet": ["off", "on"],
+        "purifier": ["off", "on"],
+        "light": ["off", "on"],
+        "powerful": ["off", "on"],
+        "economy": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
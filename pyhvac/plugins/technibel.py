@@ -27,20 +27,20 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Technibel(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [8836, 4380]
     MARK = [523]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [564, 1696]  # ditto
 
-    def __init__(self):
-        super().__init__("TECHNIBEL_AC")
-        self.capabilities = {
-            "mode": ["cool", "dry", "fan", "heat"],
-            "temperature": [16, 31],
-            "fan": ["high", "medium", "low"],
-            "swing": ["off", "on"],
-            "sleep": ["off", "on"],
-        }
+    protocol = "TECHNIBEL_AC"
+    capabilities = {
+        "mode": ["cool", "dry", "fan", "heat"],
+        "temperature": [16, 31],
+        "fan": ["high", "medium", "low"],
+        "swing": ["off", "on"],
+        "sleep": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
@@ -27,21 +27,21 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Teco(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [9000, 4440]
     MARK = [620]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [580, 1650]  # ditto
 
-    def __init__(self):
-        super().__init__("TECHNIBEL_AC")
-        self.capabilities = {
-            "mode": ["auto", "cool", "dry", "fan", "heat"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "sleep": ["off", "on"],
-            "light": ["off", "on"],
-        }
+    protocol = "TECHNIBEL_AC"
+    capabilities = {
+        "mode": ["auto", "cool", "dry", "fan", "heat"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "sleep": ["off", "on"],
+        "light": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
@@ -28,22 +28,22 @@ from .coolix import Coolix
 
 
 class Toshiba(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [9000, 4440]
     MARK = [620]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [580, 1650]  # ditto
 
-    def __init__(self):
-        super().__init__("TOSHIBA_AC")
-        self.capabilities = {
-            "mode": ["auto", "cool", "dry", "fan", "heat"],
-            "temperature": [17, 30],
-            "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
-            "swing": ["off", "on"],
-            "powerful": ["off", "on"],
-            "economy": ["off", "on"],
-            "purifier": ["off", "on"],
-        }
+    protocol = "TOSHIBA_AC"
+    capabilities = {
+        "mode": ["auto", "cool", "dry", "fan", "heat"],
+        "temperature": [17, 30],
+        "fan": ["auto", "highest", "high", "medium", "low", "lowest"],
+        "swing": ["off", "on"],
+        "powerful": ["off", "on"],
+        "economy": ["off", "on"],
+        "purifier": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
@@ -27,19 +27,19 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Transcold(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [5944, 7563]
     MARK = [555]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [1526, 3556]  # ditto
 
-    def __init__(self):
-        super().__init__("TRANSCOLD")
-        self.capabilities = {
-            "mode": ["auto", "cool", "dry", "fan", "heat"],
-            "temperature": [17, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-        }
+    protocol = "TRANSCOLD"
+    capabilities = {
+        "mode": ["auto", "cool", "dry", "fan", "heat"],
+        "temperature": [17, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
@@ -28,36 +28,36 @@ from .midea import Midea
 
 
 class Trotech(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [5952, 7364]
     MARK = [592]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [592, 1560]  # ditto
     TAIL = [592, 6184]
 
-    def __init__(self):
-        super().__init__("TROTECH")
-        self.capabilities = {
-            "mode": ["auto", "cool", "dry", "fan"],
-            "temperature": [16, 30],
-            "fan": ["high", "medium", "low"],
-            "sleep": ["off", "on"],
-        }
+    protocol = "TROTECH"
+    capabilities = {
+        "mode": ["auto", "cool", "dry", "fan"],
+        "temperature": [16, 30],
+        "fan": ["high", "medium", "low"],
+        "sleep": ["off", "on"],
+    }
 
 
 class Trotech3550(PulseBased):
+    __slots__ = ()
 
     STARTFRAME = [12000, 5130]
     MARK = [550]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [500, 1950]  # ditto
 
-    def __init__(self):
-        super().__init__("TROTECH_3550")
-        self.capabilities = {
-            "mode": ["auto", "cool", "dry", "fan"],
-            "temperature": [16, 30],
-            "fan": ["high", "medium", "low"],
-            "swing": ["off", "on"],
-        }
+    protocol = "TROTECH_3550"
+    capabilities = {
+        "mode": ["auto", "cool", "dry", "fan"],
+        "temperature": [16, 30],
+        "fan": ["high", "medium", "low"],
+        "swing": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
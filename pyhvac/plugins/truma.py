@@ -27,20 +27,21 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Truma(PulseBased):
+    __slots__ = ()
+
     LEAD = [20200, 1000]
     STARTFRAME = [1800, 630]
     MARK = [1200, 600]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [630]  # ditto
     TAIL = [500, 100000]
 
-    def __init__(self):
-        super().__init__("TRUMA")
-        self.capabilities = {
-            "mode": ["auto", "cool", "fan"],
-            "temperature": [16, 31],
-            "fan": ["high", "medium", "low"],
-            "quiet": ["off", "on"],
-        }
+    protocol = "TRUMA"
+    capabilities = {
+        "mode": ["auto", "cool", "fan"],
+        "temperature": [16, 31],
+        "fan": ["high", "medium", "low"],
+        "quiet": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
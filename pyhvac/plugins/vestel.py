@@ -27,20 +27,21 @@ from .hvaclib import PulseBased, GenPluginObject
 
 
 class Vestel(PulseBased):
+    __slots__ = ()
+
     MARK = [1026]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [554, 2553]  # ditto
 
-    def __init__(self):
-        super().__init__("VESTEL_AC")
-        self.capabilities = {
-            "mode": ["auto", "cool", "dry", "fan", "heat"],
-            "temperature": [16, 30],
-            "fan": ["high", "medium", "low"],
-            "swing": ["off", "on"],
-            "sleep": ["off", "on"],
-            "powerful": ["off", "on"],
-            "purifier": ["off", "on"],
-        }
+    protocol = "VESTEL_AC"
+    capabilities = {
+        "mode": ["auto", "cool", "dry", "fan", "heat"],
+        "temperature": [16, 30],
+        "fan": ["high", "medium", "low"],
+        "swing": ["off", "on"],
+        "sleep": ["off", "on"],
+        "powerful": ["off", "on"],
+        "purifier": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
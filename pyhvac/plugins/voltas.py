@@ -24,46 +24,49 @@
 #
 
 from .hvaclib import PulseBased, GenPluginObject
-from ..irhvac import kVoltasUnknown, kVoltas122LZF
 
 
 class Voltas(PulseBased):
+    __slots__ = ()
+
     STARTFRAME = [3110, 9066]
     MARK = [520]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [480, 1535]  # ditto
 
-    def __init__(self):
-        super().__init__("VOLTAS", variant=kVoltasUnknown)
-        self.capabilities = {
-            "mode": ["cool", "dry", "fan", "heat"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "hswing": ["off", "on"],
-            "economy": ["off", "on"],
-            "powerful": ["off", "on"],
-            "light": ["off", "on"],
-            "sleep": ["off", "on"],
-        }
+    protocol = "VOLTAS"
+    variant = "kVoltasUnknown"
+    capabilities = {
+        "mode": ["cool", "dry", "fan", "heat"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "hswing": ["off", "on"],
+        "economy": ["off", "on"],
+        "powerful": ["off", "on"],
+        "light": ["off", "on"],
+        "sleep": ["off", "on"],
+    }
 
 
 class Voltasv2(PulseBased):
+    __slots__ = ()
+
     STARTFRAME = [3110, 9066]
     MARK = [520]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [480, 1535]  # ditto
 
-    def __init__(self):
-        super().__init__("VOLTAS", variant=kVoltas122LZF)
-        self.capabilities = {
-            "mode": ["cool", "dry", "fan", "heat"],
-            "temperature": [16, 30],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "economy": ["off", "on"],
-            "powerful": ["off", "on"],
-            "light": ["off", "on"],
-            "sleep": ["off", "on"],
-        }
+    protocol = "VOLTAS"
+    variant = "kVoltas122LZF"
+    capabilities = {
+        "mode": ["cool", "dry", "fan", "heat"],
+        "temperature": [16, 30],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "economy": ["off", "on"],
+        "powerful": ["off", "on"],
+        "light": ["off", "on"],
+        "sleep": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
@@ -24,43 +24,46 @@
 #
 
 from .hvaclib import PulseBased, GenPluginObject
-from ..irhvac import DG11J13A, DG11J191
 
 
 class Whirlpool(PulseBased):
+    __slots__ = ()
+
     STARTFRAME = [3110, 9066]
     MARK = [520]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [480, 1535]  # ditto
 
-    def __init__(self):
-        super().__init__("VHIRLPOOL_AC", variant=DG11J13A)
-        self.capabilities = {
-            "mode": ["auto", "cool", "dry", "fan", "heat"],
-            "temperature": [18, 32],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "light": ["off", "on"],
-            "sleep": ["off", "on"],
-            "powerful": ["off", "on"],
-        }
+    protocol = "VHIRLPOOL_AC"
+    variant = "DG11J13A"
+    capabilities = {
+        "mode": ["auto", "cool", "dry", "fan", "heat"],
+        "temperature": [18, 32],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "light": ["off", "on"],
+        "sleep": ["off", "on"],
+        "powerful": ["off", "on"],
+    }
 
 
 class Whirlpoolv2(PulseBased):
+    __slots__ = ()
+
     STARTFRAME = [3110, 9066]
     MARK = [520]  # MARK0 is MARK[0], MARK1 is MARK[-1]
     SPACE = [480, 1535]  # ditto
 
-    def __init__(self):
-        super().__init__("VHIRLPOOL_AC", variant=DG11J191)
-        self.capabilities = {
-            "mode": ["auto", "cool", "dry", "fan", "heat"],
-            "temperature": [18, 32],
-            "fan": ["auto", "high", "medium", "low"],
-            "swing": ["off", "on"],
-            "light": ["off", "on"],
-            "sleep": ["off", "on"],
-            "powerful": ["off", "on"],
-        }
+    protocol = "VHIRLPOOL_AC"
+    variant = "DG11J191"
+    capabilities = {
+        "mode": ["auto", "cool", "dry", "fan", "heat"],
+        "temperature": [18, 32],
+        "fan": ["auto", "high", "medium", "low"],
+        "swing": ["off", "on"],
+        "light": ["off", "on"],
+        "sleep": ["off", "on"],
+        "powerful": ["off", "on"],
+    }
 
 
 # Now the match between models and objects
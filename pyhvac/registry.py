@@ -0,0 +1,291 @@
+#! /usr/bin/env python3
+# -*- coding:utf-8 -*-
+#
+# Registry of the available plugins
+#
+# Maps each brand to the plugin module handling it, and its models, without
+# importing the plugins. The map is read from a manifest generated at build
+# time, or from the plugin sources when the manifest is missing or stale.
+#
+# Copyright (c) 2023 François Wautier
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies
+# or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR
+# IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE
+##
+
+import importlib
+import json
+import os
+import re
+from bisect import bisect_left
+from pathlib import Path
+
+PLUGINDIR = Path(__file__).parent / "plugins"
+MANIFEST = Path(__file__).parent / "plugins.json"
+
+_registry = None
+_plugins = {}
+_model_index = None
+
+
+def plugin_files():
+    """Return the os.DirEntry of the source of each plugin module, by name."""
+    with os.scandir(PLUGINDIR) as entries:
+        return {
+            x.name[:-3]: x
+            for x in entries
+            if x.name.endswith(".py")
+            and not x.name.startswith("__")
+            and x.name != "hvaclib.py"
+        }
+
+
+def plugin_modules():
+    """Return the names of the plugin modules."""
+    return sorted(plugin_files())
+
+
+def plugin_digest(stem):
+    """Return the digest of the source of the plugin module stem."""
+    import hashlib
+
+    return hashlib.sha1((PLUGINDIR / (stem + ".py")).read_bytes()).hexdigest()
+
+
+def scan_plugin(path):
+    """Read a plugin source and return its brand and the list of its models."""
+    import ast
+
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    brand = None
+    models = []
+    for node in tree.body:
+        if not (isinstance(node, ast.ClassDef) and node.name == "PluginObject"):
+            continue
+        for item in node.body:
+            if isinstance(item, ast.Assign) and isinstance(item.value, ast.Dict):
+                if any(
+                    isinstance(t, ast.Name) and t.id == "MODELS" for t in item.targets
+                ):
+                    models = [
+                        k.value for k in item.value.keys if isinstance(k, ast.Constant)
+                    ]
+            elif isinstance(item, ast.FunctionDef) and item.name == "__init__":
+                for stmt in ast.walk(item):
+                    if (
+                        isinstance(stmt, ast.Assign)
+                        and isinstance(stmt.value, ast.Constant)
+                        and any(
+                            isinstance(t, ast.Attribute) and t.attr == "brand"
+                            for t in stmt.targets
+                        )
+                    ):
+                        brand = stmt.value.value
+    return brand, models
+
+
+def scan_plugins():
+    """Build the registry from the plugin sources."""
+    registry = {}
+    for stem in plugin_modules():
+        brand, models = scan_plugin(PLUGINDIR / (stem + ".py"))
+        if brand is None:
+            # Cannot tell without importing
+            mod = importlib.import_module(".plugins." + stem, package="pyhvac")
+            plug = mod.PluginObject()
+            brand, models = plug.brand, list(plug.MODELS.keys())
+        registry[brand] = {
+            "module": stem,
+            "models": models,
+            "digest": plugin_digest(stem),
+            "size": (PLUGINDIR / (stem + ".py")).stat().st_size,
+        }
+    return registry
+
+
+def write_manifest(path=MANIFEST):
+    registry = scan_plugins()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(registry, f, indent=1, sort_keys=True, ensure_ascii=False)
+        f.write("\n")
+    return registry
+
+
+def manifest_stale(registry, written):
+    """Whether a plugin was added, removed or edited since the registry was
+    written, at written (ns). Sizes are compared, the sources modified since
+    are hashed."""
+    files = plugin_files()
+    entries = {x["module"]: x for x in registry.values()}
+    if entries.keys() != files.keys():
+        return True
+    for stem, entry in entries.items():
+        stat = files[stem].stat()
+        if stat.st_size != entry.get("size"):
+            return True
+        if stat.st_mtime_ns > written and plugin_digest(stem) != entry.get("digest"):
+            return True
+    return False
+
+
+def load_registry():
+    """Return the registry, mapping brands to {"module": ..., "models": [...],
+    "digest": ..., "size": ...}, digest and size being those of the module
+    source."""
+    global _registry
+    if _registry is None:
+        registry = None
+        try:
+            with open(MANIFEST, encoding="utf-8") as f:
+                written = os.fstat(f.fileno()).st_mtime_ns
+                registry = json.load(f)
+        except (OSError, ValueError):
+            pass
+        if registry is None or manifest_stale(registry, written):
+            registry = scan_plugins()
+        _registry = registry
+    return _registry
+
+
+def brands():
+    return sorted(load_registry().keys())
+
+
+def models(brand):
+    return load_registry()[brand]["models"]
+
+
+def get_plugin(brand):
+    """Import the plugin handling brand and return its PluginObject.
+    Raise KeyError if brand is unknown."""
+    if brand not in _plugins:
+        module = load_registry()[brand]["module"]
+        mod = importlib.import_module(".plugins." + module, package="pyhvac")
+        _plugins[brand] = mod.PluginObject()
+    return _plugins[brand]
+
+
+def find_model(model, brand=None):
+    """Match model, case insensitively, amongst the models of brand, or of all
+    brands when brand is None. Return (brand, model) for the match, or as given
+    when there is no single brand matching."""
+    registry = load_registry()
+    if brand in registry and model in registry[brand]["models"]:
+        return brand, model
+    matches = [x for x in model_index().lookup(model) if brand is None or brand == x[0]]
+    if len({x[0] for x in matches}) == 1:
+        return matches[0]
+    return brand, model
+
+
+def normalize_model(name):
+    """Normalise a model name for lookup: case folded, only letters and digits."""
+    return re.sub(r"[\W_]+", "", name.casefold())
+
+
+class ModelIndex(object):
+    """Index over the models of all the plugins.
+
+    Models are looked up, in constant time, by their normalised name. Prefix
+    and fuzzy suggestions are served from a sorted key list and a trigram index."""
+
+    def __init__(self, registry=None):
+        if registry is None:
+            registry = load_registry()
+        self._index = {}
+        self._grams = {}
+        for brand, entry in registry.items():
+            for model in entry["models"]:
+                key = normalize_model(model)
+                if key not in self._index:
+                    self._index[key] = []
+                    for gram in self.trigrams(key):
+                        self._grams.setdefault(gram, set()).add(key)
+                self._index[key].append((brand, model))
+        self._keys = sorted(self._index)
+
+    @staticmethod
+    def trigrams(key):
+        key = f"  {key} "
+        return {key[i : i + 3] for i in range(len(key) - 2)}
+
+    def lookup(self, model):
+        """Return the list of (brand, model) matching model."""
+        return list(self._index.get(normalize_model(model), []))
+
+    def resolve(self, model, brand=None):
+        """Return (brand, class) for model. Raise KeyError if it is unknown and
+        ValueError if it matches models from more than one brand."""
+        matches = self.lookup(model)
+        if brand is not None:
+            matches = [x for x in matches if x[0] == brand]
+        if not matches:
+            raise KeyError(model)
+        brands = {x[0] for x in matches}
+        if len(brands) > 1:
+            raise ValueError(f"Model {model} exists for {', '.join(sorted(brands))}")
+        brand, name = matches[0]
+        return brand, get_plugin(brand).MODELS[name]
+
+    def suggest(self, model, limit=5):
+        """Return up to limit (brand, model) close to model. Models starting with
+        model come first, then the most similar ones."""
+        key = normalize_model(model)
+        result = []
+        idx = bisect_left(self._keys, key)
+        while (
+            idx < len(self._keys)
+            and len(result) < limit
+            and self._keys[idx].startswith(key)
+        ):
+            result.append(self._keys[idx])
+            idx += 1
+        if len(result) < limit:
+            grams = self.trigrams(key)
+            scores = {}
+            for gram in grams:
+                for candidate in self._grams.get(gram, ()):
+                    scores[candidate] = scores.get(candidate, 0) + 1
+            ranked = sorted(
+                scores.items(),
+                key=lambda x: (
+                    -x[1] / (len(grams) + len(self.trigrams(x[0])) - x[1]),
+                    x[0],
+                ),
+            )
+            for candidate, _ in ranked:
+                if len(result) >= limit:
+                    break
+                if candidate not in result:
+                    result.append(candidate)
+        return [x for key in result for x in self._index[key]][:limit]
+
+
+def model_index():
+    """Return the index over all models. It is built on first use."""
+    global _model_index
+    if _model_index is None:
+        _model_index = ModelIndex()
+    return _model_index
+
+
+def main():
+    write_manifest()
+
+
+if __name__ == "__main__":
+    main()
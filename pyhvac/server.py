@@ -0,0 +1,273 @@
+#! /usr/bin/env python3
+# -*- coding:utf-8 -*-
+#
+# Code server
+#
+# Keeps the plugins, IRac engines and generated codes in memory and answers
+# requests on a Unix domain socket, or read from a file in batch mode.
+# Requests and replies are JSON objects, one per line.
+#
+# Copyright (c) 2023 François Wautier
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies
+# or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR
+# IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE
+##
+#
+# A request is
+#
+#     {"manufacturer": "daikin", "model": "...", "state": {"mode": "cool", ...},
+#      "output": "frames"}
+#
+# with output one of "frames", "lirc", "broadlink" or "base64". The reply is
+#
+#     {"result": ...}     frames as a list of hex strings, lirc as a list of
+#                         pulses, broadlink as an hex string and base64 as
+#                         the broadlink code base64 encoded
+#     {"error": "..."}
+#
+# with the "id" of the request, if it has one.
+#
+# Requests with a "command" of "ping", "stats", "list" or "profile" are also
+# answered. "profile" returns the stage timings when the server profiles.
+
+import base64
+import json
+import os
+import signal
+import socket
+import socketserver
+import tempfile
+import threading
+from functools import lru_cache
+
+from . import registry
+from .plugins.hvaclib import (
+    CodeCache,
+    StageProfiler,
+    add_profile_hook,
+    apply_state,
+    irhvac_module,
+    remove_profile_hook,
+)
+
+DEFAULT_SOCKET = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir(),
+    f"gaccode-{os.getuid()}.sock",
+)
+OUTPUTS = ("frames", "lirc", "broadlink", "base64")
+
+
+class ServerError(Exception):
+    """An error reported by the code server."""
+
+
+class CodeService(object):
+    """Answer code requests, serving codes from cache, a CodeCache.
+
+    Device classes are resolved once per (manufacturer, model), the last
+    maxclasses of them are kept."""
+
+    def __init__(self, cache=None, profiler=None, maxclasses=256):
+        self.cache = CodeCache() if cache is None else cache
+        self.profiler = profiler
+        self.device_class = lru_cache(maxsize=maxclasses)(self._device_class)
+
+    def warm_up(self):
+        """Import all the plugins, and the IRremoteESP8266 library if present."""
+        for brand in registry.brands():
+            registry.get_plugin(brand)
+        try:
+            irhvac_module()
+        except ImportError:
+            pass
+
+    def _device_class(self, manufacturer, model):
+        brand, model = registry.find_model(model, manufacturer)
+        if brand is None and not registry.model_index().lookup(model):
+            raise ValueError(f"Model {model} is not known.")
+        try:
+            plugin = registry.get_plugin(brand)
+        except KeyError:
+            raise ValueError(f"Manufacturer {brand} is not supported.")
+        return type(plugin.get_device(model))
+
+    def answer(self, request):
+        """Return the result for request. Raise an exception on error."""
+        command = request.get("command", "code")
+        if command == "ping":
+            return "pong"
+        if command == "stats":
+            return self.cache.stats()
+        if command == "profile":
+            if self.profiler is None:
+                raise ValueError("The server is not profiling.")
+            return self.profiler.stats()
+        if command == "list":
+            return {b: registry.models(b) for b in registry.brands()}
+        if command != "code":
+            raise ValueError(f"Unknown command {command}.")
+        output = request.get("output", "frames")
+        if output not in OUTPUTS:
+            raise ValueError(f"Unknown output {output}.")
+        device = self.device_class(
+            request.get("manufacturer"), request.get("model", "generic")
+        )()
+        apply_state(device, request.get("state", {}))
+        if output == "frames":
+            return [bytes(f).hex() for f in self.cache.get(device, "frames")]
+        if output == "lirc":
+            return list(self.cache.get(device, "lirc"))
+        if output == "base64":
+            return str(base64.b64encode(self.cache.get(device, "broadlink")), "ascii")
+        return self.cache.get(device, "broadlink").hex()
+
+    def reply(self, line):
+        """Return the JSON reply, as a line, to the JSON request line. The "id"
+        of the request, if any, is copied to the reply."""
+        reply = {}
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("A request must be a JSON object.")
+            if "id" in request:
+                reply["id"] = request["id"]
+            reply["result"] = self.answer(request)
+        except Exception as e:
+            reply["error"] = str(e)
+        return json.dumps(reply) + "\n"
+
+
+class CodeRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if line.strip():
+                self.wfile.write(self.server.service.reply(line).encode())
+
+
+class CodeServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Answer code requests, with a CodeService, on the Unix socket path."""
+
+    daemon_threads = True
+
+    def __init__(self, path=DEFAULT_SOCKET, service=None):
+        self.path = path
+        self.service = CodeService() if service is None else service
+        if os.path.exists(path):
+            # Only replace a socket left over by a dead server
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+                    s.connect(path)
+            except OSError:
+                os.unlink(path)
+            else:
+                raise ServerError(f"A server is already listening on {path}")
+        super().__init__(path, CodeRequestHandler)
+
+    def server_bind(self):
+        # Only the owner may connect, from the creation of the socket
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+def batch(infile, outfile):
+    """Answer the requests read from infile, one JSON object per line, writing
+    the replies to outfile, in the same order, as they are produced."""
+    service = CodeService()
+    for line in infile:
+        if line.strip():
+            outfile.write(service.reply(line))
+            outfile.flush()
+
+
+def serve(path=DEFAULT_SOCKET, warm=True, profile=False):
+    """Run a code server on path until interrupted, or terminated, when run in
+    the main thread. With profile, the stage timings are recorded. Raise
+    ServerError if a server is already listening on path."""
+    service = CodeService()
+    if profile:
+        service.profiler = StageProfiler()
+        add_profile_hook(service.profiler)
+    sigterm = None
+    try:
+        with CodeServer(path, service) as server:
+            if threading.current_thread() is threading.main_thread():
+                # Terminate as when interrupted, removing the socket
+                sigterm = signal.signal(signal.SIGTERM, signal.default_int_handler)
+            if warm:
+                service.warm_up()
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+    finally:
+        if sigterm is not None:
+            signal.signal(signal.SIGTERM, sigterm)
+        if profile:
+            remove_profile_hook(service.profiler)
+
+
+class CodeClient(object):
+    """Send requests to a code server. The connection is kept open."""
+
+    def __init__(self, path=DEFAULT_SOCKET, timeout=None):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        try:
+            self.sock.connect(path)
+        except OSError:
+            self.sock.close()
+            raise
+        self.file = self.sock.makefile("rwb")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+    def request(self, **request):
+        """Send the request and return its result. Raise ServerError when the
+        server reports an error."""
+        self.file.write(json.dumps(request).encode() + b"\n")
+        self.file.flush()
+        line = self.file.readline()
+        if not line:
+            raise ServerError("Connection closed by the server.")
+        reply = json.loads(line)
+        if "error" in reply:
+            raise ServerError(reply["error"])
+        return reply["result"]
+
+    def code(self, manufacturer, model, state, output="frames"):
+        """Return the code for model in state. See the module header for the format."""
+        return self.request(
+            manufacturer=manufacturer, model=model, state=state, output=output
+        )
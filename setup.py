@@ -1,7 +1,10 @@
 #!/usr/bin/python3
 import os
+import runpy
+import shutil
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 from setuptools import setup, find_packages, Command
 from setuptools.dist import Distribution
@@ -13,6 +16,7 @@ LIBDIR = BUILDIR / "IRremoteESP8266"
 PYTHONDIR = LIBDIR / "python"
 CPFILES = ["irhvac.py", "_irhvac.so"]
 CPTOLOCATION = BUILDIR / "pyhvac"
+CODEBOOKDIR = CPTOLOCATION / "codebooks"
 
 pure = None
 if "--pure" in sys.argv:
@@ -44,9 +48,20 @@ class BuildPyCommand(build_py):
     """Custom build command."""
 
     def run(self):
-        self.run_command("clone_build")
+        if pure:
+            self.run_command("codebooks")
+        else:
+            self.run_command("clone_build")
+        self.run_command("plugin_manifest")
         build_py.run(self)
 
+    def find_package_modules(self, package, package_dir):
+        modules = build_py.find_package_modules(self, package, package_dir)
+        if pure:
+            # Left over by a previous build, the extension is not shipped
+            modules = [x for x in modules if x[:2] != ("pyhvac", "irhvac")]
+        return modules
+
 
 def PrepareSwig():
     haspkgmgr = False
@@ -102,26 +117,81 @@ class GitCloneAndBuild(Command):
         pass
 
     def run(self):
-        global LIBDIR
-        global CPFILES
-        global PYTHONDIR
-        repo_url = "https://github.com/frawau/IRremoteESP8266"
-
-        # TODO check if we nedd to do this
-        if not LIBDIR.exists():
-            subprocess.run(["git", "clone", repo_url, LIBDIR])
-        if Path("/.dockerenv").exists() and not os.environ.get("CIBUILDWHEEL"):
-            PrepareSwig()
-            subprocess.run(["make", "docker"], cwd=PYTHONDIR)
-        else:
-            subprocess.run(["make"], cwd=PYTHONDIR)
+        build_irhvac(CPTOLOCATION)
+
+
+def build_irhvac(location):
+    """Clone IRremoteESP8266 and build the irhvac extension into location."""
+    repo_url = "https://github.com/frawau/IRremoteESP8266"
+
+    # TODO check if we nedd to do this
+    if not LIBDIR.exists():
+        subprocess.run(["git", "clone", repo_url, LIBDIR])
+    if Path("/.dockerenv").exists() and not os.environ.get("CIBUILDWHEEL"):
+        PrepareSwig()
+        subprocess.run(["make", "docker"], cwd=PYTHONDIR)
+    else:
+        subprocess.run(["make"], cwd=PYTHONDIR)
+
+    for f in CPFILES:
+        rf = PYTHONDIR / f
+        if not rf.exists():
+            raise Exception("Could not build library.")
+        shutil.move(str(rf), str(location / f))
+    subprocess.run(["make", "distclean"], cwd=PYTHONDIR)
+
+
+class PluginManifest(Command):
+    """Custom command to generate the brand/model to plugin manifest."""
+
+    user_options = []
+
+    def initialize_options(self):
+        pass
+
+    def finalize_options(self):
+        pass
+
+    def run(self):
+        registry = runpy.run_path(str(CPTOLOCATION / "registry.py"))
+        registry["write_manifest"]()
 
-        for f in CPFILES:
-            rf = PYTHONDIR / f
-            if not rf.exists():
-                raise Exception("Could not build library.")
-            rf.rename(CPTOLOCATION / f)
-        subprocess.run(["make", "distclean"], cwd=PYTHONDIR)
+
+class CodeBooks(Command):
+    """Custom command to generate the code books of the IRremoteESP8266 models,
+    shipped by --pure builds, which do not have the irhvac extension. They are
+    always generated afresh, the build fails if one cannot be."""
+
+    user_options = []
+
+    def initialize_options(self):
+        pass
+
+    def finalize_options(self):
+        pass
+
+    def run(self):
+        shutil.rmtree(CODEBOOKDIR, ignore_errors=True)
+        # The extension is built in a copy of the package, not to be shipped
+        with tempfile.TemporaryDirectory() as tmp:
+            package = Path(tmp) / "pyhvac"
+            shutil.copytree(
+                CPTOLOCATION,
+                package,
+                ignore=shutil.ignore_patterns("codebooks", "__pycache__", *CPFILES),
+            )
+            build_irhvac(package)
+            subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "pyhvac.codebook",
+                    "--all",
+                    str(CODEBOOKDIR.resolve()),
+                ],
+                cwd=tmp,
+                check=True,
+            )
 
 
 setup(
@@ -134,6 +204,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     install_requires=[],
+    extras_require={"numpy": ["numpy"]},
     # See https://pypi.python.org/pypi?%3Aaction=list_classifiers
     classifiers=[
         # Pick your license as you wish (should match "license" above)
@@ -157,12 +228,16 @@ setup(
         ],
     },
     packages=["pyhvac", "pyhvac.plugins"],
-    package_data={"pyhvac": ["_irhvac.so"]},
+    package_data={
+        "pyhvac": ["plugins.json"] + (["codebooks/*.pcb"] if pure else ["_irhvac.so"])
+    },
     distclass=BinaryDistribution,
     ext_modules=ExtModules(),
     has_ext_modules=lambda: not pure,
     cmdclass={
         "clone_build": GitCloneAndBuild,
+        "plugin_manifest": PluginManifest,
+        "codebooks": CodeBooks,
         "build_py": BuildPyCommand,
     },
 )
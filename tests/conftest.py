@@ -0,0 +1,16 @@
+import pytest
+
+from pyhvac.plugins import hvaclib
+
+
+@pytest.fixture(params=["python", "numpy"])
+def numpy_mode(request, monkeypatch):
+    """Run the test without NumPy, then with NumPy from the smallest inputs."""
+    if request.param == "python":
+        monkeypatch.setattr(hvaclib, "numpy_module", lambda: None)
+    else:
+        if hvaclib.numpy_module() is None:
+            pytest.skip("NumPy is not installed")
+        monkeypatch.setattr(hvaclib, "NUMPY_MIN_PULSES", 1)
+        monkeypatch.setattr(hvaclib, "NUMPY_MIN_FRAMES", 1)
+    return request.param
@@ -0,0 +1,90 @@
+import pytest
+
+from pyhvac.plugins import daikin, lg
+from pyhvac.plugins.hvaclib import CodeCache
+
+
+def device(temperature, cls=daikin.Smash2, mode="cool"):
+    device = cls()
+    device.set_value("temperature", temperature)
+    device.set_mode(mode)
+    return device
+
+
+def test_hit():
+    cache = CodeCache()
+    reference = device(20)
+    frames = reference.build_ircode()
+    first = device(20)
+    assert cache.get(first) == frames
+    second = device(20)
+    assert cache.get(second) == frames
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "size": 1,
+        "maxsize": 1024,
+    }
+    # The state is moved along as by build_ircode
+    assert second.status == reference.status
+    assert second.to_set == reference.to_set
+    # A copy is returned
+    cache.get(device(20))[0][0] ^= 0xFF
+    assert cache.get(device(20)) == frames
+
+
+def test_outputs():
+    cache = CodeCache()
+    reference = device(22, lg.LG)
+    frames = reference.build_ircode()
+    assert cache.to_lirc(device(22, lg.LG)) == reference.to_lirc(frames)
+    assert cache.to_broadlink(device(22, lg.LG)) == reference.to_broadlink(frames)
+    assert cache.build_ircode(device(22, lg.LG)) == frames
+    assert (cache.hits, cache.misses) == (2, 1)
+    with pytest.raises(ValueError):
+        cache.get(device(22, lg.LG), "pronto")
+
+
+def test_keys():
+    cache = CodeCache()
+    cache.get(device(20))
+    cache.get(device(21))
+    cache.get(device(20, daikin.Daikinth))
+    cache.get(device(20, mode="dry"))
+    assert (len(cache), cache.misses, cache.hits) == (4, 4, 0)
+    # Same values, other types
+    assert cache.key(device(20.0)) != cache.key(device(20))
+
+
+def test_lru():
+    cache = CodeCache(maxsize=2)
+    cache.get(device(20))
+    cache.get(device(21))
+    cache.get(device(20))
+    cache.get(device(22))
+    # 21 was the least recently used
+    assert cache.evictions == 1
+    cache.get(device(20))
+    cache.get(device(22))
+    assert (cache.hits, cache.misses) == (3, 3)
+    cache.get(device(21))
+    assert (cache.misses, cache.evictions, len(cache)) == (4, 2, 2)
+
+
+def test_maxsize():
+    cache = CodeCache(maxsize=4)
+    for temperature in range(20, 24):
+        cache.get(device(temperature))
+    cache.maxsize = 1
+    assert (len(cache), cache.evictions, cache.maxsize) == (1, 3, 1)
+    cache.get(device(23))
+    assert cache.hits == 1
+    cache.clear()
+    assert cache.stats() == {
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+        "size": 0,
+        "maxsize": 1,
+    }
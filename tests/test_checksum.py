@@ -0,0 +1,119 @@
+import random
+
+import pytest
+
+from pyhvac.codebook import state_space
+from pyhvac.plugins import carrier, daikin, lg, panasonic, sharp
+from pyhvac.plugins.hvaclib import Checksum, apply_state, bit_reverse
+
+
+# The checksums of the plugins, as they were computed byte by byte
+def crc_reversed_sum(frame):
+    crc = 0
+    for x in frame:
+        crc += bit_reverse(x)
+    return bit_reverse(crc & 0xFF)
+
+
+def crc_lg(frame):
+    crc = 0
+    for x in frame:
+        crc += (x & 0xF0) >> 4
+        crc += x & 0x0F
+    return (crc & 0x0F) << 4
+
+
+def crc_sharp(frame, special=0x01):
+    crc = 0
+    for x in frame:
+        crc ^= x
+    crc ^= special
+    crc ^= crc >> 4
+    crc = (crc & 0x0F) << 4
+    crc += special
+    return crc
+
+
+CHECKSUMS = [
+    (daikin.Daikinth, crc_reversed_sum),
+    (panasonic.Panasonic, crc_reversed_sum),
+    (lg.LG, crc_lg),
+    (sharp.Sharp, crc_sharp),
+    (sharp.JTech, crc_sharp),
+]
+IDS = [cls.__name__ for cls, _ in CHECKSUMS]
+
+
+def random_frames(rnd, count=200):
+    return [
+        bytes(rnd.randrange(256) for _ in range(rnd.choice([3, 13, 18])))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("cls, crc", CHECKSUMS, ids=IDS)
+def test_value(cls, crc):
+    rnd = random.Random(cls.__name__)
+    for frame in random_frames(rnd) + [b""]:
+        assert cls.CHECKSUM.value(frame) == crc(frame)
+
+
+@pytest.mark.parametrize("cls, crc", CHECKSUMS, ids=IDS)
+def test_values(cls, crc, numpy_mode):
+    frames = random_frames(random.Random(cls.__name__))
+    assert cls.CHECKSUM.values(frames) == [crc(f) for f in frames]
+
+
+@pytest.mark.parametrize("cls, crc", CHECKSUMS, ids=IDS)
+def test_verify(cls, crc, numpy_mode):
+    rnd = random.Random(cls.__name__)
+    frames = [f + bytes([crc(f)]) for f in random_frames(rnd)]
+    bad = [f[:-1] + bytes([f[-1] ^ 0x10]) for f in frames]
+    assert all(cls.CHECKSUM.verify(f) for f in frames)
+    assert cls.CHECKSUM.verify_all(frames) == [True] * len(frames)
+    assert cls.CHECKSUM.verify_all(bad) == [False] * len(bad)
+    assert not cls.CHECKSUM.verify(b"\x00")
+
+
+def test_checksum_tables():
+    with pytest.raises(ValueError):
+        Checksum(range(255), range(256))
+    with pytest.raises(ValueError):
+        Checksum(range(256), range(256), "product")
+    xor = Checksum(range(256), range(256), "xor")
+    assert xor.value(b"\x0f\xf0\x01") == 0xFE
+
+
+# Sharp itself has no economy status to build its frames with
+@pytest.mark.parametrize(
+    "cls",
+    [daikin.Daikinth, panasonic.Panasonic, lg.LG, sharp.JTech],
+    ids=lambda c: c.__name__,
+)
+def test_verify_frames(cls):
+    device = cls()
+    apply_state(device, {k: v[0] for k, v in state_space(cls)})
+    frames = [bytearray(f) for f in device.build_ircode()]
+    assert frames
+    assert device.verify_frames(frames) == [True] * len(frames)
+    frames[-1][-1] ^= 0x10
+    assert device.verify_frames(frames)[-1] is False
+
+
+def test_verify_frames_without_checksum():
+    with pytest.raises(TypeError):
+        carrier.Carrier().verify_frames([b"\x00\x00"])
+
+
+def test_build_frame():
+    device = daikin.Smash2()
+    values = device.frame_values()
+    frame = device.build_frame(values)
+    assert frame == device.LAYOUT.build(values) + bytes([crc_reversed_sum(frame[:-1])])
+    # A new frame is returned
+    frame[0] ^= 0xFF
+    assert device.build_frame(values)[0] == frame[0] ^ 0xFF
+    values = dict(values, temperature=values["temperature"] + 1)
+    other = device.build_frame(values)
+    assert other[-1] == crc_reversed_sum(other[:-1])
+    assert other != device.build_frame(device.frame_values())
@@ -0,0 +1,94 @@
+import itertools
+
+import pytest
+
+from pyhvac import codebook
+from pyhvac.codebook import CodeBook, build_codebook, state_space
+from pyhvac.plugins import carrier, daikin
+from pyhvac.plugins.hvaclib import apply_state
+
+
+@pytest.fixture(scope="module")
+def book_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("codebooks") / "daikin.Smash2.pcb"
+    build_codebook(daikin.Smash2, path, jobs=1)
+    return path
+
+
+@pytest.fixture
+def book(book_path):
+    with CodeBook(book_path) as book:
+        yield book
+
+
+def all_states(cls):
+    space = state_space(cls)
+    names = [name for name, _ in space]
+    for combo in itertools.product(*(values for _, values in space)):
+        yield dict(zip(names, combo))
+
+
+def test_lookup(book):
+    states = list(all_states(daikin.Smash2))
+    assert len(book) == len(states)
+    for state in states:
+        device = daikin.Smash2()
+        apply_state(device, state)
+        frames = device.build_ircode()
+        assert book.frames(state) == [bytes(x) for x in frames]
+        assert book.broadlink(state) == device.to_broadlink(frames)
+    assert len(book._blocks) <= codebook.CACHED_BLOCKS
+
+
+def test_defaults(book):
+    # Missing values are those of a new device
+    device = daikin.Smash2()
+    apply_state(device, {"mode": "cool", "temperature": 21})
+    assert book.frames({"mode": "cool", "temperature": 21}) == [
+        bytes(x) for x in device.build_ircode()
+    ]
+
+
+@pytest.mark.parametrize(
+    "state",
+    [
+        {"mode": "heat", "temperature": 21},
+        {"mode": "cool", "temperature": 21.5},
+        {"mode": "cool", "fan": ["auto"]},
+        {"mode": "cool", "purifier": "on"},
+    ],
+)
+def test_miss(book, state):
+    with pytest.raises(KeyError, match="Smash2 code book has no"):
+        book.frames(state)
+
+
+def test_deterministic(book_path, tmp_path, numpy_mode, monkeypatch):
+    # With or without a StateGrid
+    if numpy_mode == "python":
+        monkeypatch.setattr(codebook, "numpy_module", lambda: None)
+    path = tmp_path / "x.pcb"
+    build_codebook(daikin.Smash2, path, jobs=1)
+    assert path.read_bytes() == book_path.read_bytes()
+
+
+def test_not_a_codebook(tmp_path):
+    path = tmp_path / "x.pcb"
+    path.write_bytes(b"\x00" * 16)
+    with pytest.raises(ValueError, match="not a code book"):
+        CodeBook(path)
+
+
+def test_too_many_states(tmp_path, monkeypatch):
+    monkeypatch.setattr(codebook, "MAX_STATES", 100)
+    with pytest.raises(ValueError, match="select fewer keys"):
+        build_codebook(daikin.Smash2, tmp_path / "x.pcb", jobs=1)
+
+
+def test_irghvac_state_space():
+    # The statuses the setters produce, the fallback mode and half degrees
+    space = dict(state_space(carrier.Carrier))
+    assert "auto" in space["mode"]
+    assert 23.5 in space["temperature"]
+    with pytest.raises(KeyError, match="Carrier has no swing state"):
+        state_space(carrier.Carrier, ["mode", "swing"])
@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from pyhvac import registry
+from pyhvac.plugins.airwell import Airwell
+from pyhvac.plugins.hvaclib import PulseBased
+
+
+def pulse_classes():
+    classes = []
+    for brand in registry.brands():
+        for cls in registry.get_plugin(brand).MODELS.values():
+            if issubclass(cls, PulseBased) and cls not in classes:
+                classes.append(cls)
+    return classes
+
+
+def random_frames(rnd, count=3):
+    return [
+        bytearray(rnd.randrange(256) for _ in range(rnd.randint(1, 12)))
+        for _ in range(count)
+    ]
+
+
+def jitter(rnd, pulse, ratio=0.1):
+    return [round(x * (1 + rnd.uniform(-ratio, ratio))) for x in pulse]
+
+
+def manchester_pulse(device, frames, gap=20000):
+    """Encode frames as device sends them, merging consecutive halves at the
+    same level."""
+    durations = []
+
+    def add(mark, duration):
+        # Marks are at even indices
+        if durations and (len(durations) % 2 == 0) != mark:
+            durations[-1] += duration
+        else:
+            durations.append(duration)
+
+    half = device.HALFPULSE
+    for frame in frames:
+        if durations:
+            add(False, gap)
+        add(True, device.STARTFRAME[0])
+        add(False, device.STARTFRAME[1])
+        for byte in frame:
+            for idx in range(7, -1, -1):
+                first = bool(byte >> idx & 1) == device.GETHOMAS
+                add(first, half)
+                add(not first, half)
+        add(True, device.ENDFRAME[0])
+    return durations
+
+
+@pytest.mark.parametrize("cls", pulse_classes(), ids=lambda x: x.__name__)
+def test_pulse_based_round_trip(cls, numpy_mode):
+    rnd = random.Random(cls.__name__)
+    device = cls()
+    frames = random_frames(rnd)
+    assert device.decode_pulse(device.generate_to_lirc(frames)) == frames
+    pulse = jitter(rnd, device.generate_to_lirc(frames))
+    assert device.decode_pulse(pulse) == frames
+
+
+def test_pulse_based_lsb(numpy_mode):
+    device = pulse_classes()[0]()
+    frames = [bytearray(b"\x01\x80\x0f")]
+    reversed_frames = [bytearray(b"\x80\x01\xf0")]
+    assert device.decode_pulse(device.generate_to_lirc(frames), "lsb") == (
+        reversed_frames
+    )
+
+
+def test_pulse_based_noise(numpy_mode):
+    device = pulse_classes()[0]()
+    assert device.decode_pulse([]) == []
+    assert device.decode_pulse([100000, 100000, 5, 5]) == []
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_manchester_round_trip(seed, numpy_mode):
+    rnd = random.Random(seed)
+    device = Airwell()
+    frames = random_frames(rnd)
+    assert device.decode_pulse(manchester_pulse(device, frames)) == frames
+    # Merged halves are matched within a half period tolerance only
+    pulse = jitter(rnd, manchester_pulse(device, frames), 0.05)
+    assert device.decode_pulse(pulse) == frames
@@ -0,0 +1,119 @@
+import itertools
+import random
+
+import pytest
+
+from pyhvac.codebook import state_space
+from pyhvac.plugins import daikin, lg, panasonic, sharp
+from pyhvac.plugins.hvaclib import FrameLayout, apply_state
+
+NATIVE = [
+    daikin.Daikinth,
+    daikin.Smash2,
+    sharp.JTech,
+    lg.LG,
+    lg.InverterV,
+    lg.DualInverter,
+    panasonic.Panasonic,
+    panasonic.PanaCassette,
+]
+LAYOUTS = [daikin.Daikinth, lg.LG, panasonic.Panasonic, sharp.Sharp, sharp.JTech]
+
+
+def masked_build(layout, values):
+    """The frame, written byte by byte as the plugins did before layouts."""
+    frame = bytearray(layout.template)
+    for field, offset, bits, mapping, merge in layout.fields:
+        value = values.get(field)
+        if value is None:
+            continue
+        byte = mapping(value) if callable(mapping) else mapping.get(value, 0)
+        if merge == "or":
+            frame[offset] |= byte
+        elif byte:
+            frame[offset] = byte
+    return frame
+
+
+def frame_values(cls, count=300):
+    """The field values of the frames of the first states of cls."""
+    space = state_space(cls)
+    names = [name for name, _ in space]
+    for combo in itertools.islice(itertools.product(*(v for _, v in space)), count):
+        device = cls()
+        apply_state(device, dict(zip(names, combo)))
+        yield device.frame_values()
+
+
+def fits(layout, field, value):
+    """Whether the callable entries of field accept value."""
+    for name, offset, bits, mapping, merge in layout.fields:
+        if name == field and callable(mapping):
+            try:
+                if mapping(value) & ~bits:
+                    return False
+            except (TypeError, ValueError):
+                return False
+    return True
+
+
+@pytest.mark.parametrize("cls", NATIVE, ids=lambda c: c.__name__)
+def test_frame_values(cls):
+    for values in frame_values(cls):
+        assert cls.LAYOUT.build(values) == masked_build(cls.LAYOUT, values)
+
+
+@pytest.mark.parametrize("cls", LAYOUTS, ids=lambda c: c.__name__)
+def test_random_values(cls):
+    layout = cls.LAYOUT
+    seen = {}
+    for other in NATIVE:
+        for values in frame_values(other, 50):
+            for field, value in values.items():
+                seen.setdefault(field, set()).add(value)
+    choices = {}
+    for field, offset, bits, mapping, merge in layout.fields:
+        found = choices.setdefault(field, {None, "unknown"})
+        if callable(mapping):
+            found.update(seen.get(field, ()))
+        else:
+            found.update(mapping)
+    choices = {
+        k: sorted((x for x in v if fits(layout, k, x)), key=repr)
+        for k, v in choices.items()
+    }
+    rnd = random.Random(cls.__name__)
+    for _ in range(500):
+        values = {k: rnd.choice(v) for k, v in choices.items() if rnd.random() < 0.9}
+        assert layout.build(values) == masked_build(layout, values)
+
+
+def test_replace_order():
+    layout = FrameLayout(
+        b"\x10\x00",
+        [
+            ("a", 0, 0x0F, {1: 0x01, 2: 0x02}, "or"),
+            ("b", 0, 0xFF, {"x": 0x80, "y": 0x00}, "replace"),
+            ("a", 1, 0xFF, lambda v: v * 2, "or"),
+        ],
+    )
+    for values in [{}, {"a": 1}, {"a": 2, "b": "x"}, {"a": 1, "b": "y"}, {"b": "z"}]:
+        assert layout.build(values) == masked_build(layout, values)
+    assert layout.build({"a": 1, "b": "x"}) == b"\x80\x02"
+
+
+@pytest.mark.parametrize("value", [0x80, -1])
+def test_callable_overflow(value):
+    layout = FrameLayout(b"\x00", [("a", 0, 0x7F, lambda v: v, "or")])
+    assert layout.build({"a": 0x7F}) == b"\x7f"
+    with pytest.raises(ValueError, match="field a overflows"):
+        layout.build({"a": value})
+
+
+def test_layout_errors():
+    with pytest.raises(ValueError, match="out of frame"):
+        FrameLayout(b"\x00", [("a", 1, 0xFF, {1: 1}, "or")])
+    with pytest.raises(ValueError, match="Unknown merge"):
+        FrameLayout(b"\x00", [("a", 0, 0xFF, {1: 1}, "and")])
+    with pytest.raises(ValueError, match="overflows"):
+        FrameLayout(b"\x00", [("a", 0, 0x0F, {1: 0x10}, "or")])
@@ -0,0 +1,132 @@
+import threading
+import time
+
+import pytest
+
+from pyhvac.plugins import carrier, electra, hvaclib
+from pyhvac.plugins.hvaclib import IRacPool
+
+
+class Engine(object):
+    def __init__(self):
+        self.next = type("State", (), {})()
+        for field in IRacPool.FIELDS:
+            setattr(self.next, field, f"default {field}")
+        self.resets = 0
+
+    def resetTiming(self):
+        self.resets += 1
+
+
+class Pool(IRacPool):
+    """A pool of Engine, which fails to create one when fail is set."""
+
+    def __init__(self, size=4):
+        super().__init__(size)
+        self.created = []
+        self.fail = False
+
+    def _new_engine(self):
+        if self.fail:
+            raise RuntimeError("no engine")
+        engine = Engine()
+        self.created.append(engine)
+        return engine, {x: getattr(engine.next, x) for x in self.FIELDS}
+
+
+def test_reset():
+    pool = Pool()
+    with pool.engine() as engine:
+        engine.next.mode = "cool"
+        engine.next.degrees = 21
+    with pool.engine() as again:
+        assert again is engine
+        assert engine.resets == 1
+        for field in IRacPool.FIELDS:
+            assert getattr(again.next, field) == f"default {field}"
+    assert len(pool.created) == 1
+
+
+def test_reset_on_error():
+    pool = Pool()
+    with pytest.raises(KeyError):
+        with pool.engine() as engine:
+            engine.next.power = True
+            raise KeyError("power")
+    assert engine.next.power == "default power"
+    with pool.engine() as again:
+        assert again is engine
+
+
+def test_nested():
+    pool = Pool()
+    with pool.engine() as first, pool.engine() as second:
+        assert first is not second
+    assert len(pool.created) == 2
+
+
+def test_failed_engine():
+    pool = Pool(size=1)
+    pool.fail = True
+    with pytest.raises(RuntimeError):
+        with pool.engine():
+            pass
+    # The failed engine does not count
+    pool.fail = False
+    with pool.engine():
+        pass
+    assert len(pool.created) == 1
+
+
+def test_size():
+    pool = Pool(size=2)
+    lock = threading.Lock()
+    busy = []
+    seen = []
+
+    def borrow():
+        for _ in range(20):
+            with pool.engine() as engine:
+                with lock:
+                    busy.append(engine)
+                    seen.append(len(busy))
+                time.sleep(0.0005)
+                with lock:
+                    busy.remove(engine)
+
+    threads = [threading.Thread(target=borrow) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(seen) == 160
+    assert max(seen) <= 2
+    assert len(pool.created) == 2
+
+
+def test_shrink():
+    pool = Pool(size=2)
+    with pool.engine() as first:
+        with pool.engine():
+            pool.size = 1
+    # The engine returned first is dropped, the other one is kept
+    with pool.engine() as engine:
+        assert engine is first
+    assert [engine for engine, _ in pool._idle] == [first]
+    assert pool._count == 1
+
+
+def test_devices(monkeypatch):
+    pytest.importorskip("pyhvac.irhvac")
+    # Codes do not depend on what the shared engine was used for before
+    monkeypatch.setattr(hvaclib, "irac_pool", IRacPool(size=1))
+    state = {"temperature": 20, "mode": "cool"}
+    # Carrier does not set the vertical swing
+    other = {"temperature": 28, "swing": "off", "mode": "heat"}
+    codes = []
+    for cls, values in [(carrier.Carrier, state), (electra.Electra, other)] * 2:
+        device = cls()
+        for name, value in values.items():
+            device.set_value(name, value)
+        codes.append(device.build_ircode())
+    assert codes[2:] == codes[:2]
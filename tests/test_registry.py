@@ -0,0 +1,108 @@
+import json
+import os
+
+import pytest
+
+from pyhvac import registry
+
+
+@pytest.fixture
+def manifest(tmp_path, monkeypatch):
+    """Load the registry from a copy of the manifest, which is returned."""
+    path = tmp_path / "plugins.json"
+    path.write_text(registry.MANIFEST.read_text(encoding="utf-8"), encoding="utf-8")
+    monkeypatch.setattr(registry, "MANIFEST", path)
+    monkeypatch.setattr(registry, "_registry", None)
+    return path
+
+
+def edit(path, change, written=None):
+    """Change the manifest at path, written at written (ns), now if None."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    change(data)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    if written is not None:
+        os.utime(path, ns=(written, written))
+
+
+def test_shipped_manifest():
+    # Regenerate it with python3 -m pyhvac.registry
+    shipped = json.loads(registry.MANIFEST.read_text(encoding="utf-8"))
+    assert shipped == registry.scan_plugins()
+
+
+@pytest.mark.parametrize("written", [None, 0], ids=["after", "before"])
+def test_up_to_date(manifest, written):
+    # The manifest is trusted while the sizes, and digests, match
+    edit(manifest, lambda data: data["daikin"]["models"].append("Made up"), written)
+    assert "Made up" in registry.models("daikin")
+
+
+def test_not_hashed(manifest, monkeypatch):
+    # Plugins modified before the manifest was written are not hashed
+    edit(manifest, change_digest)
+    monkeypatch.setattr(registry, "plugin_digest", None)
+    assert "Made up" in registry.models("daikin")
+
+
+def change_digest(data):
+    data["daikin"]["digest"] = "0" * 40
+    data["daikin"]["models"].append("Made up")
+
+
+def drop_digest(data):
+    del data["daikin"]["digest"]
+    data["daikin"]["models"].append("Made up")
+
+
+def change_size(data):
+    data["daikin"]["size"] += 1
+    data["daikin"]["models"].append("Made up")
+
+
+def drop_size(data):
+    del data["daikin"]["size"]
+    data["daikin"]["models"].append("Made up")
+
+
+def drop_module(data):
+    # As if the module was added since
+    del data["lg"]
+    data["daikin"]["models"].append("Made up")
+
+
+def add_module(data):
+    # As if the module was removed since
+    data["gone"] = {
+        "module": "gone",
+        "models": ["Made up"],
+        "digest": "0" * 40,
+        "size": 0,
+    }
+
+
+@pytest.mark.parametrize(
+    "change, written",
+    [
+        # The digests are checked for the plugins modified since
+        (change_digest, 0),
+        (drop_digest, 0),
+        (change_size, None),
+        (drop_size, None),
+        (drop_module, None),
+        (add_module, None),
+    ],
+    ids=lambda x: getattr(x, "__name__", str(x)),
+)
+def test_stale(manifest, change, written):
+    edit(manifest, change, written)
+    assert registry.load_registry() == registry.scan_plugins()
+    assert "Made up" not in registry.models("daikin")
+
+
+def test_unreadable(manifest):
+    manifest.write_text("{", encoding="utf-8")
+    assert registry.load_registry() == registry.scan_plugins()
+    manifest.unlink()
+    registry._registry = None
+    assert registry.load_registry() == registry.scan_plugins()
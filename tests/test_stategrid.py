@@ -0,0 +1,94 @@
+import pytest
+
+from pyhvac.codebook import state_space
+from pyhvac.plugins import carrier, daikin, hvaclib, lg, panasonic, sharp
+from pyhvac.plugins.hvaclib import StateGrid, apply_state, grid_states
+
+NATIVE = [
+    daikin.Daikinth,
+    daikin.Smash2,
+    sharp.Sharp,
+    sharp.JTech,
+    lg.LG,
+    lg.InverterV,
+    lg.DualInverter,
+    panasonic.Panasonic,
+    panasonic.PanaCassette,
+]
+KEYS = ["mode", "temperature", "fan", "swing"]
+
+
+@pytest.fixture
+def numpy():
+    np = hvaclib.numpy_module()
+    if np is None:
+        pytest.skip("NumPy is not installed")
+    return np
+
+
+def grid_space(cls):
+    """The state space of cls, for KEYS, each key but mode possibly not set."""
+    space = state_space(cls, [x for x in KEYS if x in cls.capabilities])
+    return [(k, v if k == "mode" else v + [None]) for k, v in space]
+
+
+def device_code(cls, state):
+    """The frames, LIRC and Broadlink codes of state built by a device."""
+    device = cls()
+    try:
+        apply_state(device, state)
+        frames = device.build_ircode()
+        return (
+            [bytes(x) for x in frames],
+            device.to_lirc(frames),
+            device.to_broadlink(frames),
+        )
+    except Exception:
+        return None
+
+
+@pytest.mark.parametrize("cls", NATIVE, ids=lambda c: c.__name__)
+def test_grid_codes(cls, numpy):
+    states = grid_states(grid_space(cls))
+    grid = StateGrid(cls, states)
+    frames = grid.frames()
+    lirc = grid.to_lirc()
+    broadlink = grid.to_broadlink()
+    names = list(states)
+    columns = [states[x].tolist() for x in names]
+    assert grid.count == len(columns[0])
+    for idx, row in enumerate(zip(*columns)):
+        state = {x: y for x, y in zip(names, row) if y is not None}
+        expected = device_code(cls, state)
+        assert bool(grid.valid[idx]) is (expected is not None)
+        if expected is None:
+            assert frames[idx] is None
+            continue
+        got = (
+            [bytes(x) for x in frames[idx]],
+            list(map(int, lirc[idx])),
+            broadlink[idx],
+        )
+        assert got == expected, state
+
+
+def test_grid_states(numpy):
+    states = grid_states([("mode", ["cool", "heat"]), ("temperature", range(18, 21))])
+    assert states["mode"].tolist() == ["cool"] * 3 + ["heat"] * 3
+    assert states["temperature"].tolist() == [18, 19, 20] * 2
+    assert grid_states([("mode", [])])["mode"].tolist() == []
+
+
+def test_grid_errors(numpy):
+    with pytest.raises(ValueError, match="no frame layout"):
+        StateGrid(carrier.Carrier, {"mode": ["cool"]})
+    with pytest.raises(ValueError, match="same length"):
+        StateGrid(daikin.Smash2, {"mode": ["cool"], "temperature": [20, 21]})
+
+
+def test_numpy_required(monkeypatch):
+    monkeypatch.setattr(hvaclib, "numpy_module", lambda: None)
+    with pytest.raises(ImportError):
+        grid_states([("mode", ["cool"])])
+    with pytest.raises(ImportError):
+        StateGrid(daikin.Smash2, {"mode": ["cool"]})